@@ -1,10 +1,13 @@
 import os
+import subprocess
 import sys
+from collections import defaultdict
 
 import click
-import uvicorn
 from dotenv import load_dotenv
 
+from app.tools.manifest import TOOL_MANIFEST
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -12,6 +15,8 @@ load_dotenv()
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 3000
 DEFAULT_MONGODB_URL = "mongodb://localhost:27017/admin"
+# --profile-imports 출력에 표시할 패키지 수
+PROFILE_TOP = 15
 
 
 # CLI 그룹 정의
@@ -27,10 +32,24 @@ DEFAULT_MONGODB_URL = "mongodb://localhost:27017/admin"
               help='MongoDB connection URL')
 @click.option('--mongodb-db', default=None,
               help='MongoDB database name')
+@click.option('--cluster', 'clusters', multiple=True, metavar='NAME=URL',
+              help='Additional named cluster that tools can select with the cluster argument (repeatable)')
+@click.option('--lazy-startup', is_flag=True, default=False,
+              help='Accept requests immediately and verify the MongoDB connection in the background')
+@click.option('--read-preference', default=None,
+              type=click.Choice(['primary', 'primaryPreferred', 'secondary', 'secondaryPreferred', 'nearest']),
+              help='Read preference for read-only tools (default: secondaryPreferred on replica sets)')
+@click.option('--profile-imports', is_flag=True, default=False,
+              help='Report where server import time is spent and exit without starting the server')
 @click.version_option(version='0.1.0')
-def cli(ctx, transport, host, port, mongodb_url, mongodb_db):
+def cli(ctx, transport, host, port, mongodb_url, mongodb_db, clusters, lazy_startup, read_preference,
+        profile_imports):
     """MongoDB MCP Server - A MongoDB interface for AI agents using MCP protocol."""
     if ctx.invoked_subcommand is None:
+        if profile_imports:
+            profile_server_imports()
+            return
+
         # 환경 변수 설정
         if mongodb_url:
             os.environ["MONGODB_URL"] = mongodb_url
@@ -41,6 +60,18 @@ def cli(ctx, transport, host, port, mongodb_url, mongodb_db):
         if mongodb_db:
             os.environ["MONGODB_DB"] = mongodb_db
 
+        for cluster in clusters:
+            name, _, url = cluster.partition("=")
+            if not name or not url:
+                raise click.BadParameter(f"Expected NAME=URL, got '{cluster}'", param_hint="--cluster")
+            os.environ[f"MONGODB_URL_{name.upper()}"] = url
+
+        if lazy_startup:
+            os.environ["MCP_LAZY_STARTUP"] = "true"
+
+        if read_preference:
+            os.environ["MONGODB_READ_PREFERENCE"] = read_preference
+
         # 로그 출력
         click.echo(f"Starting MongoDB MCP Server with {transport} transport")
         click.echo(f"Server running at: http://{host}:{port}")
@@ -54,7 +85,9 @@ def cli(ctx, transport, host, port, mongodb_url, mongodb_db):
         else:
             os.environ["MCP_TRANSPORT"] = "http"
 
-        # 서버 시작
+        # 서버 시작 (info, --help 등은 uvicorn과 서버 모듈을 임포트하지 않도록 여기서 임포트)
+        import uvicorn
+
         uvicorn.run("app.main:app", host=host, port=port, log_level="info")
 
 
@@ -67,19 +100,39 @@ def info():
     click.echo("  - HTTP (default)")
     click.echo("  - SSE (Server-Sent Events)")
     click.echo("\nAvailable tools:")
-    click.echo("  - listCollections: List all collections in a database")
-    click.echo("  - find: Query documents in a collection")
-    click.echo("  - insertOne: Insert a single document into a collection")
-    click.echo("  - updateOne: Update a single document in a collection")
-    click.echo("  - deleteOne: Delete a single document from a collection")
-    click.echo("  - indexes: List all indexes for a collection")
-    click.echo("  - createIndex: Create a new index on a collection")
-    click.echo("  - dropIndex: Drop an existing index from a collection")
+    for spec in TOOL_MANIFEST:
+        click.echo(f"  - {spec.name}: {spec.summary}")
     click.echo("\nUsage with UVX:")
     click.echo("  uvx mongo-mcp-server")
     click.echo("  uvx mongo-mcp-server --transport=sse")
 
 
+def profile_server_imports(top: int = PROFILE_TOP):
+    """새 프로세스에서 -X importtime으로 서버 모듈을 임포트하여 최상위 패키지별 임포트 시간 출력"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        capture_output=True, text=True, env=os.environ.copy()
+    )
+    if result.returncode != 0:
+        raise click.ClickException(f"Importing app.main failed:\n{result.stderr.strip().splitlines()[-1]}")
+
+    # 각 줄 형식: "import time: self [us] | cumulative | imported package"
+    packages = defaultdict(int)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        packages[fields[2].strip().split(".")[0]] += int(fields[0])
+
+    total = sum(packages.values())
+    click.echo(f"{'package':<24} {'self (ms)':>10} {'share':>7}")
+    for package, micros in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]:
+        click.echo(f"{package:<24} {micros / 1000:>10.1f} {micros / total:>7.1%}")
+    click.echo(f"{'total':<24} {total / 1000:>10.1f}   ({len(packages)} packages)")
+
+
 def main():
     """Entry point for the CLI."""
     try:
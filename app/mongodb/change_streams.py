@@ -0,0 +1,255 @@
+import asyncio
+import os
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from .client import database_key
+
+# 변경 스트림 파이프라인에 사용할 수 있는 스테이지
+ALLOWED_STAGES = ("$match", "$project", "$addFields", "$set", "$unset", "$replaceRoot", "$replaceWith", "$redact")
+FULL_DOCUMENT_MODES = ("default", "updateLookup", "whenAvailable", "required")
+
+# 서버가 새 이벤트를 기다리는 최대 시간 (getMore 한 번의 대기 시간)
+MAX_AWAIT_TIME_MS = 1000
+
+
+class Subscription:
+    """변경 스트림 구독"""
+
+    __slots__ = ("subscription_id", "database", "collection", "pipeline", "queue", "task", "resume_token",
+                 "stream_token", "created_at", "last_consumed", "delivered", "blocked", "error", "closed")
+
+    def __init__(self, database: str, collection: str, pipeline: List[Dict[str, Any]], queue_size: int):
+        self.subscription_id = uuid.uuid4().hex[:16]
+        self.database = database
+        self.collection = collection
+        self.pipeline = pipeline
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.task: Optional[asyncio.Task] = None
+        # 소비자에게 반환한 재개 토큰
+        self.resume_token: Optional[Dict[str, Any]] = None
+        # 빈 getMore 이후 서버가 알려준 배치 후 재개 토큰 (이후 읽은 이벤트가 없을 때만 유효)
+        self.stream_token: Optional[Dict[str, Any]] = None
+        self.created_at = time.time()
+        self.last_consumed = time.monotonic()
+        self.delivered = 0
+        # 대기열이 가득 차 스트림 읽기를 멈춘 횟수
+        self.blocked = 0
+        self.error: Optional[str] = None
+        self.closed = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """사전 형태로 변환"""
+        result = {
+            "subscriptionId": self.subscription_id,
+            "database": self.database,
+            "collection": self.collection,
+            "pipeline": self.pipeline,
+            "buffered": self.queue.qsize(),
+            "bufferSize": self.queue.maxsize,
+            "delivered": self.delivered,
+            "backpressureEvents": self.blocked,
+            "resumeToken": self.resume_token,
+            "closed": self.closed
+        }
+        if self.error:
+            result["error"] = self.error
+        return result
+
+
+def build_watch_pipeline(pipeline: Optional[List[Dict[str, Any]]],
+                         operation_types: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """서버 측 필터링 파이프라인 검증 및 구성"""
+    stages: List[Dict[str, Any]] = []
+    if operation_types:
+        if not isinstance(operation_types, list) or not all(isinstance(op, str) for op in operation_types):
+            raise ValueError("operationTypes must be an array of strings")
+        stages.append({"$match": {"operationType": {"$in": operation_types}}})
+    for stage in pipeline or []:
+        if not isinstance(stage, dict) or len(stage) != 1:
+            raise ValueError("Each pipeline stage must be an object with exactly one stage operator")
+        name = next(iter(stage))
+        if name not in ALLOWED_STAGES:
+            raise ValueError(f"Stage {name} is not allowed in a change stream; use one of {', '.join(ALLOWED_STAGES)}")
+        stages.append(stage)
+    return stages
+
+
+class ChangeStreamManager:
+    """변경 스트림 구독 관리
+
+    구독마다 백그라운드 작업이 변경 스트림을 읽어 크기 제한 대기열에 넣으며,
+    소비자가 뒤처져 대기열이 가득 차면 읽기를 멈춰 서버에서 더 가져오지 않음 (역압).
+    소비자가 idle_timeout 동안 가져가지 않으면 구독을 닫음
+    """
+
+    def __init__(self, max_subscriptions: int = 32, queue_size: int = 1000, idle_timeout: float = 300.0):
+        self.max_subscriptions = max_subscriptions
+        self.queue_size = queue_size
+        self.idle_timeout = idle_timeout
+        self._subscriptions: Dict[str, Subscription] = {}
+
+    @classmethod
+    def from_env(cls) -> "ChangeStreamManager":
+        """환경 변수로부터 생성"""
+        return cls(
+            max_subscriptions=int(os.getenv("MCP_WATCH_MAX_SUBSCRIPTIONS", "32")),
+            queue_size=int(os.getenv("MCP_WATCH_QUEUE_SIZE", "1000")),
+            idle_timeout=float(os.getenv("MCP_WATCH_IDLE_TIMEOUT", "300")),
+        )
+
+    async def start(self, db: AsyncIOMotorDatabase, collection: str, pipeline: List[Dict[str, Any]],
+                    full_document: Optional[str] = None, resume_after: Optional[Dict[str, Any]] = None,
+                    start_after: Optional[Dict[str, Any]] = None) -> Subscription:
+        """변경 스트림을 열고 구독 생성"""
+        self._reap()
+        if len(self._subscriptions) >= self.max_subscriptions:
+            raise RuntimeError(f"Too many active change stream subscriptions (max {self.max_subscriptions})")
+        if full_document and full_document not in FULL_DOCUMENT_MODES:
+            raise ValueError(f"fullDocument must be one of {', '.join(FULL_DOCUMENT_MODES)}")
+
+        options: Dict[str, Any] = {"max_await_time_ms": MAX_AWAIT_TIME_MS}
+        if full_document and full_document != "default":
+            options["full_document"] = full_document
+        if resume_after:
+            options["resume_after"] = resume_after
+        if start_after:
+            options["start_after"] = start_after
+
+        subscription = Subscription(database_key(db), collection, pipeline, self.queue_size)
+        subscription.resume_token = start_after or resume_after
+        stream = db[collection].watch(pipeline, **options)
+
+        # 첫 getMore에서 오류(레플리카 셋이 아님, 만료된 재개 토큰 등)를 바로 반환하기 위해 미리 열기
+        try:
+            first = await stream.try_next()
+        except Exception:
+            await stream.close()
+            raise
+        if first is not None:
+            subscription.queue.put_nowait(first)
+        else:
+            subscription.stream_token = stream.resume_token
+            subscription.resume_token = stream.resume_token or subscription.resume_token
+
+        subscription.task = asyncio.create_task(self._pump(subscription, stream))
+        self._subscriptions[subscription.subscription_id] = subscription
+        return subscription
+
+    async def _pump(self, subscription: Subscription, stream: Any):
+        """변경 스트림을 읽어 대기열에 전달"""
+        try:
+            while not subscription.closed:
+                change = await stream.try_next()
+                if change is None:
+                    # 필터에 걸리는 이벤트가 없는 동안에도 재개 위치가 오플로그와 함께 전진하도록 기록
+                    if stream.resume_token is not None:
+                        subscription.stream_token = stream.resume_token
+                    if time.monotonic() - subscription.last_consumed > self.idle_timeout:
+                        subscription.error = "Closed after the consumer was idle"
+                        break
+                    continue
+                subscription.stream_token = None
+                if subscription.queue.full():
+                    subscription.blocked += 1
+                try:
+                    # 대기열이 가득 차면 소비될 때까지 스트림 읽기를 멈춤
+                    await asyncio.wait_for(subscription.queue.put(change), timeout=self.idle_timeout)
+                except asyncio.TimeoutError:
+                    subscription.error = "Closed because the consumer fell behind and stopped reading"
+                    break
+        except asyncio.CancelledError:
+            pass
+        except Exception as error:
+            subscription.error = str(error)
+        finally:
+            subscription.closed = True
+            await stream.close()
+
+    def get(self, subscription_id: str) -> Subscription:
+        subscription = self._subscriptions.get(subscription_id)
+        if subscription is None:
+            raise ValueError(f"Unknown or expired subscription: {subscription_id}")
+        return subscription
+
+    async def next_batch(self, subscription: Subscription, max_events: int, timeout: float,
+                         linger: float = 0.0) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """최대 timeout초 동안 첫 이벤트를 기다린 뒤 max_events까지 모아서 반환
+
+        linger가 있으면 첫 이벤트 이후 그 시간 동안 뒤따르는 이벤트를 같은 배치로 모음.
+        대기열을 모두 비웠으면 마지막 이벤트 대신 서버의 배치 후 재개 토큰을 반환
+        """
+        subscription.last_consumed = time.monotonic()
+        events: List[Dict[str, Any]] = []
+        if subscription.queue.empty() and not subscription.closed and timeout > 0:
+            try:
+                events.append(await asyncio.wait_for(subscription.queue.get(), timeout=timeout))
+            except asyncio.TimeoutError:
+                pass
+        deadline = time.monotonic() + linger
+        while len(events) < max_events:
+            if not subscription.queue.empty():
+                events.append(subscription.queue.get_nowait())
+                continue
+            remaining = deadline - time.monotonic()
+            if not events or remaining <= 0 or subscription.closed:
+                break
+            try:
+                events.append(await asyncio.wait_for(subscription.queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+        subscription.last_consumed = time.monotonic()
+        if events:
+            subscription.delivered += len(events)
+            subscription.resume_token = events[-1]["_id"]
+        if subscription.queue.empty() and subscription.stream_token is not None:
+            subscription.resume_token = subscription.stream_token
+        return events, subscription.resume_token
+
+    async def stop(self, subscription_id: str) -> Subscription:
+        """구독 종료"""
+        subscription = self._subscriptions.pop(subscription_id, None)
+        if subscription is None:
+            raise ValueError(f"Unknown or expired subscription: {subscription_id}")
+        await self._close(subscription)
+        return subscription
+
+    async def _close(self, subscription: Subscription):
+        subscription.closed = True
+        if subscription.task and not subscription.task.done():
+            subscription.task.cancel()
+            try:
+                await subscription.task
+            except asyncio.CancelledError:
+                pass
+
+    def _reap(self):
+        """종료된 구독 중 남은 이벤트가 없는 것 제거"""
+        for subscription_id, subscription in list(self._subscriptions.items()):
+            if subscription.closed and subscription.queue.empty():
+                del self._subscriptions[subscription_id]
+
+    async def close_all(self):
+        """모든 구독 종료"""
+        for subscription in list(self._subscriptions.values()):
+            await self._close(subscription)
+        self._subscriptions.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """구독 통계 반환"""
+        subscriptions = list(self._subscriptions.values())
+        return {
+            "subscriptions": len(subscriptions),
+            "maxSubscriptions": self.max_subscriptions,
+            "buffered": sum(subscription.queue.qsize() for subscription in subscriptions),
+            "delivered": sum(subscription.delivered for subscription in subscriptions),
+            "backpressureEvents": sum(subscription.blocked for subscription in subscriptions)
+        }
+
+
+# 전역 변경 스트림 관리자
+change_streams = ChangeStreamManager.from_env()
@@ -1,11 +1,472 @@
+import asyncio
+import logging
+import os
+import threading
+import time
 import urllib.parse
-from typing import Optional
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import monitoring
 
-# 전역 변수로 클라이언트와 데이터베이스 객체 유지
-client: Optional[AsyncIOMotorClient] = None
-db: Optional[AsyncIOMotorDatabase] = None
+from .monitoring import command_stats, record_pool_wait
+
+# 기본 클러스터 이름 (MONGODB_URL)
+DEFAULT_CLUSTER = "default"
+# 추가 클러스터 연결 URL 환경 변수 접두사, 예: MONGODB_URL_ANALYTICS
+CLUSTER_URL_PREFIX = "MONGODB_URL_"
+
+logger = logging.getLogger("mongodb.client")
+
+
+def _env_int(name: str, default: Optional[int]) -> Optional[int]:
+    """정수형 환경 변수 읽기"""
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    return int(value)
+
+
+class PoolSettings:
+    """커넥션 풀 설정"""
+
+    def __init__(self, max_pool_size: int = 100, min_pool_size: int = 0,
+                 max_idle_time_ms: Optional[int] = None, wait_queue_timeout_ms: Optional[int] = 10000,
+                 health_check_interval: int = 30, max_health_failures: int = 3, recycle_grace_period: int = 60):
+        self.max_pool_size = max_pool_size
+        self.min_pool_size = min_pool_size
+        self.max_idle_time_ms = max_idle_time_ms
+        self.wait_queue_timeout_ms = wait_queue_timeout_ms
+        self.health_check_interval = health_check_interval
+        self.max_health_failures = max_health_failures
+        # 풀 재생성 후 진행 중인 작업이 끝나도록 이전 클라이언트를 닫기 전 기다리는 시간(초)
+        self.recycle_grace_period = recycle_grace_period
+
+    @classmethod
+    def from_env(cls) -> "PoolSettings":
+        """환경 변수로부터 설정 생성"""
+        return cls(
+            max_pool_size=_env_int("MONGODB_MAX_POOL_SIZE", 100),
+            min_pool_size=_env_int("MONGODB_MIN_POOL_SIZE", 0),
+            max_idle_time_ms=_env_int("MONGODB_MAX_IDLE_TIME_MS", None),
+            wait_queue_timeout_ms=_env_int("MONGODB_WAIT_QUEUE_TIMEOUT_MS", 10000),
+            health_check_interval=_env_int("MONGODB_HEALTH_CHECK_INTERVAL", 30),
+            max_health_failures=_env_int("MONGODB_MAX_HEALTH_FAILURES", 3),
+            recycle_grace_period=_env_int("MONGODB_RECYCLE_GRACE_PERIOD", 60),
+        )
+
+    def client_options(self) -> Dict[str, Any]:
+        """AsyncIOMotorClient 옵션으로 변환"""
+        options: Dict[str, Any] = {
+            "maxPoolSize": self.max_pool_size,
+            "minPoolSize": self.min_pool_size,
+        }
+        if self.max_idle_time_ms is not None:
+            options["maxIdleTimeMS"] = self.max_idle_time_ms
+        if self.wait_queue_timeout_ms is not None:
+            options["waitQueueTimeoutMS"] = self.wait_queue_timeout_ms
+        return options
+
+    def to_dict(self) -> Dict[str, Any]:
+        """사전 형태로 변환"""
+        return {
+            "maxPoolSize": self.max_pool_size,
+            "minPoolSize": self.min_pool_size,
+            "maxIdleTimeMS": self.max_idle_time_ms,
+            "waitQueueTimeoutMS": self.wait_queue_timeout_ms
+        }
+
+
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    """커넥션 체크아웃 대기 시간 및 풀 상태 수집"""
+
+    def __init__(self, window: int = 1024):
+        self._lock = threading.Lock()
+        # 체크아웃은 Motor 워커 스레드에서 동기적으로 수행되므로 스레드별로 시작 시각 기록
+        self._local = threading.local()
+        self._waits_ms: Deque[float] = deque(maxlen=window)
+        self.checked_out = 0
+        self.checkouts = 0
+        self.checkout_failures: Dict[str, int] = {}
+        self.connections_open = 0
+        self.pool_clears = 0
+        self.max_wait_ms = 0.0
+
+    def _elapsed_ms(self, event: Any) -> Optional[float]:
+        """체크아웃 소요 시간(ms) 계산"""
+        duration = getattr(event, "duration", None)
+        started = getattr(self._local, "started", None)
+        self._local.started = None
+        if duration is not None:
+            return duration * 1000
+        if started is not None:
+            return (time.perf_counter() - started) * 1000
+        return None
+
+    def _record_wait(self, wait_ms: Optional[float]):
+        if wait_ms is None:
+            return
+        self._waits_ms.append(wait_ms)
+        if wait_ms > self.max_wait_ms:
+            self.max_wait_ms = wait_ms
+
+    def connection_check_out_started(self, event):
+        self._local.started = time.perf_counter()
+
+    def connection_checked_out(self, event):
+        wait_ms = self._elapsed_ms(event)
+        record_pool_wait(wait_ms)
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self._record_wait(wait_ms)
+
+    def connection_check_out_failed(self, event):
+        wait_ms = self._elapsed_ms(event)
+        record_pool_wait(wait_ms)
+        reason = str(getattr(event, "reason", "unknown"))
+        with self._lock:
+            self.checkout_failures[reason] = self.checkout_failures.get(reason, 0) + 1
+            self._record_wait(wait_ms)
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.checked_out = max(0, self.checked_out - 1)
+
+    def connection_created(self, event):
+        with self._lock:
+            self.connections_open += 1
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.connections_open = max(0, self.connections_open - 1)
+
+    def connection_ready(self, event):
+        pass
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self.pool_clears += 1
+
+    def pool_closed(self, event):
+        pass
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 풀 통계 반환"""
+        with self._lock:
+            waits = sorted(self._waits_ms)
+            stats = {
+                "checkedOut": self.checked_out,
+                "connectionsOpen": self.connections_open,
+                "checkouts": self.checkouts,
+                "checkoutFailures": dict(self.checkout_failures),
+                "poolClears": self.pool_clears,
+                "maxWaitMs": round(self.max_wait_ms, 3),
+            }
+        if waits:
+            stats["waitMs"] = {
+                "avg": round(sum(waits) / len(waits), 3),
+                "p50": round(waits[len(waits) // 2], 3),
+                "p95": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))], 3),
+            }
+        return stats
+
+
+class MongoClientManager:
+    """MongoDB 클라이언트 및 커넥션 풀 관리자"""
+
+    def __init__(self, database_url: str, settings: Optional[PoolSettings] = None,
+                 db_name: Optional[str] = None, name: str = DEFAULT_CLUSTER):
+        self.name = name
+        self.database_url = database_url
+        self.settings = settings or PoolSettings.from_env()
+        self.db_name = db_name or parse_database_name(database_url)
+        self.pool_stats = PoolStatsListener()
+        self.client: Optional[AsyncIOMotorClient] = None
+        self.db: Optional[AsyncIOMotorDatabase] = None
+        self.recycle_count = 0
+        self.health_failures = 0
+        self._health_task: Optional[asyncio.Task] = None
+        # 재생성 후 유예 시간이 지나면 닫을 이전 클라이언트
+        self._retired: Dict[AsyncIOMotorClient, asyncio.Task] = {}
+
+    def _create_client(self) -> AsyncIOMotorClient:
+        """풀 설정이 적용된 클라이언트 생성"""
+        return AsyncIOMotorClient(
+            self.database_url,
+            event_listeners=[self.pool_stats, command_stats],
+            **self.settings.client_options()
+        )
+
+    def open(self) -> AsyncIOMotorDatabase:
+        """서버와 통신하지 않고 클라이언트 생성 (연결은 첫 명령에서 이루어짐)"""
+        if self.client is None:
+            self.client = self._create_client()
+            self.db = self.client[self.db_name]
+            self._start_health_check()
+        return self.db
+
+    def _start_health_check(self):
+        if self.settings.health_check_interval <= 0 or self._health_task is not None:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._health_task = asyncio.create_task(self._health_loop())
+
+    async def connect(self) -> AsyncIOMotorDatabase:
+        """클라이언트 생성, 연결 확인 및 풀 예열"""
+        safe_url = get_safe_connection_string(self.database_url)
+        print(f"MongoDB 연결 시도 중: {safe_url}")
+
+        print(f"데이터베이스 선택: {self.db_name}")
+        self.open()
+
+        # 연결 확인을 위해 admin 명령 실행
+        server_info = await self.client.admin.command('serverStatus')
+        version = server_info['version']
+        uptime = server_info['uptime']
+        connections = server_info['connections']
+
+        # 연결 성공 상세 정보 출력
+        print(f"MongoDB 연결 성공!")
+        print(f"  - 서버 버전: {version}")
+        print(f"  - 가동 시간: {uptime}초")
+        print(f"  - 활성 연결: {connections['current']}/{connections['available']}")
+        print(f"  - 데이터베이스: {self.db_name}")
+
+        # 사용 가능한 컬렉션 출력
+        collections = await self.db.list_collection_names()
+        if collections:
+            print(f"  - 사용 가능한 컬렉션: {', '.join(collections)}")
+        else:
+            print(f"  - 데이터베이스에 컬렉션이 없습니다.")
+
+        warmed = await self.warm_pool()
+        print(f"  - 커넥션 풀: {self.settings.to_dict()} (예열 {warmed}개)")
+
+        return self.db
+
+    async def warm_pool(self) -> int:
+        """minPoolSize 만큼 동시 ping을 보내 커넥션을 미리 생성"""
+        if not self.client:
+            return 0
+        count = max(1, min(self.settings.min_pool_size, self.settings.max_pool_size))
+        await asyncio.gather(*(self.client.admin.command("ping") for _ in range(count)))
+        return count
+
+    def get_database(self, database: Optional[str] = None) -> AsyncIOMotorDatabase:
+        """현재 데이터베이스 핸들 반환 (database를 지정하면 같은 클라이언트의 다른 데이터베이스)"""
+        if self.db is None:
+            raise RuntimeError("MongoDB is not connected")
+        if database and database != self.db_name:
+            return self.client[database]
+        return self.db
+
+    async def check_health(self) -> bool:
+        """ping으로 연결 상태 확인"""
+        if not self.client:
+            return False
+        try:
+            timeout = max(1, self.settings.health_check_interval)
+            await asyncio.wait_for(self.client.admin.command("ping"), timeout=timeout)
+            self.health_failures = 0
+            return True
+        except Exception as e:
+            self.health_failures += 1
+            print(f"MongoDB 상태 확인 실패 ({self.health_failures}회): {e}")
+            return False
+
+    async def recycle(self):
+        """클라이언트를 새로 만들어 풀 교체
+
+        이전 클라이언트를 이미 받아 간 작업이 "closed client" 오류 대신 정상적으로 끝나거나
+        일반 네트워크 오류로 실패하도록, 이전 클라이언트는 유예 시간 뒤에 닫음
+        """
+        old_client = self.client
+        self.client = self._create_client()
+        self.db = self.client[self.db_name]
+        self.recycle_count += 1
+        self.health_failures = 0
+        if old_client:
+            self._retired[old_client] = asyncio.create_task(self._close_later(old_client))
+        logger.warning("MongoDB connection pool recycled for cluster %s (%d times); closing the old client in %gs",
+                       self.name, self.recycle_count, self.settings.recycle_grace_period)
+
+    async def _close_later(self, client: AsyncIOMotorClient):
+        """유예 시간 뒤 이전 클라이언트 종료 (취소되면 close()에서 종료)"""
+        await asyncio.sleep(max(0, self.settings.recycle_grace_period))
+        self._retired.pop(client, None)
+        client.close()
+
+    async def _health_loop(self):
+        """주기적 상태 확인 및 연속 실패 시 풀 재생성"""
+        while True:
+            await asyncio.sleep(self.settings.health_check_interval)
+            healthy = await self.check_health()
+            if not healthy and self.health_failures >= self.settings.max_health_failures:
+                await self.recycle()
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 설정 및 통계 반환"""
+        return {
+            "database": self.db_name,
+            "settings": self.settings.to_dict(),
+            "healthFailures": self.health_failures,
+            "recycles": self.recycle_count,
+            **self.pool_stats.snapshot()
+        }
+
+    async def close(self):
+        """상태 확인 작업 중지 및 클라이언트 종료"""
+        if self._health_task:
+            self._health_task.cancel()
+            self._health_task = None
+        # 유예 중인 이전 클라이언트도 바로 종료
+        for retired_client, task in list(self._retired.items()):
+            task.cancel()
+            retired_client.close()
+        self._retired.clear()
+        if self.client:
+            self.client.close()
+            self.client = None
+            self.db = None
+
+
+def cluster_urls_from_env() -> Dict[str, str]:
+    """MONGODB_URL_<이름> 환경 변수에서 추가 클러스터 연결 URL 읽기"""
+    return {
+        key[len(CLUSTER_URL_PREFIX):].lower(): value
+        for key, value in os.environ.items()
+        if key.startswith(CLUSTER_URL_PREFIX) and len(key) > len(CLUSTER_URL_PREFIX) and value
+    }
+
+
+class ClusterRegistry:
+    """이름 있는 클러스터별 클라이언트 관리자
+
+    기본 클러스터는 시작 시 연결하며, 나머지는 첫 사용 시 각자의 커넥션 풀로 생성
+    """
+
+    def __init__(self):
+        self._urls: Dict[str, str] = {}
+        self._default_db: Optional[str] = None
+        self._managers: Dict[str, MongoClientManager] = {}
+
+    def configure(self, default_url: str, default_db: Optional[str] = None,
+                  urls: Optional[Dict[str, str]] = None):
+        """클러스터 연결 정보 설정"""
+        self._urls = {**(urls or {}), DEFAULT_CLUSTER: default_url}
+        self._default_db = default_db or None
+
+    @property
+    def names(self) -> List[str]:
+        return [DEFAULT_CLUSTER] + sorted(name for name in self._urls if name != DEFAULT_CLUSTER)
+
+    def _create(self, name: str) -> MongoClientManager:
+        if name not in self._urls:
+            raise ValueError(f"Unknown cluster: {name}. Configured clusters: {', '.join(self.names)}")
+        # MONGODB_DB는 기본 클러스터에만 적용하고, 나머지는 URL 경로의 데이터베이스 사용
+        db_name = self._default_db if name == DEFAULT_CLUSTER else None
+        manager = MongoClientManager(self._urls[name], db_name=db_name, name=name)
+        self._managers[name] = manager
+        return manager
+
+    def open_default(self) -> MongoClientManager:
+        """서버와 통신하지 않고 기본 클러스터 클라이언트 생성"""
+        manager = self._managers.get(DEFAULT_CLUSTER) or self._create(DEFAULT_CLUSTER)
+        manager.open()
+        return manager
+
+    async def connect_default(self) -> AsyncIOMotorDatabase:
+        """기본 클러스터 연결 확인"""
+        manager = self._managers.get(DEFAULT_CLUSTER) or self._create(DEFAULT_CLUSTER)
+        return await manager.connect()
+
+    def get(self, name: Optional[str] = None) -> MongoClientManager:
+        """클러스터 관리자 반환 (없으면 생성)"""
+        name = name or DEFAULT_CLUSTER
+        manager = self._managers.get(name)
+        if manager is None:
+            if DEFAULT_CLUSTER not in self._managers:
+                raise RuntimeError("MongoDB is not connected")
+            manager = self._create(name)
+        manager.open()
+        return manager
+
+    def get_database(self, cluster: Optional[str] = None, database: Optional[str] = None) -> AsyncIOMotorDatabase:
+        return self.get(cluster).get_database(database)
+
+    def cluster_name(self, client: Any) -> Optional[str]:
+        """클라이언트가 속한 클러스터 이름"""
+        for name, manager in self._managers.items():
+            if manager.client is client:
+                return name
+        return None
+
+    @property
+    def default(self) -> Optional[MongoClientManager]:
+        return self._managers.get(DEFAULT_CLUSTER)
+
+    def stats(self) -> Dict[str, Any]:
+        """클러스터별 연결 상태 반환 (아직 사용하지 않은 클러스터는 connected=false)"""
+        result: Dict[str, Any] = {}
+        for name in self.names:
+            manager = self._managers.get(name)
+            if manager is None or manager.client is None:
+                result[name] = {"connected": False}
+            else:
+                result[name] = {"connected": True, **manager.stats()}
+        return result
+
+    async def close(self):
+        """모든 클러스터 연결 종료"""
+        for manager in self._managers.values():
+            await manager.close()
+        self._managers.clear()
+
+
+class StartupStatus:
+    """기본 클러스터 연결 확인(준비 상태) 진행 상황"""
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.ready_at: Optional[float] = None
+        self.attempts = 0
+        self.last_error: Optional[str] = None
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.ready_at is not None
+
+    def mark_ready(self):
+        self.ready_at = time.monotonic()
+        self.last_error = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """사전 형태로 변환"""
+        result: Dict[str, Any] = {"ready": self.ready, "attempts": self.attempts}
+        if self.ready_at is not None:
+            result["readySeconds"] = round(self.ready_at - self.started_at, 3)
+        else:
+            result["waitingSeconds"] = round(time.monotonic() - self.started_at, 3)
+        if self.last_error:
+            result["lastError"] = self.last_error
+        return result
+
+
+# 전역 클러스터 레지스트리 및 시작 상태
+clusters = ClusterRegistry()
+startup = StartupStatus()
 
 
 def get_safe_connection_string(url: str) -> str:
@@ -40,46 +501,48 @@ def get_safe_connection_string(url: str) -> str:
         return "mongodb://*****:*****@*****:*****/****"
 
 
-async def connect_to_mongodb(database_url: str):
-    """MongoDB에 비동기로 연결"""
-    global client, db
+def parse_database_name(database_url: str) -> str:
+    """연결 URL 경로에서 데이터베이스 이름 추출"""
+    parsed_url = urllib.parse.urlparse(database_url)
+    db_name = parsed_url.path.split("/")[1] if parsed_url.path and len(parsed_url.path.split("/")) > 1 else ""
+    return db_name or "admin"
 
-    try:
-        # 안전한 연결 문자열로 로그 출력
-        safe_url = get_safe_connection_string(database_url)
-        print(f"MongoDB 연결 시도 중: {safe_url}")
 
-        # 클라이언트 생성
-        client = AsyncIOMotorClient(database_url)
+def get_database(cluster: Optional[str] = None, database: Optional[str] = None) -> AsyncIOMotorDatabase:
+    """호출 시점의 데이터베이스 핸들 반환 (기본값은 기본 클러스터의 기본 데이터베이스)"""
+    return clusters.get_database(cluster, database)
 
-        # 데이터베이스 이름 파싱
-        parsed_url = urllib.parse.urlparse(database_url)
-        db_name = parsed_url.path.split("/")[1] if parsed_url.path and len(parsed_url.path.split("/")) > 1 else "admin"
-        print(f"데이터베이스 선택: {db_name}")
 
-        # 데이터베이스 객체 가져오기
-        db = client[db_name]
+def database_key(db: AsyncIOMotorDatabase) -> str:
+    """캐시 및 기록용 데이터베이스 식별자 (기본 클러스터가 아니면 "클러스터/데이터베이스")"""
+    cluster = clusters.cluster_name(db.client)
+    if cluster is None or cluster == DEFAULT_CLUSTER:
+        return db.name
+    return f"{cluster}/{db.name}"
 
-        # 연결 확인을 위해 admin 명령 실행
-        server_info = await client.admin.command('serverStatus')
-        version = server_info['version']
-        uptime = server_info['uptime']
-        connections = server_info['connections']
 
-        # 연결 성공 상세 정보 출력
-        print(f"MongoDB 연결 성공!")
-        print(f"  - 서버 버전: {version}")
-        print(f"  - 가동 시간: {uptime}초")
-        print(f"  - 활성 연결: {connections['current']}/{connections['available']}")
-        print(f"  - 데이터베이스: {db_name}")
+def get_pool_stats() -> Optional[Dict[str, Any]]:
+    """기본 클러스터의 커넥션 풀 통계 반환"""
+    manager = clusters.default
+    return manager.stats() if manager else None
 
-        # 사용 가능한 컬렉션 출력
-        collections = await db.list_collection_names()
-        if collections:
-            print(f"  - 사용 가능한 컬렉션: {', '.join(collections)}")
-        else:
-            print(f"  - 데이터베이스에 컬렉션이 없습니다.")
 
+def get_cluster_stats() -> Dict[str, Any]:
+    """클러스터별 연결 상태 및 커넥션 풀 통계 반환"""
+    return clusters.stats()
+
+
+async def connect_to_mongodb(database_url: str):
+    """MongoDB에 비동기로 연결
+
+    MONGODB_DB가 있으면 기본 데이터베이스로 사용하고, MONGODB_URL_<이름>으로 추가 클러스터 등록
+    """
+    safe_url = get_safe_connection_string(database_url)
+    try:
+        clusters.configure(database_url, os.getenv("MONGODB_DB"), cluster_urls_from_env())
+        startup.attempts += 1
+        db = await clusters.connect_default()
+        startup.mark_ready()
         return db
 
     except Exception as error:
@@ -87,12 +550,42 @@ async def connect_to_mongodb(database_url: str):
         raise error
 
 
+def start_mongodb(database_url: str, retry_interval: Optional[float] = None) -> asyncio.Task:
+    """서버를 기다리지 않고 클라이언트를 만든 뒤, 연결 확인과 조회는 백그라운드에서 수행
+
+    도구 호출은 바로 받을 수 있으며(드라이버가 서버 선택을 기다림), 연결 확인이 성공할 때까지
+    retry_interval초 간격으로 재시도하고 진행 상황은 startup에 기록
+    """
+    if retry_interval is None:
+        retry_interval = float(os.getenv("MONGODB_STARTUP_RETRY_INTERVAL", "5"))
+    safe_url = get_safe_connection_string(database_url)
+    clusters.configure(database_url, os.getenv("MONGODB_DB"), cluster_urls_from_env())
+    clusters.open_default()
+
+    async def connect_in_background():
+        while True:
+            startup.attempts += 1
+            try:
+                await clusters.connect_default()
+                startup.mark_ready()
+                return
+            except Exception as error:
+                startup.last_error = str(error).replace(database_url, safe_url)
+                print(f"MongoDB 연결 확인 실패 ({startup.attempts}회), {retry_interval}초 후 재시도: {startup.last_error}")
+            await asyncio.sleep(retry_interval)
+
+    startup.task = asyncio.create_task(connect_in_background())
+    return startup.task
+
+
 async def close_mongodb():
     """MongoDB 연결 종료"""
-    global client
-    if client:
+    if startup.task and not startup.task.done():
+        startup.task.cancel()
+    startup.task = None
+    if clusters.default:
         try:
-            client.close()
+            await clusters.close()
             print("MongoDB 연결이 안전하게 종료되었습니다.")
         except Exception as e:
             print(f"MongoDB 연결 종료 중 오류: {e}")
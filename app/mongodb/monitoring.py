@@ -0,0 +1,172 @@
+import contextvars
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+
+from pymongo import monitoring
+
+# 느린 작업 로그 (logger.py의 'mongodb' 로거 핸들러로 전파)
+slow_op_logger = logging.getLogger("mongodb.slow_ops")
+
+# 최근 느린 작업 보관 건수
+RECENT_SLOW_OPS = 50
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return default if value is None or value == "" else float(value)
+
+
+class ToolCallTrace:
+    """한 번의 도구 호출에서 발생한 서버 명령 및 커넥션 대기 시간 합계"""
+
+    __slots__ = ("tool", "collection", "commands", "server_ms", "pool_wait_ms", "_lock")
+
+    def __init__(self, tool: str, collection: Optional[str]):
+        self.tool = tool
+        self.collection = collection
+        self.commands = 0
+        self.server_ms = 0.0
+        self.pool_wait_ms = 0.0
+        # 동시 실행되는 명령(gather 등)이 서로 다른 워커 스레드에서 기록
+        self._lock = threading.Lock()
+
+    def add_command(self, duration_ms: float):
+        with self._lock:
+            self.commands += 1
+            self.server_ms += duration_ms
+
+    def add_pool_wait(self, wait_ms: float):
+        with self._lock:
+            self.pool_wait_ms += wait_ms
+
+    def label(self) -> str:
+        return f"{self.tool}:{self.collection}" if self.collection else self.tool
+
+
+# 현재 실행 중인 도구 호출 (Motor는 워커 스레드 실행 시 컨텍스트를 복사하므로 리스너에서도 조회 가능)
+current_call: contextvars.ContextVar[Optional[ToolCallTrace]] = contextvars.ContextVar("current_call", default=None)
+
+
+@contextmanager
+def trace_tool_call(tool: str, collection: Optional[str]) -> Iterator[ToolCallTrace]:
+    """블록 안에서 실행되는 MongoDB 명령을 도구 호출에 귀속"""
+    trace = ToolCallTrace(tool, collection)
+    token = current_call.set(trace)
+    try:
+        yield trace
+    finally:
+        current_call.reset(token)
+
+
+def record_pool_wait(wait_ms: Optional[float]):
+    """커넥션 체크아웃 대기 시간을 현재 도구 호출에 귀속"""
+    if wait_ms is None:
+        return
+    trace = current_call.get()
+    if trace is not None:
+        trace.add_pool_wait(wait_ms)
+
+
+class CommandStatsListener(monitoring.CommandListener):
+    """서버 명령 왕복 시간 수집, 도구 호출 귀속 및 느린 명령 기록"""
+
+    def __init__(self, slow_ms: float = 100.0):
+        self.slow_ms = slow_ms
+        self._lock = threading.Lock()
+        # (커넥션, 요청 ID) -> (데이터베이스, 대상 컬렉션)
+        self._pending: Dict[Tuple[Any, int], Tuple[str, Optional[str]]] = {}
+        # 명령 이름 -> [건수, 실패 수, 합계 ms, 최대 ms]
+        self._commands: Dict[str, list] = {}
+        self.slow_ops = 0
+        self.recent_slow: Deque[Dict[str, Any]] = deque(maxlen=RECENT_SLOW_OPS)
+
+    @classmethod
+    def from_env(cls) -> "CommandStatsListener":
+        """환경 변수로부터 생성"""
+        return cls(slow_ms=_env_float("MONGODB_SLOW_OP_MS", 100.0))
+
+    def started(self, event):
+        # getMore는 명령 값이 커서 ID이므로 collection 필드에서 대상 확인
+        target = event.command.get("collection" if event.command_name == "getMore" else event.command_name)
+        collection = target if isinstance(target, str) else None
+        with self._lock:
+            self._pending[(event.connection_id, event.request_id)] = (event.database_name, collection)
+
+    def succeeded(self, event):
+        self._finish(event, failed=False)
+
+    def failed(self, event):
+        self._finish(event, failed=True)
+
+    def _finish(self, event, failed: bool):
+        duration_ms = event.duration_micros / 1000
+        trace = current_call.get()
+        if trace is not None:
+            trace.add_command(duration_ms)
+
+        with self._lock:
+            database, collection = self._pending.pop((event.connection_id, event.request_id), (None, None))
+            stats = self._commands.get(event.command_name)
+            if stats is None:
+                stats = self._commands[event.command_name] = [0, 0, 0.0, 0.0]
+            stats[0] += 1
+            stats[1] += failed
+            stats[2] += duration_ms
+            if duration_ms > stats[3]:
+                stats[3] = duration_ms
+
+        if 0 < self.slow_ms <= duration_ms:
+            entry = {
+                "at": time.time(),
+                "command": event.command_name,
+                "database": database,
+                "collection": collection,
+                "durationMs": round(duration_ms, 3),
+                "tool": trace.tool if trace else None,
+                "failed": failed
+            }
+            with self._lock:
+                self.slow_ops += 1
+                self.recent_slow.append(entry)
+            slow_op_logger.warning(
+                "slow command %s on %s.%s took %.1fms (tool=%s%s)",
+                event.command_name, database, collection, duration_ms,
+                trace.label() if trace else "-", ", failed" if failed else ""
+            )
+
+    def record_slow_call(self, trace: ToolCallTrace, duration_ms: float):
+        """느린 도구 호출을 서버/커넥션 대기/Python 처리 시간으로 나눠 기록"""
+        python_ms = max(0.0, duration_ms - trace.server_ms - trace.pool_wait_ms)
+        slow_op_logger.warning(
+            "slow tool call %s took %.1fms (server=%.1fms over %d commands, pool wait=%.1fms, python=%.1fms)",
+            trace.label(), duration_ms, trace.server_ms, trace.commands, trace.pool_wait_ms, python_ms
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """명령별 통계 반환"""
+        with self._lock:
+            commands = {
+                name: {
+                    "count": count,
+                    "failures": failures,
+                    "totalMs": round(total, 3),
+                    "avgMs": round(total / count, 3) if count else 0.0,
+                    "maxMs": round(maximum, 3)
+                }
+                for name, (count, failures, total, maximum) in sorted(self._commands.items())
+            }
+            return {
+                "slowOpThresholdMs": self.slow_ms,
+                "slowOps": self.slow_ops,
+                "commands": commands,
+                "recentSlowOps": list(self.recent_slow)
+            }
+
+
+# 전역 명령 모니터링 리스너
+command_stats = CommandStatsListener.from_env()
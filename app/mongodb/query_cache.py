@@ -0,0 +1,165 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+from bson import json_util
+
+# (데이터베이스, 컬렉션, 도구, 정규화된 파라미터) 캐시 키
+CacheKey = Tuple[str, Optional[str], str, str]
+
+
+def _parse_ttl_overrides(value: str) -> Dict[str, float]:
+    """'users=60,orders=0' 형식의 컬렉션별 TTL 설정 해석"""
+    overrides: Dict[str, float] = {}
+    for item in value.split(","):
+        if "=" not in item:
+            continue
+        collection, ttl = item.split("=", 1)
+        overrides[collection.strip()] = float(ttl)
+    return overrides
+
+
+class QueryCacheEntry:
+    """읽기 도구 응답 캐시 항목"""
+
+    __slots__ = ("response", "size", "expires_at")
+
+    def __init__(self, response: Dict[str, Any], size: int, expires_at: float):
+        self.response = response
+        self.size = size
+        self.expires_at = expires_at
+
+
+class QueryCache:
+    """크기 제한 LRU 및 컬렉션별 TTL을 지원하는 읽기 결과 캐시"""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024, ttl: float = 30.0,
+                 ttl_overrides: Optional[Dict[str, float]] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.ttl_overrides = ttl_overrides or {}
+        self._entries: "OrderedDict[CacheKey, QueryCacheEntry]" = OrderedDict()
+        # 무효화를 위한 (데이터베이스, 컬렉션)별 키 색인
+        self._by_collection: Dict[Tuple[str, Optional[str]], Set[CacheKey]] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_env(cls) -> "QueryCache":
+        """환경 변수로부터 캐시 생성"""
+        return cls(
+            max_entries=int(os.getenv("MCP_QUERY_CACHE_SIZE", "1024")),
+            max_bytes=int(os.getenv("MCP_QUERY_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+            ttl=float(os.getenv("MCP_QUERY_CACHE_TTL", "30")),
+            ttl_overrides=_parse_ttl_overrides(os.getenv("MCP_QUERY_CACHE_TTL_OVERRIDES", "")),
+        )
+
+    @staticmethod
+    def make_key(database: str, collection: Optional[str], tool: str, params: Dict[str, Any]) -> CacheKey:
+        """파라미터를 정규화하여 캐시 키 생성"""
+        return database, collection, tool, json_util.dumps(params, sort_keys=True)
+
+    def ttl_for(self, collection: Optional[str]) -> float:
+        """컬렉션별 TTL 반환"""
+        if collection is not None and collection in self.ttl_overrides:
+            return self.ttl_overrides[collection]
+        return self.ttl
+
+    def set_ttl(self, collection: str, ttl: float):
+        """컬렉션별 TTL 설정 (0이면 캐시하지 않음)"""
+        self.ttl_overrides[collection] = ttl
+
+    def get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """유효한 캐시 응답 조회"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.response
+
+    def put(self, key: CacheKey, response: Dict[str, Any]):
+        """응답 저장 및 크기/건수 한도 초과분 LRU 제거"""
+        ttl = self.ttl_for(key[1])
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        size = sum(len(item.get("text", "")) for item in response.get("content", []))
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = QueryCacheEntry(response, size, time.monotonic() + ttl)
+            self._by_collection.setdefault((key[0], key[1]), set()).add(key)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key: CacheKey):
+        """항목 제거 (잠금 보유 상태에서 호출)"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry.size
+        keys = self._by_collection.get((key[0], key[1]))
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_collection[(key[0], key[1])]
+
+    def invalidate(self, database: str, collection: Optional[str]):
+        """컬렉션의 캐시 항목과 데이터베이스 수준 항목(컬렉션 목록) 제거
+
+        collection이 None이면 데이터베이스의 모든 항목 제거
+        """
+        with self._lock:
+            if collection is None:
+                scopes = [scope for scope in self._by_collection if scope[0] == database]
+            else:
+                scopes = [(database, collection), (database, None)]
+            for scope in scopes:
+                for key in list(self._by_collection.get(scope, ())):
+                    self._remove(key)
+                    self.invalidations += 1
+
+    def clear(self):
+        """전체 캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self._by_collection.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "maxEntries": self.max_entries,
+                "maxBytes": self.max_bytes,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations
+            }
+
+
+# 전역 쿼리 결과 캐시
+query_cache = QueryCache.from_env()
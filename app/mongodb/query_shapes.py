@@ -0,0 +1,172 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+# 등호 조건으로 취급하는 연산자 ($in은 정렬과 함께 쓰이면 범위처럼 동작하지만 ESR 규칙에서는 등호로 분류)
+EQUALITY_OPERATORS = {"$eq", "$in", "$elemMatch", "$all", "$size", "$type"}
+# 범위 조건 연산자
+RANGE_OPERATORS = {"$gt", "$gte", "$lt", "$lte", "$ne", "$nin", "$regex", "$exists", "$not", "$mod"}
+
+SortSpec = Tuple[Tuple[str, int], ...]
+
+
+class QueryShape:
+    """필터/정렬의 값을 제외한 형태 (ESR 분류)"""
+
+    __slots__ = ("equality", "sort", "range")
+
+    def __init__(self, equality: Tuple[str, ...], sort: SortSpec, range_fields: Tuple[str, ...]):
+        self.equality = equality
+        self.sort = sort
+        self.range = range_fields
+
+    @property
+    def key(self) -> Tuple[Tuple[str, ...], SortSpec, Tuple[str, ...]]:
+        return self.equality, self.sort, self.range
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.equality or self.sort or self.range)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "equality": list(self.equality),
+            "sort": {field: direction for field, direction in self.sort},
+            "range": list(self.range)
+        }
+
+
+def _classify(field: str, condition: Any, equality: set, ranges: set):
+    """필드 조건을 등호/범위로 분류"""
+    if isinstance(condition, dict) and condition and all(str(k).startswith("$") for k in condition):
+        operators = set(condition)
+        if operators & RANGE_OPERATORS:
+            ranges.add(field)
+        elif operators & EQUALITY_OPERATORS:
+            equality.add(field)
+        return
+    equality.add(field)
+
+
+def _collect(filter_query: Dict[str, Any], equality: set, ranges: set):
+    for field, condition in filter_query.items():
+        if field == "$and" and isinstance(condition, list):
+            for clause in condition:
+                if isinstance(clause, dict):
+                    _collect(clause, equality, ranges)
+        elif field.startswith("$"):
+            # $or/$nor/$expr/$text 등은 단일 복합 인덱스로 처리할 수 없으므로 제외
+            continue
+        else:
+            _classify(field, condition, equality, ranges)
+
+
+def normalize_sort(sort: Any) -> SortSpec:
+    """{"a": 1} 또는 [["a", 1]] 형식의 정렬 사양을 튜플로 변환"""
+    if not sort:
+        return ()
+    items = sort.items() if isinstance(sort, dict) else sort
+    spec = []
+    for item in items:
+        field, direction = item
+        if isinstance(direction, (int, float)):
+            spec.append((str(field), 1 if direction >= 0 else -1))
+    return tuple(spec)
+
+
+def extract_shape(filter_query: Optional[Dict[str, Any]], sort: Any = None) -> QueryShape:
+    """필터와 정렬에서 쿼리 형태 추출"""
+    equality: set = set()
+    ranges: set = set()
+    if isinstance(filter_query, dict):
+        _collect(filter_query, equality, ranges)
+    sort_spec = normalize_sort(sort)
+    sort_fields = {field for field, _ in sort_spec}
+    # 같은 필드에 등호와 범위가 함께 있으면 범위로, 정렬 필드는 정렬로 분류
+    equality -= ranges
+    return QueryShape(
+        tuple(sorted(equality - sort_fields)),
+        sort_spec,
+        tuple(sorted(ranges - sort_fields))
+    )
+
+
+def pipeline_shape(pipeline: List[Dict[str, Any]]) -> QueryShape:
+    """파이프라인 앞쪽의 $match/$sort 스테이지에서 쿼리 형태 추출 (인덱스를 사용할 수 있는 부분)"""
+    matches: List[Dict[str, Any]] = []
+    sort = None
+    for stage in pipeline:
+        if "$match" in stage and sort is None:
+            matches.append(stage["$match"])
+        elif "$sort" in stage and sort is None:
+            sort = stage["$sort"]
+        else:
+            break
+    filter_query = matches[0] if len(matches) == 1 else ({"$and": matches} if matches else {})
+    return extract_shape(filter_query, sort)
+
+
+class ShapeStats:
+    """쿼리 형태별 호출 통계"""
+
+    __slots__ = ("shape", "calls", "tools", "last_seen")
+
+    def __init__(self, shape: QueryShape):
+        self.shape = shape
+        self.calls = 0
+        self.tools: Dict[str, int] = {}
+        self.last_seen = 0.0
+
+
+class QueryShapeRecorder:
+    """컬렉션별 쿼리 형태 기록 (인덱스 추천용)"""
+
+    def __init__(self, max_shapes: int = 100, max_collections: int = 256):
+        self.max_shapes = max_shapes
+        self.max_collections = max_collections
+        self._collections: "OrderedDict[Tuple[str, str], OrderedDict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "QueryShapeRecorder":
+        """환경 변수로부터 생성"""
+        return cls(
+            max_shapes=int(os.getenv("MCP_QUERY_SHAPES_MAX", "100")),
+            max_collections=int(os.getenv("MCP_QUERY_SHAPES_COLLECTIONS", "256")),
+        )
+
+    def record(self, database: str, collection: str, tool: str, shape: QueryShape):
+        """쿼리 형태 한 건 기록 (가장 오래 쓰이지 않은 형태/컬렉션부터 제거)"""
+        if shape.is_empty or self.max_shapes <= 0:
+            return
+        with self._lock:
+            shapes = self._collections.get((database, collection))
+            if shapes is None:
+                shapes = self._collections[(database, collection)] = OrderedDict()
+                while len(self._collections) > self.max_collections:
+                    self._collections.popitem(last=False)
+            else:
+                self._collections.move_to_end((database, collection))
+
+            stats = shapes.get(shape.key)
+            if stats is None:
+                stats = shapes[shape.key] = ShapeStats(shape)
+                while len(shapes) > self.max_shapes:
+                    shapes.popitem(last=False)
+            else:
+                shapes.move_to_end(shape.key)
+            stats.calls += 1
+            stats.tools[tool] = stats.tools.get(tool, 0) + 1
+            stats.last_seen = time.time()
+
+    def shapes(self, database: str, collection: str) -> List[ShapeStats]:
+        """컬렉션의 쿼리 형태 목록 (호출 수 내림차순)"""
+        with self._lock:
+            shapes = list(self._collections.get((database, collection), {}).values())
+        return sorted(shapes, key=lambda stats: stats.calls, reverse=True)
+
+
+# 전역 쿼리 형태 기록
+query_shapes = QueryShapeRecorder.from_env()
@@ -0,0 +1,140 @@
+import os
+from typing import Any, Dict, List, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import Nearest, Primary, PrimaryPreferred, Secondary, SecondaryPreferred
+
+READ_PREFERENCES = {
+    "primary": Primary,
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest
+}
+READ_CONCERN_LEVELS = ("local", "available", "majority", "linearizable", "snapshot")
+
+# 레플리카 셋에서 읽기 전용 도구에 적용되는 기본 읽기 설정
+REPLICATED_DEFAULT = "secondaryPreferred"
+# 서버가 허용하는 maxStalenessSeconds 최소값
+MIN_MAX_STALENESS_SECONDS = 90
+
+# 세컨더리로 읽기를 분산할 수 있는 토폴로지
+REPLICATED_TOPOLOGIES = ("ReplicaSetWithPrimary", "ReplicaSetNoPrimary", "Sharded")
+
+
+def _parse_overrides(value: str) -> Dict[str, str]:
+    """"find=nearest,indexes=primary" 형식의 도구별 읽기 설정 파싱"""
+    overrides: Dict[str, str] = {}
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, mode = item.partition("=")
+        overrides[name.strip()] = mode.strip()
+    return overrides
+
+
+def make_read_preference(mode: str, max_staleness_seconds: Optional[int] = None):
+    """읽기 설정 이름과 maxStalenessSeconds로 pymongo 읽기 설정 생성"""
+    if mode not in READ_PREFERENCES:
+        raise ValueError(f"Unknown readPreference: {mode}. Expected one of {', '.join(READ_PREFERENCES)}")
+    if max_staleness_seconds is None or max_staleness_seconds < 0:
+        return READ_PREFERENCES[mode]()
+    if mode == "primary":
+        raise ValueError("maxStalenessSeconds cannot be used with readPreference primary")
+    if max_staleness_seconds < MIN_MAX_STALENESS_SECONDS:
+        raise ValueError(f"maxStalenessSeconds must be at least {MIN_MAX_STALENESS_SECONDS}")
+    return READ_PREFERENCES[mode](max_staleness=int(max_staleness_seconds))
+
+
+def make_read_concern(level: Optional[str]) -> Optional[ReadConcern]:
+    """읽기 고립 수준 생성"""
+    if not level:
+        return None
+    if level not in READ_CONCERN_LEVELS:
+        raise ValueError(f"Unknown readConcern: {level}. Expected one of {', '.join(READ_CONCERN_LEVELS)}")
+    return ReadConcern(level)
+
+
+def is_replicated(db: AsyncIOMotorDatabase) -> bool:
+    """레플리카 셋 또는 샤딩 클러스터에 연결되어 있는지 확인"""
+    try:
+        return db.client.topology_description.topology_type_name in REPLICATED_TOPOLOGIES
+    except Exception:
+        return False
+
+
+async def read_command_batch(db: AsyncIOMotorDatabase, command: Dict[str, Any],
+                             batch_size: int = 10000) -> List[Dict[str, Any]]:
+    """커서를 반환하는 카탈로그 명령을 핸들의 읽기 설정으로 실행하여 첫 배치 반환
+
+    드라이버의 list_collections/list_indexes는 항상 프라이머리로 전송되므로 세컨더리 라우팅에 사용.
+    이어지는 getMore/killCursors가 다른 멤버로 전송될 수 있어 첫 배치에서 결과가 끝나도록 큰 batch_size 사용
+    """
+    command = {**command, "cursor": {"batchSize": batch_size}}
+    result = await db.command(command, read_preference=db.read_preference)
+    return list(result["cursor"]["firstBatch"])
+
+
+class ReadRouting:
+    """읽기 전용 도구의 읽기 설정/고립 수준 결정
+
+    우선순위: 호출 파라미터 > 도구별 설정 > 전역 설정 > 레플리카 셋이면 secondaryPreferred, 아니면 primary
+    """
+
+    def __init__(self, read_preference: Optional[str] = None, max_staleness_seconds: int = -1,
+                 read_concern: Optional[str] = None, tool_overrides: Optional[Dict[str, str]] = None):
+        self.read_preference = read_preference or None
+        self.max_staleness_seconds = max_staleness_seconds
+        self.read_concern = read_concern or None
+        self.tool_overrides = tool_overrides or {}
+
+        # 잘못된 설정은 첫 호출이 아니라 시작 시점에 드러나도록 검증
+        for mode in [self.read_preference, *self.tool_overrides.values()]:
+            if mode:
+                make_read_preference(mode)
+        make_read_concern(self.read_concern)
+
+    @classmethod
+    def from_env(cls) -> "ReadRouting":
+        """환경 변수로부터 생성"""
+        return cls(
+            read_preference=os.getenv("MONGODB_READ_PREFERENCE", ""),
+            max_staleness_seconds=int(os.getenv("MONGODB_MAX_STALENESS_SECONDS", "-1")),
+            read_concern=os.getenv("MONGODB_READ_CONCERN", ""),
+            tool_overrides=_parse_overrides(os.getenv("MCP_TOOL_READ_PREFERENCES", "")),
+        )
+
+    def mode_for(self, tool: str, replicated: bool, requested: Optional[str] = None) -> str:
+        """도구 호출에 적용할 읽기 설정 이름"""
+        return (requested or self.tool_overrides.get(tool) or self.read_preference
+                or (REPLICATED_DEFAULT if replicated else "primary"))
+
+    def apply(self, db: AsyncIOMotorDatabase, tool: str, params: Dict[str, Any]) -> AsyncIOMotorDatabase:
+        """호출 파라미터(readPreference, maxStalenessSeconds, readConcern)와 설정을 반영한 데이터베이스 핸들 반환"""
+        mode = self.mode_for(tool, is_replicated(db), params.get("readPreference"))
+        max_staleness = params.get("maxStalenessSeconds")
+        if max_staleness is None:
+            max_staleness = self.max_staleness_seconds if mode != "primary" else None
+        elif not isinstance(max_staleness, (int, float)) or isinstance(max_staleness, bool):
+            raise ValueError("maxStalenessSeconds must be a number")
+        read_preference = make_read_preference(mode, max_staleness)
+        read_concern = make_read_concern(params.get("readConcern") or self.read_concern)
+
+        if read_preference == db.read_preference and read_concern is None:
+            return db
+        return db.with_options(read_preference=read_preference, read_concern=read_concern)
+
+    def stats(self) -> Dict[str, Any]:
+        """현재 설정 반환"""
+        return {
+            "readPreference": self.read_preference,
+            "maxStalenessSeconds": self.max_staleness_seconds,
+            "readConcern": self.read_concern,
+            "toolOverrides": dict(self.tool_overrides)
+        }
+
+
+# 읽기 전용 도구 호출에 적용할 기본 읽기 라우팅 정책
+read_routing = ReadRouting.from_env()
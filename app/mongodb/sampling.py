@@ -0,0 +1,112 @@
+import asyncio
+import os
+import random
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+# 샘플링 전략
+SAMPLING_NATURAL = "natural"  # 자연 순서 앞부분 (find().limit)
+SAMPLING_SAMPLE = "sample"  # 서버 측 $sample 무작위 추출
+SAMPLING_STRATIFIED = "stratified"  # ObjectId 생성 시각 구간별 $sample
+SAMPLING_RESERVOIR = "reservoir"  # 컬렉션 전체를 스트리밍하며 저수지 샘플링
+SAMPLING_STRATEGIES = (SAMPLING_NATURAL, SAMPLING_SAMPLE, SAMPLING_STRATIFIED, SAMPLING_RESERVOIR)
+
+DEFAULT_SAMPLING_STRATEGY = os.getenv("MONGODB_SCHEMA_SAMPLING", SAMPLING_SAMPLE)
+DEFAULT_STRATA = 10
+# 저수지 샘플링이 훑는 최대 문서 수 (0이면 컬렉션 전체)
+DEFAULT_RESERVOIR_SCAN_LIMIT = int(os.getenv("MONGODB_SCHEMA_RESERVOIR_SCAN_LIMIT", "0"))
+
+
+class SamplingEngine:
+    """스키마 추론용 문서 샘플링 엔진"""
+
+    def __init__(self, strategy: Optional[str] = None, strata: int = DEFAULT_STRATA,
+                 scan_limit: Optional[int] = None, seed: Optional[int] = None):
+        strategy = strategy or DEFAULT_SAMPLING_STRATEGY
+        if strategy not in SAMPLING_STRATEGIES:
+            raise ValueError(
+                f"Unknown sampling strategy: {strategy}. Expected one of {', '.join(SAMPLING_STRATEGIES)}"
+            )
+        self.strategy = strategy
+        self.strata = max(1, strata)
+        self.scan_limit = DEFAULT_RESERVOIR_SCAN_LIMIT if scan_limit is None else scan_limit
+        self._random = random.Random(seed)
+
+    async def sample(self, collection: AsyncIOMotorCollection, sample_size: int) -> List[Dict[str, Any]]:
+        """전략에 따라 최대 sample_size개의 문서 반환"""
+        if sample_size <= 0:
+            return []
+        if self.strategy == SAMPLING_SAMPLE:
+            return await self._sample_random(collection, sample_size)
+        if self.strategy == SAMPLING_STRATIFIED:
+            return await self._sample_stratified(collection, sample_size)
+        if self.strategy == SAMPLING_RESERVOIR:
+            return await self._sample_reservoir(collection, sample_size)
+        return await collection.find().limit(sample_size).to_list(length=sample_size)
+
+    async def _sample_random(self, collection: AsyncIOMotorCollection, sample_size: int,
+                             match: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """$sample 집계로 무작위 추출"""
+        pipeline: List[Dict[str, Any]] = []
+        if match:
+            pipeline.append({"$match": match})
+        pipeline.append({"$sample": {"size": sample_size}})
+        return await collection.aggregate(pipeline).to_list(length=sample_size)
+
+    async def _sample_stratified(self, collection: AsyncIOMotorCollection, sample_size: int) -> List[Dict[str, Any]]:
+        """_id 생성 시각 범위를 구간으로 나누어 구간별로 균등 추출"""
+        first = await collection.find({}, {"_id": 1}).sort("_id", 1).limit(1).to_list(length=1)
+        last = await collection.find({}, {"_id": 1}).sort("_id", -1).limit(1).to_list(length=1)
+        if not first or not last:
+            return []
+
+        low, high = first[0]["_id"], last[0]["_id"]
+        # ObjectId가 아니면 생성 시각을 알 수 없으므로 단순 무작위 추출
+        if not isinstance(low, ObjectId) or not isinstance(high, ObjectId):
+            return await self._sample_random(collection, sample_size)
+
+        start = low.generation_time.timestamp()
+        end = high.generation_time.timestamp() + 1
+        strata = min(self.strata, sample_size)
+        step = (end - start) / strata
+        per_stratum, remainder = divmod(sample_size, strata)
+
+        async def sample_stratum(index: int) -> List[Dict[str, Any]]:
+            size = per_stratum + (1 if index < remainder else 0)
+            lower = ObjectId.from_datetime(_utc(start + step * index))
+            upper = ObjectId.from_datetime(_utc(start + step * (index + 1)))
+            return await self._sample_random(collection, size, {"_id": {"$gte": lower, "$lt": upper}})
+
+        batches = await asyncio.gather(*(sample_stratum(i) for i in range(strata)))
+        return [doc for batch in batches for doc in batch]
+
+    async def _sample_reservoir(self, collection: AsyncIOMotorCollection, sample_size: int) -> List[Dict[str, Any]]:
+        """커서를 스트리밍하며 고정 크기 저수지 유지 (Algorithm R)
+
+        scan_limit이 없으면 컬렉션 전체를 한 번 훑고, 있으면 자연 순서 앞부분에 치우치지 않도록
+        $sample로 뽑은 scan_limit개의 문서를 훑음
+        """
+        if self.scan_limit > 0:
+            cursor = collection.aggregate([{"$sample": {"size": self.scan_limit}}], allowDiskUse=True,
+                                          batchSize=min(self.scan_limit, 1000))
+        else:
+            cursor = collection.find(batch_size=1000)
+        reservoir: List[Dict[str, Any]] = []
+        seen = 0
+        async for doc in cursor:
+            seen += 1
+            if len(reservoir) < sample_size:
+                reservoir.append(doc)
+            else:
+                slot = self._random.randrange(seen)
+                if slot < sample_size:
+                    reservoir[slot] = doc
+        return reservoir
+
+
+def _utc(timestamp: float):
+    """유닉스 타임스탬프를 UTC datetime으로 변환"""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
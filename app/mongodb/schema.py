@@ -1,17 +1,35 @@
-from typing import Dict, List, Any, Set, Optional
+import os
+from typing import Dict, List, Any, Optional, Tuple
 
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.errors import ExecutionTimeout
+
+from .client import database_key
+from .sampling import SAMPLING_NATURAL, SamplingEngine
+from .schema_cache import SchemaCacheEntry, schema_cache
+
+# 문서 수 계산 전략
+COUNT_ESTIMATED = "estimated"  # 컬렉션 메타데이터 기반 (estimated_document_count)
+COUNT_EXACT = "exact"  # count_documents({}) 전체 집계
+COUNT_BOUNDED = "bounded"  # maxTimeMS 내 정확한 집계, 초과 시 estimated로 대체
+COUNT_STRATEGIES = (COUNT_ESTIMATED, COUNT_EXACT, COUNT_BOUNDED)
+
+DEFAULT_COUNT_STRATEGY = os.getenv("MONGODB_SCHEMA_COUNT_STRATEGY", COUNT_BOUNDED)
+DEFAULT_COUNT_MAX_TIME_MS = int(os.getenv("MONGODB_SCHEMA_COUNT_MAX_TIME_MS", "1000"))
 
 
 class MongoFieldSchema:
     """MongoDB 필드 스키마 정의"""
 
     def __init__(self, field: str, field_type: str, is_required: bool,
-                 sub_fields: Optional[List['MongoFieldSchema']] = None):
+                 sub_fields: Optional[List['MongoFieldSchema']] = None,
+                 frequency: Optional[float] = None, type_counts: Optional[Dict[str, int]] = None):
         self.field = field
         self.type = field_type
         self.is_required = is_required
         self.sub_fields = sub_fields
+        self.frequency = frequency
+        self.type_counts = type_counts
 
     def to_dict(self) -> Dict[str, Any]:
         """사전 형태로 변환"""
@@ -20,6 +38,10 @@ class MongoFieldSchema:
             "type": self.type,
             "isRequired": self.is_required
         }
+        if self.frequency is not None:
+            result["frequency"] = self.frequency
+        if self.type_counts:
+            result["types"] = self.type_counts
         if self.sub_fields:
             result["subFields"] = [sf.to_dict() for sf in self.sub_fields]
         return result
@@ -29,11 +51,18 @@ class MongoCollectionSchema:
     """MongoDB 컬렉션 스키마 정의"""
 
     def __init__(self, collection: str, fields: List[MongoFieldSchema], count: int,
-                 indexes: Optional[List[Any]] = None):
+                 indexes: Optional[List[Any]] = None, count_strategy: str = COUNT_EXACT,
+                 sample_size: Optional[int] = None, sampling_strategy: Optional[str] = None,
+                 documents_sampled: Optional[int] = None):
         self.collection = collection
         self.fields = fields
         self.count = count
         self.indexes = indexes
+        self.count_strategy = count_strategy
+        # 요청된 표본 크기와 실제로 분석한 문서 수 (컬렉션이 작거나 증분 갱신 시 다를 수 있음)
+        self.sample_size = sample_size
+        self.documents_sampled = documents_sampled
+        self.sampling_strategy = sampling_strategy
 
     def to_dict(self) -> Dict[str, Any]:
         """사전 형태로 변환"""
@@ -41,6 +70,10 @@ class MongoCollectionSchema:
             "collection": self.collection,
             "fields": [field.to_dict() for field in self.fields],
             "count": self.count,
+            "countStrategy": self.count_strategy,
+            "sampleSize": self.sample_size,
+            "documentsSampled": self.documents_sampled,
+            "samplingStrategy": self.sampling_strategy,
             "indexes": self.indexes
         }
 
@@ -93,53 +126,195 @@ def infer_schema_from_document(doc: Dict[str, Any], parent_path: str = "") -> Li
     return schema
 
 
-async def build_collection_schema(collection: AsyncIOMotorCollection, sample_size: int = 100) -> MongoCollectionSchema:
-    """컬렉션 스키마 구축"""
-    # 샘플 문서 가져오기
-    docs = await collection.find().limit(sample_size).to_list(length=sample_size)
-    count = await collection.count_documents({})
-    indexes = await collection.index_information()
+# 정확한 타입 기반 빠른 타입 추론 테이블 (하위 클래스는 infer_schema_from_value로 처리)
+_TYPE_NAMES: Dict[type, str] = {
+    type(None): "null",
+    list: "array",
+    dict: "object",
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    str: "string",
+    bytes: "binary",
+    bytearray: "binary",
+}
+
+
+class _FieldNode:
+    """경로 트리의 필드 노드 (경로 문자열과 스키마 객체는 결과 생성 시에만 만듦)"""
+
+    __slots__ = ("presence", "type_counts", "children", "element")
+
+    def __init__(self):
+        self.presence = 0
+        self.type_counts: Dict[str, int] = {}
+        self.children: Optional[Dict[str, "_FieldNode"]] = None
+        # 배열의 첫 요소가 객체인 경우의 요소 노드 ("field[].sub" 경로)
+        self.element: Optional["_FieldNode"] = None
+
+
+class SchemaAccumulator:
+    """샘플 문서로부터 스키마를 단일 패스로 증분 누적"""
+
+    def __init__(self, sampling_strategy: Optional[str] = None):
+        self.root: Dict[str, _FieldNode] = {}
+        self.docs_seen = 0
+        self.max_id: Any = None
+        self.sampling_strategy = sampling_strategy
+
+    def add_document(self, doc: Dict[str, Any]):
+        """문서 하나를 트리에 누적"""
+        self.docs_seen += 1
+        _accumulate(self.root, doc)
+
+        # 증분 샘플링 기준점 갱신
+        doc_id = doc.get("_id")
+        if doc_id is not None:
+            try:
+                if self.max_id is None or doc_id > self.max_id:
+                    self.max_id = doc_id
+            except TypeError:
+                pass
+
+    def build_fields(self) -> List[MongoFieldSchema]:
+        """누적된 정보로 필드 스키마 생성 (출현 빈도 및 타입 분포 포함)"""
+        return _emit_fields(self.root, "", self.docs_seen)
+
+
+def _accumulate(children: Dict[str, _FieldNode], doc: Dict[str, Any]):
+    """문서의 각 필드 타입과 출현 횟수를 노드에 기록"""
+    for key, value in doc.items():
+        node = children.get(key)
+        if node is None:
+            node = children[key] = _FieldNode()
+        node.presence += 1
+
+        type_name = _TYPE_NAMES.get(type(value)) or infer_schema_from_value(value)
+        type_counts = node.type_counts
+        type_counts[type_name] = type_counts.get(type_name, 0) + 1
+
+        if type_name == "object":
+            if node.children is None:
+                node.children = {}
+            _accumulate(node.children, value)
+        elif type_name == "array" and value and isinstance(value[0], dict):
+            element = node.element
+            if element is None:
+                element = node.element = _FieldNode()
+                element.children = {}
+            element.presence += 1
+            _accumulate(element.children, value[0])
 
-    field_schemas: Dict[str, Set[str]] = {}
-    required_fields: Set[str] = set()
-
-    # 모든 필드 수집
-    for doc in docs:
-        doc_schema = infer_schema_from_document(doc)
-        for field in doc_schema:
-            if field.field not in field_schemas:
-                field_schemas[field.field] = set()
-            field_schemas[field.field].add(field.type)
-            required_fields.add(field.field)
-
-    # 필수 필드 결정
-    for doc in docs:
-        doc_fields = set(doc.keys())
-        for field in list(required_fields):
-            if field.split(".")[0] not in doc_fields:
-                required_fields.remove(field)
-
-    # 필드 스키마 생성
+
+def _emit_fields(children: Dict[str, _FieldNode], parent_path: str, parent_count: int) -> List[MongoFieldSchema]:
+    """노드 트리를 필드 스키마 목록으로 변환
+
+    하위 필드의 필수 여부와 빈도는 부모가 객체로 나타난 횟수를 기준으로 계산
+    """
     fields: List[MongoFieldSchema] = []
-    for field, types in field_schemas.items():
+    for key, node in children.items():
+        path = f"{parent_path}.{key}" if parent_path else key
+        type_counts = node.type_counts
+
+        sub_fields: List[MongoFieldSchema] = []
+        if node.children:
+            sub_fields.extend(_emit_fields(node.children, path, type_counts.get("object", 0)))
+        if node.element is not None and node.element.children:
+            sub_fields.extend(_emit_fields(node.element.children, f"{path}[]", node.element.presence))
+
         fields.append(MongoFieldSchema(
-            field=field,
-            field_type="|".join(types) if len(types) > 1 else next(iter(types)),
-            is_required=field in required_fields
+            field=path,
+            field_type="|".join(sorted(type_counts)) if len(type_counts) > 1 else next(iter(type_counts)),
+            is_required=node.presence == parent_count,
+            sub_fields=sub_fields or None,
+            frequency=round(node.presence / parent_count, 4) if parent_count else None,
+            type_counts=dict(type_counts)
         ))
+    return fields
+
+
+async def count_collection(collection: AsyncIOMotorCollection, strategy: str = COUNT_BOUNDED,
+                           max_time_ms: int = DEFAULT_COUNT_MAX_TIME_MS) -> Tuple[int, str]:
+    """전략에 따라 문서 수 계산
+
+    실제로 값을 산출한 전략(exact 또는 estimated)을 함께 반환
+    """
+    if strategy not in COUNT_STRATEGIES:
+        raise ValueError(f"Unknown count strategy: {strategy}. Expected one of {', '.join(COUNT_STRATEGIES)}")
+
+    if strategy == COUNT_ESTIMATED:
+        return await collection.estimated_document_count(), COUNT_ESTIMATED
+    if strategy == COUNT_EXACT:
+        return await collection.count_documents({}), COUNT_EXACT
+
+    try:
+        return await collection.count_documents({}, maxTimeMS=max_time_ms), COUNT_EXACT
+    except ExecutionTimeout:
+        return await collection.estimated_document_count(), COUNT_ESTIMATED
+
+
+async def build_collection_schema(collection: AsyncIOMotorCollection, sample_size: int = 100,
+                                  use_cache: bool = True, count_strategy: Optional[str] = None,
+                                  count_max_time_ms: Optional[int] = None,
+                                  sampling: Optional[SamplingEngine] = None) -> MongoCollectionSchema:
+    """컬렉션 스키마 구축
+
+    캐시 항목이 유효하면 그대로 반환하고, 만료되었거나 쓰기 작업으로 무효화된 경우
+    natural 전략은 마지막으로 본 _id 이후의 문서만 추가 샘플링하여 기존 스키마에 병합하며,
+    무작위 전략은 표본의 최대 _id가 최신 문서를 뜻하지 않으므로 전체 재샘플링
+    """
+    count_strategy = count_strategy or DEFAULT_COUNT_STRATEGY
+    sampling = sampling or SamplingEngine()
+    if count_max_time_ms is None:
+        count_max_time_ms = DEFAULT_COUNT_MAX_TIME_MS
+    key = (database_key(collection.database), collection.name)
+    entry = schema_cache.get(key) if use_cache else None
+
+    # 다른 샘플링 전략이나 더 작은 표본으로 만든 항목은 재사용하지 않음
+    if entry is not None and (entry.accumulator.sampling_strategy != sampling.strategy
+                              or sample_size > entry.sample_size):
+        entry = None
+
+    if entry is not None and entry.is_fresh(schema_cache.ttl):
+        schema_cache.hits += 1
+        # 캐시된 추정치로는 정확한 수 요청을 만족할 수 없음
+        if count_strategy == COUNT_EXACT and entry.count_strategy != COUNT_EXACT:
+            entry.count, entry.count_strategy = await count_collection(collection, COUNT_EXACT)
+        return _to_collection_schema(collection.name, entry)
+
+    if (entry is not None and entry.accumulator.max_id is not None
+            and sampling.strategy == SAMPLING_NATURAL):
+        # 증분 갱신
+        schema_cache.refreshes += 1
+        accumulator = entry.accumulator
+        sample_size = entry.sample_size
+        cursor = collection.find({"_id": {"$gt": accumulator.max_id}}).sort("_id", 1).limit(sample_size)
+        async for doc in cursor:
+            accumulator.add_document(doc)
+    else:
+        schema_cache.misses += 1
+        accumulator = SchemaAccumulator(sampling.strategy)
+        for doc in await sampling.sample(collection, sample_size):
+            accumulator.add_document(doc)
+
+    count, used_strategy = await count_collection(collection, count_strategy, count_max_time_ms)
+    indexes = await collection.index_information()
+
+    entry = SchemaCacheEntry(accumulator, count, list(indexes.values()), used_strategy, sample_size)
+    if use_cache:
+        schema_cache.put(key, entry)
+    return _to_collection_schema(collection.name, entry)
 
-    # 하위 필드 정보 추가
-    for doc in docs:
-        doc_schema = infer_schema_from_document(doc)
-        for field_schema in doc_schema:
-            if field_schema.sub_fields:
-                existing_field = next((f for f in fields if f.field == field_schema.field), None)
-                if existing_field and not existing_field.sub_fields:
-                    existing_field.sub_fields = field_schema.sub_fields
 
+def _to_collection_schema(collection_name: str, entry: SchemaCacheEntry) -> MongoCollectionSchema:
+    """캐시 항목을 컬렉션 스키마로 변환"""
     return MongoCollectionSchema(
-        collection=collection.name,
-        fields=fields,
-        count=count,
-        indexes=list(indexes.values())
+        collection=collection_name,
+        fields=entry.accumulator.build_fields(),
+        count=entry.count,
+        indexes=entry.indexes,
+        count_strategy=entry.count_strategy,
+        sample_size=entry.sample_size,
+        sampling_strategy=entry.accumulator.sampling_strategy,
+        documents_sampled=entry.accumulator.docs_seen
     )
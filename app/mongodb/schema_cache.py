@@ -0,0 +1,106 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# (데이터베이스, 컬렉션) 캐시 키
+CacheKey = Tuple[str, str]
+
+
+class SchemaCacheEntry:
+    """컬렉션 스키마 캐시 항목"""
+
+    def __init__(self, accumulator: Any, count: int, indexes: Any, count_strategy: str, sample_size: int = 0):
+        self.accumulator = accumulator
+        self.count = count
+        self.indexes = indexes
+        self.count_strategy = count_strategy
+        # 항목을 만들 때 요청된 표본 크기 (더 큰 표본 요청은 재샘플링)
+        self.sample_size = sample_size
+        self.refreshed_at = time.monotonic()
+        self.stale = False
+
+    def is_fresh(self, ttl: float) -> bool:
+        """TTL 이내이며 무효화되지 않았는지 확인"""
+        return not self.stale and (time.monotonic() - self.refreshed_at) < ttl
+
+
+class SchemaCache:
+    """TTL 및 LRU 제거를 지원하는 스키마 캐시"""
+
+    def __init__(self, max_entries: int = 256, ttl: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[CacheKey, SchemaCacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    @classmethod
+    def from_env(cls) -> "SchemaCache":
+        """환경 변수로부터 캐시 생성"""
+        return cls(
+            max_entries=int(os.getenv("MONGODB_SCHEMA_CACHE_SIZE", "256")),
+            ttl=float(os.getenv("MONGODB_SCHEMA_CACHE_TTL", "300")),
+        )
+
+    def get(self, key: CacheKey) -> Optional[SchemaCacheEntry]:
+        """항목 조회 (만료 여부와 관계없이 반환하여 증분 갱신에 활용)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: CacheKey, entry: SchemaCacheEntry):
+        """항목 저장 및 LRU 제거"""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, database: str, collection: Optional[str], drop: bool = False):
+        """쓰기 작업 후 항목 무효화
+
+        drop=False이면 다음 조회 시 증분 갱신하도록 표시만 하고,
+        drop=True이면 항목을 제거하여 전체 재샘플링하도록 함.
+        collection이 None이면 데이터베이스의 모든 컬렉션에 적용
+        """
+        with self._lock:
+            if collection is None:
+                keys = [key for key in self._entries if key[0] == database]
+            else:
+                keys = [(database, collection)]
+            for key in keys:
+                if drop:
+                    self._entries.pop(key, None)
+                else:
+                    entry = self._entries.get(key)
+                    if entry is not None:
+                        entry.stale = True
+
+    def clear(self):
+        """전체 캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "maxEntries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "refreshes": self.refreshes
+            }
+
+
+# 전역 스키마 캐시
+schema_cache = SchemaCache.from_env()
@@ -0,0 +1,151 @@
+import base64
+import datetime
+import json
+import os
+import uuid
+from decimal import Decimal
+from typing import Any, Callable, List, Optional
+
+import bson
+from bson import Binary, Code, DBRef, Decimal128, MaxKey, MinKey, ObjectId, Regex, Timestamp
+from bson import json_util
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+
+try:
+    import orjson
+except ImportError:  # orjson은 선택 의존성
+    orjson = None
+
+try:
+    import bsonjs
+except ImportError:  # python-bsonjs는 선택 의존성
+    bsonjs = None
+
+# 출력 모드
+MODE_PLAIN = "plain"  # BSON 타입을 사람이 읽기 쉬운 문자열로 변환 (기존 default=str 동작과 호환)
+MODE_RELAXED = "relaxed"  # MongoDB Relaxed Extended JSON ({"$oid": ...}, {"$date": ...})
+MODES = (MODE_PLAIN, MODE_RELAXED)
+
+DEFAULT_MODE = os.getenv("MCP_JSON_MODE", MODE_PLAIN)
+DEFAULT_COMPACT = os.getenv("MCP_JSON_COMPACT", "false").lower() in ("1", "true", "yes")
+
+
+def _isoformat(value: datetime.datetime) -> str:
+    """datetime을 ISO 8601 문자열로 변환 (naive 값은 UTC로 간주)"""
+    if value.tzinfo is None:
+        return value.isoformat() + "Z"
+    return value.isoformat()
+
+
+def _plain_default(value: Any) -> Any:
+    """plain 모드에서 JSON 기본 타입이 아닌 값 변환"""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime.datetime):
+        return _isoformat(value)
+    if isinstance(value, (Decimal128, Decimal)):
+        return str(value)
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, Binary) and value.subtype in (3, 4):
+        return str(value.as_uuid(value.subtype))
+    if isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(value).decode("ascii")
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def _relaxed_default(value: Any) -> Any:
+    """relaxed 모드에서 Extended JSON 표현으로 변환"""
+    if isinstance(value, ObjectId):
+        return {"$oid": str(value)}
+    if isinstance(value, datetime.datetime):
+        return {"$date": _isoformat(value)}
+    if isinstance(value, Decimal128):
+        return {"$numberDecimal": str(value)}
+    if isinstance(value, Decimal):
+        return {"$numberDecimal": str(value)}
+    # Binary는 bytes의 하위 클래스이므로 subtype 보존을 위해 bytes보다 먼저 처리
+    if isinstance(value, (Binary, Code, DBRef, MaxKey, MinKey, Regex, Timestamp, uuid.UUID)):
+        return json.loads(json_util.dumps(value, json_options=json_util.RELAXED_JSON_OPTIONS))
+    if isinstance(value, (bytes, bytearray)):
+        return {"$binary": {"base64": base64.b64encode(value).decode("ascii"), "subType": "00"}}
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def _default_for(mode: str) -> Callable[[Any], Any]:
+    """모드별 변환 함수 선택"""
+    if mode not in MODES:
+        raise ValueError(f"Unknown JSON mode: {mode}. Expected one of {', '.join(MODES)}")
+    return _relaxed_default if mode == MODE_RELAXED else _plain_default
+
+
+def encode_json(value: Any, compact: Optional[bool] = None, mode: Optional[str] = None) -> str:
+    """BSON 타입을 직접 변환하여 JSON 문자열로 직렬화
+
+    orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 대체
+    """
+    compact = DEFAULT_COMPACT if compact is None else compact
+    mode = mode or DEFAULT_MODE
+    default = _default_for(mode)
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        if mode == MODE_RELAXED:
+            # datetime을 $date로 감싸기 위해 default로 전달
+            option |= orjson.OPT_PASSTHROUGH_DATETIME
+        else:
+            # PyMongo가 반환하는 naive datetime은 UTC
+            option |= orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+        try:
+            return orjson.dumps(value, default=default, option=option).decode("utf-8")
+        except TypeError:
+            # 64비트를 넘는 정수 등 orjson이 처리하지 못하는 값은 표준 모듈로 처리
+            pass
+
+    if compact:
+        return json.dumps(value, default=default, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(value, default=default, ensure_ascii=False, indent=2)
+
+
+def raw_codec_options(codec_options: CodecOptions) -> CodecOptions:
+    """기존 코덱 옵션에서 문서 클래스만 RawBSONDocument로 변경"""
+    return codec_options.with_options(document_class=RawBSONDocument)
+
+
+def encode_raw_document(document: RawBSONDocument) -> str:
+    """RawBSONDocument를 Relaxed Extended JSON으로 변환
+
+    python-bsonjs가 설치되어 있으면 BSON 바이트를 libbson으로 바로 변환하여
+    중간 dict를 만들지 않고, 없으면 디코딩 후 encode_json으로 대체
+    """
+    if bsonjs is not None:
+        return bsonjs.dumps(document.raw, mode=bsonjs.RELAXED)
+    return encode_json(bson.decode(document.raw), compact=True, mode=MODE_RELAXED)
+
+
+def join_json_array(encoded: List[str], compact: Optional[bool] = None) -> str:
+    """개별 직렬화된 값들을 JSON 배열 문자열로 결합"""
+    compact = DEFAULT_COMPACT if compact is None else compact
+    return "[" + ("," if compact else ", ").join(encoded) + "]"
+
+
+def encode_documents(encoded: List[str], compact: Optional[bool] = None, mode: Optional[str] = None,
+                     **fields: Any) -> str:
+    """개별 직렬화된 문서 목록과 추가 필드를 하나의 JSON 객체 문자열로 결합"""
+    compact = DEFAULT_COMPACT if compact is None else compact
+    separator = "," if compact else ", "
+    colon = ":" if compact else ": "
+    parts = ['"documents"' + colon + join_json_array(encoded, compact)]
+    for name, value in fields.items():
+        parts.append(json.dumps(name) + colon + encode_json(value, compact=True, mode=mode))
+    return "{" + separator.join(parts) + "}"
+
@@ -1,10 +1,55 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, TypeVar, Generic
+from typing import Dict, Any, List, Optional, TypeVar, Generic, Callable, Awaitable
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from .encoder import encode_json
+from ...mongodb.client import database_key, get_database
+from ...mongodb.query_cache import query_cache
+from ...mongodb.query_shapes import QueryShape, query_shapes
+from ...mongodb.read_routing import READ_CONCERN_LEVELS, READ_PREFERENCES, read_routing
+from ...mongodb.schema_cache import schema_cache
 
 # 도구 파라미터 타입
 ToolParams = Dict[str, Any]
 T = TypeVar('T', bound=ToolParams)
 
+# 스케줄러 우선순위 (값이 낮을수록 먼저 실행)
+PRIORITY_READ = 0
+PRIORITY_WRITE = 1
+PRIORITY_ADMIN = 2
+
+# 모든 도구의 입력 스키마에 추가하는 대상 클러스터/데이터베이스 옵션
+TARGET_PROPERTIES: Dict[str, Any] = {
+    "database": {
+        "type": "string",
+        "description": "Database to use instead of the server's default database"
+    },
+    "cluster": {
+        "type": "string",
+        "description": "Named cluster to use instead of the default cluster (configured with MONGODB_URL_<NAME>)"
+    }
+}
+
+# 읽기 전용 도구의 입력 스키마에 추가하는 읽기 옵션
+READ_OPTION_PROPERTIES: Dict[str, Any] = {
+    "readPreference": {
+        "type": "string",
+        "enum": list(READ_PREFERENCES),
+        "description": "Replica set member to read from; read-only tools default to secondaryPreferred "
+                       "on replica sets and sharded clusters"
+    },
+    "maxStalenessSeconds": {
+        "type": "number",
+        "description": "Skip secondaries lagging more than this many seconds behind the primary (min 90)"
+    },
+    "readConcern": {
+        "type": "string",
+        "enum": list(READ_CONCERN_LEVELS),
+        "description": "Read concern level, e.g. majority to only see majority-committed data"
+    }
+}
+
 
 class ToolResponse:
     """도구 응답 형식"""
@@ -31,6 +76,11 @@ class ToolResponse:
 class BaseTool(Generic[T], ABC):
     """모든 도구의 기본 클래스"""
 
+    # 스케줄러 대기열 우선순위
+    priority: int = PRIORITY_READ
+    # 읽기 전용 도구는 get_database(params)에서 읽기 설정에 따라 세컨더리로 라우팅
+    read_only: bool = False
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -54,6 +104,54 @@ class BaseTool(Generic[T], ABC):
         """도구 실행"""
         pass
 
+    def call_priority(self, params: Dict[str, Any]) -> int:
+        """호출별 스케줄러 우선순위 (파라미터에 따라 쓰기가 되는 도구는 재정의)"""
+        return self.priority
+
+    def get_database(self, params: Optional[Dict[str, Any]] = None, route_reads: bool = True) -> AsyncIOMotorDatabase:
+        """호출 파라미터의 cluster/database에 해당하는 데이터베이스 핸들 반환
+
+        읽기 전용 도구는 readPreference/readConcern 설정을 적용한 핸들을 반환하며,
+        route_reads=False이면 프라이머리 핸들 반환
+        """
+        params = params or {}
+        cluster = params.get("cluster")
+        database = params.get("database")
+        for name, value in (("cluster", cluster), ("database", database)):
+            if value is not None and (not isinstance(value, str) or not value):
+                raise ValueError(f"{name} must be a non-empty string")
+
+        db = get_database(cluster, database)
+        if not self.read_only or not route_reads:
+            return db
+        return read_routing.apply(db, self.name, params)
+
+    def invalidate_collection(self, db: AsyncIOMotorDatabase, collection: Optional[str], drop: bool = False):
+        """쓰기 작업 후 컬렉션 관련 캐시 무효화 (collection이 None이면 데이터베이스 전체)"""
+        database = database_key(db)
+        schema_cache.invalidate(database, collection, drop=drop)
+        query_cache.invalidate(database, collection)
+
+    def record_query_shape(self, db: AsyncIOMotorDatabase, collection: str, shape: QueryShape):
+        """인덱스 추천을 위해 쿼리 형태 기록"""
+        query_shapes.record(database_key(db), collection, self.name, shape)
+
+    async def cached_response(self, db: AsyncIOMotorDatabase, collection: Optional[str], key_params: Dict[str, Any],
+                              producer: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """읽기 결과 캐시 조회, 없으면 실행 후 저장
+
+        라우팅된 핸들의 readPreference/readConcern을 키에 포함하여
+        세컨더리에서 읽은 결과가 다른 읽기 설정의 호출에 재사용되지 않도록 함
+        """
+        read_options = {"readPreference": db.read_preference.document, "readConcern": db.read_concern.document}
+        key = query_cache.make_key(database_key(db), collection, self.name, {**key_params, "$read": read_options})
+        response = query_cache.get(key)
+        if response is None:
+            response = await producer()
+            if not response.get("isError"):
+                query_cache.put(key, response)
+        return response
+
     def validate_collection(self, collection: Any) -> str:
         """컬렉션 이름 검증"""
         if not isinstance(collection, str):
@@ -66,6 +164,15 @@ class BaseTool(Generic[T], ABC):
             raise ValueError(f"{name} must be an object")
         return value
 
+    def json_response(self, data: Any, documents: Optional[int] = None) -> Dict[str, Any]:
+        """데이터를 JSON 텍스트 응답으로 변환"""
+        return self.text_response(encode_json(data), documents=documents)
+
+    def text_response(self, text: str, documents: Optional[int] = None) -> Dict[str, Any]:
+        """텍스트 응답 생성 (documents는 메트릭용 결과 문서 수)"""
+        meta = {"documentCount": documents} if documents is not None else None
+        return ToolResponse(content=[{"type": "text", "text": text}], meta=meta).to_dict()
+
     def handle_error(self, error: Exception) -> Dict[str, Any]:
         """오류 처리"""
         return ToolResponse(
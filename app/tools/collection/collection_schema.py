@@ -0,0 +1,94 @@
+from typing import Dict, Any
+
+from ..base.tool import BaseTool, READ_OPTION_PROPERTIES, TARGET_PROPERTIES
+from ...mongodb.sampling import SamplingEngine, SAMPLING_STRATEGIES
+from ...mongodb.schema import build_collection_schema, COUNT_STRATEGIES
+
+# 스키마 추론 샘플 크기 상한
+MAX_SAMPLE_SIZE = 1000
+
+
+class CollectionSchemaTool(BaseTool):
+    """컬렉션 스키마 추론 도구"""
+
+    read_only = True
+
+    @property
+    def name(self) -> str:
+        return "collectionSchema"
+
+    @property
+    def description(self) -> str:
+        return "Infer the schema of a collection (fields, types, frequencies, count and indexes) from sampled documents"
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "collection": {
+                    "type": "string",
+                    "description": "Name of the collection to infer the schema for"
+                },
+                **schema_options_properties(),
+                **TARGET_PROPERTIES
+            },
+            "required": ["collection"]
+        }
+
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            db = self.get_database(params)
+            collection = self.validate_collection(params.get("collection"))
+            options = parse_schema_options(params)
+
+            schema = await build_collection_schema(db[collection], **options)
+
+            return self.json_response(schema.to_dict())
+        except Exception as error:
+            return self.handle_error(error)
+
+
+def schema_options_properties() -> Dict[str, Any]:
+    """스키마 추론 도구 공통 입력 속성"""
+    return {
+        "sampleSize": {
+            "type": "number",
+            "description": "Number of documents to sample; a cached schema built from a smaller sample "
+                           "is sampled again, and documentsSampled reports how many documents were analysed",
+            "default": 100,
+            "minimum": 1,
+            "maximum": MAX_SAMPLE_SIZE
+        },
+        "sampling": {
+            "type": "string",
+            "enum": list(SAMPLING_STRATEGIES),
+            "description": "Sampling strategy (defaults to server-side $sample)"
+        },
+        "countStrategy": {
+            "type": "string",
+            "enum": list(COUNT_STRATEGIES),
+            "description": "How to count documents: metadata estimate, exact count, "
+                           "or exact count bounded by time with estimate fallback"
+        },
+        "refresh": {
+            "type": "boolean",
+            "description": "Ignore the cached schema and sample again",
+            "default": False
+        },
+        **READ_OPTION_PROPERTIES
+    }
+
+
+def parse_schema_options(params: Dict[str, Any]) -> Dict[str, Any]:
+    """공통 입력을 build_collection_schema 인자로 변환"""
+    sample_size = params.get("sampleSize")
+    sample_size = 100 if sample_size is None else int(sample_size)
+    if sample_size < 1:
+        raise ValueError("sampleSize must be at least 1")
+    return {
+        "sample_size": min(sample_size, MAX_SAMPLE_SIZE),
+        "use_cache": not params.get("refresh", False),
+        "count_strategy": params.get("countStrategy"),
+        "sampling": SamplingEngine(params.get("sampling")),
+    }
@@ -0,0 +1,78 @@
+import asyncio
+from typing import Dict, Any
+
+from .collection_schema import parse_schema_options, schema_options_properties
+from ..base.tool import BaseTool, TARGET_PROPERTIES
+from ...mongodb.schema import build_collection_schema
+
+# 동시 추론 컬렉션 수 기본값 및 상한
+DEFAULT_CONCURRENCY = 4
+MAX_CONCURRENCY = 16
+
+
+class DatabaseSchemaTool(BaseTool):
+    """데이터베이스 전체 스키마 추론 도구"""
+
+    read_only = True
+
+    @property
+    def name(self) -> str:
+        return "databaseSchema"
+
+    @property
+    def description(self) -> str:
+        return "Infer the schemas of all (or selected) collections in the database concurrently"
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "collections": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Collections to include (defaults to every collection, excluding views)"
+                },
+                "concurrency": {
+                    "type": "number",
+                    "description": "Maximum number of collections inferred at the same time",
+                    "default": DEFAULT_CONCURRENCY,
+                    "minimum": 1,
+                    "maximum": MAX_CONCURRENCY
+                },
+                **schema_options_properties(),
+                **TARGET_PROPERTIES
+            }
+        }
+
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            db = self.get_database(params)
+            options = parse_schema_options(params)
+            concurrency = max(1, min(int(params.get("concurrency", DEFAULT_CONCURRENCY)), MAX_CONCURRENCY))
+
+            names = params.get("collections")
+            if names is None:
+                names = [
+                    name for name in await db.list_collection_names(filter={"type": "collection"})
+                    if not name.startswith("system.")
+                ]
+            elif not isinstance(names, list):
+                raise ValueError("Collections must be an array of strings")
+            names = [self.validate_collection(name) for name in names]
+
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def infer(name: str) -> Dict[str, Any]:
+                async with semaphore:
+                    try:
+                        schema = await build_collection_schema(db[name], **options)
+                        return schema.to_dict()
+                    except Exception as error:
+                        return {"collection": name, "error": str(error)}
+
+            schemas = await asyncio.gather(*(infer(name) for name in names))
+
+            return self.json_response({"database": db.name, "collections": schemas})
+        except Exception as error:
+            return self.handle_error(error)
@@ -1,12 +1,19 @@
 from typing import Dict, Any
 
-from ..base.tool import BaseTool, ToolParams
-from ...mongodb.client import db
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ..base.tool import BaseTool, ToolParams, READ_OPTION_PROPERTIES, TARGET_PROPERTIES
+from ...mongodb.read_routing import read_command_batch
+
+# 반환할 최대 컬렉션 수
+MAX_COLLECTIONS = 100
 
 
 class ListCollectionsTool(BaseTool):
     """컬렉션 목록 조회 도구"""
 
+    read_only = True
+
     @property
     def name(self) -> str:
         return "listCollections"
@@ -19,22 +26,19 @@ class ListCollectionsTool(BaseTool):
     def input_schema(self) -> Dict[str, Any]:
         return {
             "type": "object",
-            "properties": {}
+            "properties": {**TARGET_PROPERTIES, **READ_OPTION_PROPERTIES}
         }
 
-    async def execute(self, _params: ToolParams) -> Dict[str, Any]:
+    async def execute(self, params: ToolParams) -> Dict[str, Any]:
         try:
-            collections = await db.list_collections().to_list(length=100)
-            collections_data = [{"name": c["name"], "type": c["type"]} for c in collections]
-
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": str(collections_data)
-                    }
-                ],
-                "isError": False
-            }
+            db = self.get_database(params)
+            return await self.cached_response(db, None, {}, lambda: self._list_collections(db))
         except Exception as error:
             return self.handle_error(error)
+
+    async def _list_collections(self, db: AsyncIOMotorDatabase) -> Dict[str, Any]:
+        """컬렉션 목록 조회 (읽기 설정에 따라 세컨더리에서 조회)"""
+        collections = (await read_command_batch(db, {"listCollections": 1}))[:MAX_COLLECTIONS]
+        collections_data = [{"name": c["name"], "type": c["type"]} for c in collections]
+
+        return self.json_response(collections_data)
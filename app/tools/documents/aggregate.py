@@ -0,0 +1,174 @@
+from typing import Dict, Any, List, Optional, Tuple
+
+from ..base.encoder import encode_documents, encode_json
+from ..base.tool import BaseTool, PRIORITY_WRITE, READ_OPTION_PROPERTIES, TARGET_PROPERTIES
+from ...mongodb.query_shapes import pipeline_shape
+
+# 결과 문서 수 / 직렬화 크기 상한
+DEFAULT_RESULT_LIMIT = 100
+MAX_RESULT_LIMIT = 1000
+DEFAULT_MAX_RESULT_BYTES = 1024 * 1024
+MAX_RESULT_BYTES = 16 * 1024 * 1024
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_MAX_TIME_MS = 30000
+
+# 파이프라인 마지막에만 올 수 있는 쓰기 스테이지
+WRITE_STAGES = ("$out", "$merge")
+
+
+class AggregateTool(BaseTool):
+    """집계 파이프라인 실행 도구
+
+    $out/$merge가 없는 파이프라인만 읽기로 취급하며, 쓰기 스테이지가 있는 호출은
+    프라이머리에서 쓰기 우선순위로 실행
+    """
+
+    read_only = True
+
+    @property
+    def name(self) -> str:
+        return "aggregate"
+
+    @property
+    def description(self) -> str:
+        return ("Run an aggregation pipeline on a collection and return the results in bounded batches. "
+                "A pipeline ending in $out or $merge writes its results and always runs on the primary")
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "collection": {
+                    "type": "string",
+                    "description": "Name of the collection to aggregate"
+                },
+                "pipeline": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": "Aggregation pipeline stages"
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Maximum result documents to return",
+                    "default": DEFAULT_RESULT_LIMIT,
+                    "minimum": 1,
+                    "maximum": MAX_RESULT_LIMIT
+                },
+                "maxResultBytes": {
+                    "type": "number",
+                    "description": "Stop reading results once the serialized output reaches this size",
+                    "default": DEFAULT_MAX_RESULT_BYTES,
+                    "maximum": MAX_RESULT_BYTES
+                },
+                "allowDiskUse": {
+                    "type": "boolean",
+                    "description": "Allow stages to write temporary files when exceeding the memory limit",
+                    "default": False
+                },
+                "maxTimeMS": {
+                    "type": "number",
+                    "description": "Server-side time limit for the aggregation in milliseconds",
+                    "default": DEFAULT_MAX_TIME_MS
+                },
+                "batchSize": {
+                    "type": "number",
+                    "description": "Number of documents fetched from the server per batch",
+                    "default": DEFAULT_BATCH_SIZE
+                },
+                **READ_OPTION_PROPERTIES,
+                **TARGET_PROPERTIES
+            },
+            "required": ["collection", "pipeline"]
+        }
+
+    def call_priority(self, params: Dict[str, Any]) -> int:
+        """$out/$merge 파이프라인은 쓰기 우선순위로 스케줄링"""
+        pipeline = params.get("pipeline")
+        if isinstance(pipeline, list) and get_write_target(pipeline) is not None:
+            return PRIORITY_WRITE
+        return self.priority
+
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            collection = self.validate_collection(params.get("collection"))
+            pipeline = params.get("pipeline")
+            limit = max(1, min(int(params.get("limit", DEFAULT_RESULT_LIMIT)), MAX_RESULT_LIMIT))
+            max_bytes = max(1, min(int(params.get("maxResultBytes", DEFAULT_MAX_RESULT_BYTES)), MAX_RESULT_BYTES))
+            batch_size = max(1, min(int(params.get("batchSize", DEFAULT_BATCH_SIZE)), limit + 1))
+
+            if not isinstance(pipeline, list) or not all(isinstance(stage, dict) for stage in pipeline):
+                raise ValueError("Pipeline must be an array of stage objects")
+
+            write_target = get_write_target(pipeline)
+            # $out/$merge 파이프라인은 프라이머리에서 실행
+            db = self.get_database(params, route_reads=write_target is None)
+            self.record_query_shape(db, collection, pipeline_shape(pipeline))
+
+            if write_target is None:
+                # 서버가 필요 이상의 결과를 만들지 않도록 상한 스테이지 추가 (초과 여부 확인용 1건 포함)
+                pipeline = pipeline + [{"$limit": limit + 1}]
+
+            cursor = db[collection].aggregate(
+                pipeline,
+                allowDiskUse=bool(params.get("allowDiskUse", False)),
+                maxTimeMS=int(params.get("maxTimeMS", DEFAULT_MAX_TIME_MS)),
+                batchSize=batch_size
+            )
+
+            # 배치 단위로 받으며 문서를 하나씩 직렬화
+            encoded: List[str] = []
+            total_bytes = 0
+            truncated_by: Optional[str] = None
+            try:
+                async for doc in cursor:
+                    if len(encoded) == limit:
+                        truncated_by = "limit"
+                        break
+                    text = encode_json(doc)
+                    if total_bytes + len(text) > max_bytes:
+                        truncated_by = "size"
+                        break
+                    encoded.append(text)
+                    total_bytes += len(text)
+            finally:
+                # 오류(maxTimeMS 초과 등)로 중단되어도 서버 커서를 바로 정리
+                await cursor.close()
+                if write_target is not None:
+                    target_db, target_collection = write_target
+                    # $merge는 실패해도 일부 문서를 썼을 수 있으므로 항상 무효화하며,
+                    # 대상 컬렉션을 알 수 없으면 대상 데이터베이스 전체 무효화
+                    self.invalidate_collection(db.client[target_db] if target_db else db, target_collection,
+                                               drop=True)
+
+            return self.text_response(encode_documents(
+                encoded, count=len(encoded), truncated=truncated_by is not None, truncatedBy=truncated_by
+            ), documents=len(encoded))
+        except Exception as error:
+            return self.handle_error(error)
+
+
+def get_write_target(pipeline: List[Dict[str, Any]]) -> Optional[Tuple[Optional[str], Optional[str]]]:
+    """$out/$merge 스테이지가 쓰는 (데이터베이스, 컬렉션) 반환
+
+    쓰기 스테이지가 없으면 None. 데이터베이스가 지정되지 않았으면 None(현재 데이터베이스),
+    컬렉션을 알 수 없으면 None
+    """
+    if not pipeline or not isinstance(pipeline[-1], dict):
+        return None
+    stage = pipeline[-1]
+    for name in WRITE_STAGES:
+        if name not in stage:
+            continue
+        spec = stage[name]
+        if isinstance(spec, dict) and name == "$merge":
+            spec = spec.get("into")
+        if isinstance(spec, str):
+            return None, spec
+        if isinstance(spec, dict):
+            database = spec.get("db")
+            collection = spec.get("coll")
+            return (database if isinstance(database, str) and database else None,
+                    collection if isinstance(collection, str) and collection else None)
+        return None, None
+    return None
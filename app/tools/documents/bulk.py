@@ -0,0 +1,253 @@
+import asyncio
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
+
+import bson
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import DeleteMany, DeleteOne, InsertOne, ReplaceOne, UpdateMany, UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+
+# 배치 한도 (BSON 최대 메시지 크기 16MB에서 명령 오버헤드 여유분 제외, 최대 쓰기 배치 100,000건)
+MAX_BATCH_BYTES = 16 * 1024 * 1024 - 16 * 1024
+MAX_BATCH_OPS = 100_000
+# unordered 모드에서 동시에 전송할 배치 수
+DEFAULT_UNORDERED_CONCURRENCY = 4
+# 응답에 포함할 개별 오류 수 상한
+MAX_REPORTED_ERRORS = 100
+# 응답에 포함할 삽입 문서 _id 수 상한
+MAX_REPORTED_IDS = 1000
+
+
+def document_size(*docs: Optional[Dict[str, Any]]) -> int:
+    """연산에 포함된 문서들의 BSON 크기 합계"""
+    return sum(len(bson.encode(doc)) for doc in docs if doc)
+
+
+def parse_write_model(op: Any, index: int) -> Tuple[Any, int]:
+    """bulkWrite 연산 사양을 pymongo 쓰기 모델과 예상 크기로 변환
+
+    MongoDB 셸 형식을 따름: {"insertOne": {"document": {...}}}, {"updateOne": {"filter": ..., "update": ...}} 등
+    """
+    if not isinstance(op, dict) or len(op) != 1:
+        raise ValueError(f"Operation {index} must be an object with exactly one operation type")
+
+    op_type, spec = next(iter(op.items()))
+    if not isinstance(spec, dict):
+        raise ValueError(f"Operation {index} ({op_type}) must be an object")
+
+    if op_type == "insertOne":
+        document = spec.get("document")
+        if not isinstance(document, dict):
+            raise ValueError(f"Operation {index} (insertOne) requires a 'document' object")
+        return InsertOne(document), document_size(document)
+
+    filter_query = spec.get("filter")
+    if not isinstance(filter_query, dict):
+        raise ValueError(f"Operation {index} ({op_type}) requires a 'filter' object")
+
+    if op_type in ("updateOne", "updateMany"):
+        update = spec.get("update")
+        if not isinstance(update, (dict, list)) or not update:
+            raise ValueError(f"Operation {index} ({op_type}) requires an 'update' object or pipeline")
+        model = UpdateOne if op_type == "updateOne" else UpdateMany
+        size = document_size(filter_query, update if isinstance(update, dict) else {"p": update})
+        return model(filter_query, update, upsert=bool(spec.get("upsert", False))), size
+
+    if op_type == "replaceOne":
+        replacement = spec.get("replacement")
+        if not isinstance(replacement, dict):
+            raise ValueError(f"Operation {index} (replaceOne) requires a 'replacement' object")
+        return (ReplaceOne(filter_query, replacement, upsert=bool(spec.get("upsert", False))),
+                document_size(filter_query, replacement))
+
+    if op_type == "deleteOne":
+        return DeleteOne(filter_query), document_size(filter_query)
+    if op_type == "deleteMany":
+        return DeleteMany(filter_query), document_size(filter_query)
+
+    raise ValueError(f"Operation {index} has unknown type '{op_type}'")
+
+
+def chunk_requests(requests: List[Any], sizes: List[int],
+                   max_bytes: int = MAX_BATCH_BYTES, max_ops: int = MAX_BATCH_OPS) -> List[Tuple[int, List[Any]]]:
+    """크기/건수 한도에 맞춰 연산을 (시작 인덱스, 배치) 목록으로 분할"""
+    chunks: List[Tuple[int, List[Any]]] = []
+    start = 0
+    current: List[Any] = []
+    current_bytes = 0
+
+    for index, (request, size) in enumerate(zip(requests, sizes)):
+        if size > max_bytes:
+            raise ValueError(f"Operation {index} exceeds the maximum BSON document size")
+        if current and (len(current) >= max_ops or current_bytes + size > max_bytes):
+            chunks.append((start, current))
+            start, current, current_bytes = index, [], 0
+        current.append(request)
+        current_bytes += size
+
+    if current:
+        chunks.append((start, current))
+    return chunks
+
+
+class BulkWriteSummary:
+    """배치별 결과를 합산한 쓰기 결과"""
+
+    def __init__(self, total_ops: int, ordered: bool):
+        self.total_ops = total_ops
+        self.ordered = ordered
+        self.batches = 0
+        self.inserted_count = 0
+        self.matched_count = 0
+        self.modified_count = 0
+        self.deleted_count = 0
+        self.upserted_count = 0
+        self.upserted_ids: Dict[int, Any] = {}
+        self.write_errors: List[Dict[str, Any]] = []
+        self.write_concern_errors: List[Dict[str, Any]] = []
+        self.error_count = 0
+        # 서버 응답을 받지 못해 적용 여부를 알 수 없는 배치 (네트워크 오류, 타임아웃 등)
+        self.batch_errors: List[Dict[str, Any]] = []
+        self.inserted_ids: Dict[int, Any] = {}
+        self.inserted_ids_truncated = False
+        # 적용되지 않았거나 적용 여부를 알 수 없는 연산 인덱스
+        self._failed: Set[int] = set()
+        # ordered 모드에서 실행이 중단된 연산 인덱스 (이후 연산은 적용되지 않음)
+        self._stopped_at: Optional[int] = None
+
+    def add_result(self, offset: int, result: Any):
+        """BulkWriteResult 합산"""
+        self.batches += 1
+        self.inserted_count += result.inserted_count
+        self.matched_count += result.matched_count
+        self.modified_count += result.modified_count
+        self.deleted_count += result.deleted_count
+        self.upserted_count += result.upserted_count
+        for index, upserted_id in (result.upserted_ids or {}).items():
+            self.upserted_ids[offset + index] = upserted_id
+
+    def add_error(self, offset: int, error: BulkWriteError):
+        """BulkWriteError 상세 정보 합산 (인덱스는 전체 연산 기준으로 보정)"""
+        details = error.details or {}
+        self.batches += 1
+        self.inserted_count += details.get("nInserted", 0)
+        self.matched_count += details.get("nMatched", 0)
+        self.modified_count += details.get("nModified", 0)
+        self.deleted_count += details.get("nRemoved", 0)
+        self.upserted_count += details.get("nUpserted", 0)
+        for upserted in details.get("upserted", []):
+            self.upserted_ids[offset + upserted["index"]] = upserted["_id"]
+        for write_error in details.get("writeErrors", []):
+            self.error_count += 1
+            self._failed.add(offset + write_error.get("index", 0))
+            if len(self.write_errors) < MAX_REPORTED_ERRORS:
+                self.write_errors.append({
+                    "index": offset + write_error.get("index", 0),
+                    "code": write_error.get("code"),
+                    "errmsg": write_error.get("errmsg")
+                })
+        for concern_error in details.get("writeConcernErrors", []):
+            self.write_concern_errors.append({
+                "code": concern_error.get("code"),
+                "errmsg": concern_error.get("errmsg")
+            })
+
+    def add_failure(self, offset: int, count: int, error: PyMongoError):
+        """응답 없이 실패한 배치 기록 (앞선 배치의 결과는 유지)"""
+        self._failed.update(range(offset, offset + count))
+        self.batch_errors.append({
+            "index": offset,
+            "operations": count,
+            "code": getattr(error, "code", None),
+            "errmsg": str(error)
+        })
+
+    def stop(self, index: int):
+        """ordered 모드에서 index 이후 연산이 실행되지 않았음을 기록"""
+        self._stopped_at = index
+
+    def applied(self, index: int) -> bool:
+        """연산이 적용되었는지 확인"""
+        if self._stopped_at is not None and index >= self._stopped_at:
+            return False
+        return index not in self._failed
+
+    def record_inserted_ids(self, documents: Iterable[Tuple[int, Dict[str, Any]]]):
+        """삽입된 문서의 _id 기록 (pymongo가 삽입 전에 문서에 _id를 추가함)"""
+        for index, document in documents:
+            if not self.applied(index) or "_id" not in document:
+                continue
+            if len(self.inserted_ids) >= MAX_REPORTED_IDS:
+                self.inserted_ids_truncated = True
+                break
+            self.inserted_ids[index] = document["_id"]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """사전 형태로 변환"""
+        result = {
+            "acknowledged": True,
+            "ordered": self.ordered,
+            "totalOperations": self.total_ops,
+            "batches": self.batches,
+            "insertedCount": self.inserted_count,
+            "insertedIds": {str(index): str(value) for index, value in sorted(self.inserted_ids.items())},
+            "matchedCount": self.matched_count,
+            "modifiedCount": self.modified_count,
+            "deletedCount": self.deleted_count,
+            "upsertedCount": self.upserted_count,
+            "upsertedIds": {str(index): str(value) for index, value in sorted(self.upserted_ids.items())},
+            "errorCount": self.error_count,
+            "writeErrors": self.write_errors
+        }
+        if self.error_count > len(self.write_errors):
+            result["writeErrorsTruncated"] = True
+        if self.inserted_ids_truncated:
+            result["insertedIdsTruncated"] = True
+        if self.write_concern_errors:
+            result["writeConcernErrors"] = self.write_concern_errors
+        if self.batch_errors:
+            result["batchErrors"] = self.batch_errors
+        return result
+
+
+async def execute_bulk(collection: AsyncIOMotorCollection, requests: List[Any], sizes: List[int],
+                       ordered: bool = True,
+                       concurrency: int = DEFAULT_UNORDERED_CONCURRENCY) -> BulkWriteSummary:
+    """배치 단위로 bulk_write 실행
+
+    ordered 모드는 배치를 순서대로 보내고 첫 오류에서 중단하며,
+    unordered 모드는 서버가 병렬 적용할 수 있도록 배치를 동시에 전송.
+    배치 실패는 예외로 전파하지 않고 결과에 기록하여 앞서 적용된 배치의 결과를 유지
+    """
+    summary = BulkWriteSummary(len(requests), ordered)
+    chunks = chunk_requests(requests, sizes)
+
+    if ordered:
+        for offset, chunk in chunks:
+            try:
+                summary.add_result(offset, await collection.bulk_write(chunk, ordered=True))
+            except BulkWriteError as error:
+                summary.add_error(offset, error)
+                write_errors = (error.details or {}).get("writeErrors")
+                summary.stop(offset + (write_errors[0].get("index", 0) if write_errors else len(chunk)))
+                break
+            except PyMongoError as error:
+                summary.add_failure(offset, len(chunk), error)
+                summary.stop(offset)
+                break
+        return summary
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run_chunk(offset: int, chunk: List[Any]):
+        async with semaphore:
+            try:
+                summary.add_result(offset, await collection.bulk_write(chunk, ordered=False))
+            except BulkWriteError as error:
+                summary.add_error(offset, error)
+            except PyMongoError as error:
+                summary.add_failure(offset, len(chunk), error)
+
+    await asyncio.gather(*(run_chunk(offset, chunk) for offset, chunk in chunks))
+    summary.write_errors.sort(key=lambda e: e["index"])
+    summary.batch_errors.sort(key=lambda e: e["index"])
+    return summary
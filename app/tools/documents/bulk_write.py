@@ -0,0 +1,77 @@
+from typing import Dict, Any
+
+from .bulk import execute_bulk, parse_write_model
+from ..base.tool import BaseTool, PRIORITY_WRITE, TARGET_PROPERTIES
+
+
+class BulkWriteTool(BaseTool):
+    """혼합 쓰기 연산 일괄 실행 도구"""
+
+    priority = PRIORITY_WRITE
+
+    @property
+    def name(self) -> str:
+        return "bulkWrite"
+
+    @property
+    def description(self) -> str:
+        return ("Execute a list of insertOne, updateOne, updateMany, replaceOne, deleteOne and deleteMany "
+                "operations on a collection in size-limited batches")
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "collection": {
+                    "type": "string",
+                    "description": "Name of the collection to write to"
+                },
+                "operations": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": "Operations in MongoDB shell form, e.g. {\"insertOne\": {\"document\": {...}}}, "
+                                   "{\"updateOne\": {\"filter\": {...}, \"update\": {...}, \"upsert\": false}}, "
+                                   "{\"deleteMany\": {\"filter\": {...}}}"
+                },
+                "ordered": {
+                    "type": "boolean",
+                    "description": "Stop at the first error (true) or apply every valid operation "
+                                   "with batches applied in parallel (false)",
+                    "default": True
+                },
+                **TARGET_PROPERTIES
+            },
+            "required": ["collection", "operations"]
+        }
+
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            db = self.get_database(params)
+            collection = self.validate_collection(params.get("collection"))
+            operations = params.get("operations")
+            ordered = params.get("ordered", True)
+
+            if not isinstance(operations, list) or not operations:
+                raise ValueError("Operations must be a non-empty array")
+
+            requests = []
+            sizes = []
+            inserts = []
+            for index, op in enumerate(operations):
+                request, size = parse_write_model(op, index)
+                requests.append(request)
+                sizes.append(size)
+                if "insertOne" in op:
+                    inserts.append((index, op["insertOne"]["document"]))
+
+            try:
+                summary = await execute_bulk(db[collection], requests, sizes, ordered=ordered)
+            finally:
+                # 실패해도 앞선 배치는 이미 적용되었을 수 있으므로 항상 무효화
+                self.invalidate_collection(db, collection, drop=True)
+            summary.record_inserted_ids(inserts)
+
+            return self.json_response(summary.to_dict())
+        except Exception as error:
+            return self.handle_error(error)
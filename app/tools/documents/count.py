@@ -0,0 +1,111 @@
+from typing import Dict, Any
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from .find import parse_hint
+from ..base.tool import BaseTool, READ_OPTION_PROPERTIES, TARGET_PROPERTIES
+from ...mongodb.query_shapes import extract_shape
+
+DEFAULT_MAX_TIME_MS = 30000
+
+
+class CountTool(BaseTool):
+    """서버 측 문서 수 집계 도구"""
+
+    read_only = True
+
+    @property
+    def name(self) -> str:
+        return "count"
+
+    @property
+    def description(self) -> str:
+        return ("Count documents matching a filter on the server. Without a filter the count comes from "
+                "collection metadata (estimatedDocumentCount) unless exact=true")
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "collection": {
+                    "type": "string",
+                    "description": "Name of the collection to count"
+                },
+                "filter": {
+                    "type": "object",
+                    "description": "MongoDB query filter",
+                    "default": {}
+                },
+                "exact": {
+                    "type": "boolean",
+                    "description": "Count documents exactly even when the filter is empty",
+                    "default": False
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Stop counting after this many matches"
+                },
+                "skip": {
+                    "type": "number",
+                    "description": "Number of matching documents to skip before counting"
+                },
+                "hint": {
+                    "type": ["string", "object"],
+                    "description": "Index name or key specification the count must use"
+                },
+                "maxTimeMS": {
+                    "type": "number",
+                    "description": "Server-side time limit in milliseconds",
+                    "default": DEFAULT_MAX_TIME_MS
+                },
+                **READ_OPTION_PROPERTIES,
+                **TARGET_PROPERTIES
+            },
+            "required": ["collection"]
+        }
+
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            db = self.get_database(params)
+            collection = self.validate_collection(params.get("collection"))
+            filter_query = params.get("filter") or {}
+            if not isinstance(filter_query, dict):
+                raise ValueError("Filter must be an object")
+
+            options: Dict[str, Any] = {"maxTimeMS": int(params.get("maxTimeMS", DEFAULT_MAX_TIME_MS))}
+            for option in ("limit", "skip"):
+                if params.get(option):
+                    options[option] = int(params[option])
+            hint = parse_hint(params.get("hint"))
+            if hint:
+                options["hint"] = hint
+
+            # 필터/limit/skip이 없으면 컬렉션 메타데이터의 추정치 사용 (문서를 읽지 않음)
+            estimated = not filter_query and not params.get("exact") and set(options) <= {"maxTimeMS"}
+            if filter_query:
+                self.record_query_shape(db, collection, extract_shape(filter_query))
+
+            key_params = {
+                "filter": filter_query,
+                "estimated": estimated,
+                "limit": options.get("limit"),
+                "skip": options.get("skip"),
+                "hint": hint if isinstance(hint, str) or hint is None else [list(item) for item in hint]
+            }
+            return await self.cached_response(db, collection, key_params, lambda: self._count(
+                db, collection, filter_query, estimated, options
+            ))
+        except Exception as error:
+            return self.handle_error(error)
+
+    async def _count(self, db: AsyncIOMotorDatabase, collection: str, filter_query: Dict[str, Any],
+                     estimated: bool, options: Dict[str, Any]) -> Dict[str, Any]:
+        """문서 수 조회"""
+        if estimated:
+            count = await db[collection].estimated_document_count(maxTimeMS=options["maxTimeMS"])
+            method = "estimated"
+        else:
+            count = await db[collection].count_documents(filter_query, **options)
+            method = "exact"
+        return self.json_response({"count": count, "method": method})
@@ -0,0 +1,123 @@
+from typing import Dict, Any, List
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ..base.tool import BaseTool, READ_OPTION_PROPERTIES, TARGET_PROPERTIES
+from ...mongodb.query_shapes import extract_shape
+
+DEFAULT_GROUP_LIMIT = 100
+MAX_GROUP_LIMIT = 10000
+DEFAULT_MAX_TIME_MS = 30000
+
+
+class CountByFieldTool(BaseTool):
+    """필드 값별 문서 수 집계 도구"""
+
+    read_only = True
+
+    @property
+    def name(self) -> str:
+        return "countByField"
+
+    @property
+    def description(self) -> str:
+        return ("Count documents per value of a field with a server-side $group, "
+                "returning the most frequent values first")
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "collection": {
+                    "type": "string",
+                    "description": "Name of the collection"
+                },
+                "field": {
+                    "type": "string",
+                    "description": "Field to group by (dot notation allowed)"
+                },
+                "filter": {
+                    "type": "object",
+                    "description": "MongoDB query filter applied before grouping",
+                    "default": {}
+                },
+                "unwind": {
+                    "type": "boolean",
+                    "description": "Count each element of an array field separately",
+                    "default": False
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Maximum number of groups to return",
+                    "default": DEFAULT_GROUP_LIMIT,
+                    "minimum": 1,
+                    "maximum": MAX_GROUP_LIMIT
+                },
+                "allowDiskUse": {
+                    "type": "boolean",
+                    "description": "Allow the $group stage to spill to disk for high-cardinality fields",
+                    "default": False
+                },
+                "maxTimeMS": {
+                    "type": "number",
+                    "description": "Server-side time limit in milliseconds",
+                    "default": DEFAULT_MAX_TIME_MS
+                },
+                **READ_OPTION_PROPERTIES,
+                **TARGET_PROPERTIES
+            },
+            "required": ["collection", "field"]
+        }
+
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            db = self.get_database(params)
+            collection = self.validate_collection(params.get("collection"))
+            field = params.get("field")
+            if not isinstance(field, str) or not field or field.startswith("$"):
+                raise ValueError("Field must be a non-empty field name")
+            filter_query = params.get("filter") or {}
+            if not isinstance(filter_query, dict):
+                raise ValueError("Filter must be an object")
+            limit = max(1, min(int(params.get("limit", DEFAULT_GROUP_LIMIT)), MAX_GROUP_LIMIT))
+
+            pipeline = build_count_pipeline(field, filter_query, bool(params.get("unwind", False)), limit)
+            if filter_query:
+                self.record_query_shape(db, collection, extract_shape(filter_query))
+
+            key_params = {"pipeline": pipeline}
+            return await self.cached_response(db, collection, key_params, lambda: self._count_by_field(
+                db, collection, field, pipeline, limit,
+                bool(params.get("allowDiskUse", False)), int(params.get("maxTimeMS", DEFAULT_MAX_TIME_MS))
+            ))
+        except Exception as error:
+            return self.handle_error(error)
+
+    async def _count_by_field(self, db: AsyncIOMotorDatabase, collection: str, field: str,
+                              pipeline: List[Dict[str, Any]], limit: int, allow_disk_use: bool,
+                              max_time_ms: int) -> Dict[str, Any]:
+        """값별 문서 수 집계"""
+        cursor = db[collection].aggregate(pipeline, allowDiskUse=allow_disk_use, maxTimeMS=max_time_ms)
+        groups = [{"value": group["_id"], "count": group["count"]} async for group in cursor]
+        truncated = len(groups) > limit
+        return self.json_response({
+            "field": field,
+            "groups": groups[:limit],
+            "truncated": truncated
+        }, documents=min(len(groups), limit))
+
+
+def build_count_pipeline(field: str, filter_query: Dict[str, Any], unwind: bool, limit: int) -> List[Dict[str, Any]]:
+    """값별 문서 수 집계 파이프라인 (초과 여부 확인용으로 limit보다 한 그룹 더 조회)"""
+    pipeline: List[Dict[str, Any]] = []
+    if filter_query:
+        pipeline.append({"$match": filter_query})
+    if unwind:
+        pipeline.append({"$unwind": f"${field}"})
+    pipeline.extend([
+        {"$group": {"_id": f"${field}", "count": {"$sum": 1}}},
+        {"$sort": {"count": -1, "_id": 1}},
+        {"$limit": limit + 1}
+    ])
+    return pipeline
@@ -0,0 +1,56 @@
+from typing import Dict, Any
+
+from ..base.tool import BaseTool, PRIORITY_WRITE, TARGET_PROPERTIES
+
+
+class DeleteManyTool(BaseTool):
+    """다중 문서 삭제 도구"""
+
+    priority = PRIORITY_WRITE
+
+    @property
+    def name(self) -> str:
+        return "deleteMany"
+
+    @property
+    def description(self) -> str:
+        return "Delete all documents matching a filter from a collection"
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "collection": {
+                    "type": "string",
+                    "description": "Name of the collection to delete from"
+                },
+                "filter": {
+                    "type": "object",
+                    "description": "Filter to select the documents to delete (must not be empty)"
+                },
+                **TARGET_PROPERTIES
+            },
+            "required": ["collection", "filter"]
+        }
+
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            db = self.get_database(params)
+            collection = self.validate_collection(params.get("collection"))
+            # 빈 필터로 전체 삭제되는 것을 방지
+            filter_query = self.validate_object(params.get("filter"), "Filter")
+
+            # 문서 삭제
+            try:
+                result = await db[collection].delete_many(filter_query)
+            finally:
+                # 실패해도 일부 문서는 이미 삭제되었을 수 있으므로 항상 무효화
+                self.invalidate_collection(db, collection, drop=True)
+
+            return self.json_response({
+                "deletedCount": result.deleted_count,
+                "acknowledged": result.acknowledged
+            })
+        except Exception as error:
+            return self.handle_error(error)
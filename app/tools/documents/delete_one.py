@@ -1,13 +1,13 @@
-import json
 from typing import Dict, Any
 
-from ..base.tool import BaseTool
-from ...mongodb.client import db
+from ..base.tool import BaseTool, PRIORITY_WRITE, TARGET_PROPERTIES
 
 
 class DeleteOneTool(BaseTool):
     """문서 삭제 도구"""
 
+    priority = PRIORITY_WRITE
+
     @property
     def name(self) -> str:
         return "deleteOne"
@@ -28,30 +28,25 @@ class DeleteOneTool(BaseTool):
                 "filter": {
                     "type": "object",
                     "description": "Filter to select the document to delete"
-                }
+                },
+                **TARGET_PROPERTIES
             },
             "required": ["collection", "filter"]
         }
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         try:
+            db = self.get_database(params)
             collection = self.validate_collection(params.get("collection"))
             filter_query = self.validate_object(params.get("filter"), "Filter")
 
             # 문서 삭제
             result = await db[collection].delete_one(filter_query)
+            self.invalidate_collection(db, collection, drop=True)
 
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps({
-                            "deletedCount": result.deleted_count,
-                            "acknowledged": result.acknowledged
-                        }, indent=2)
-                    }
-                ],
-                "isError": False
-            }
+            return self.json_response({
+                "deletedCount": result.deleted_count,
+                "acknowledged": result.acknowledged
+            })
         except Exception as error:
             return self.handle_error(error)
@@ -0,0 +1,102 @@
+from typing import Dict, Any
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ..base.tool import BaseTool, READ_OPTION_PROPERTIES, TARGET_PROPERTIES
+from ...mongodb.query_shapes import extract_shape
+
+DEFAULT_VALUE_LIMIT = 1000
+MAX_VALUE_LIMIT = 10000
+DEFAULT_MAX_TIME_MS = 30000
+
+
+class DistinctTool(BaseTool):
+    """필드의 고유 값 조회 도구"""
+
+    read_only = True
+
+    @property
+    def name(self) -> str:
+        return "distinct"
+
+    @property
+    def description(self) -> str:
+        return "List the distinct values of a field across documents matching a filter"
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "collection": {
+                    "type": "string",
+                    "description": "Name of the collection"
+                },
+                "field": {
+                    "type": "string",
+                    "description": "Field to collect distinct values for (dot notation allowed)"
+                },
+                "filter": {
+                    "type": "object",
+                    "description": "MongoDB query filter",
+                    "default": {}
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Maximum number of values to return",
+                    "default": DEFAULT_VALUE_LIMIT,
+                    "minimum": 1,
+                    "maximum": MAX_VALUE_LIMIT
+                },
+                "collation": {
+                    "type": "object",
+                    "description": "Collation for comparing string values, e.g. {\"locale\": \"en\", \"strength\": 2}"
+                },
+                "maxTimeMS": {
+                    "type": "number",
+                    "description": "Server-side time limit in milliseconds",
+                    "default": DEFAULT_MAX_TIME_MS
+                },
+                **READ_OPTION_PROPERTIES,
+                **TARGET_PROPERTIES
+            },
+            "required": ["collection", "field"]
+        }
+
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            db = self.get_database(params)
+            collection = self.validate_collection(params.get("collection"))
+            field = params.get("field")
+            if not isinstance(field, str) or not field:
+                raise ValueError("Field must be a non-empty string")
+            filter_query = params.get("filter") or {}
+            if not isinstance(filter_query, dict):
+                raise ValueError("Filter must be an object")
+            limit = max(1, min(int(params.get("limit", DEFAULT_VALUE_LIMIT)), MAX_VALUE_LIMIT))
+
+            options: Dict[str, Any] = {"maxTimeMS": int(params.get("maxTimeMS", DEFAULT_MAX_TIME_MS))}
+            if params.get("collation"):
+                options["collation"] = params["collation"]
+
+            if filter_query:
+                self.record_query_shape(db, collection, extract_shape(filter_query))
+
+            key_params = {"field": field, "filter": filter_query, "limit": limit,
+                          "collation": options.get("collation")}
+            return await self.cached_response(db, collection, key_params, lambda: self._distinct(
+                db, collection, field, filter_query, limit, options
+            ))
+        except Exception as error:
+            return self.handle_error(error)
+
+    async def _distinct(self, db: AsyncIOMotorDatabase, collection: str, field: str,
+                        filter_query: Dict[str, Any], limit: int, options: Dict[str, Any]) -> Dict[str, Any]:
+        """고유 값 조회"""
+        values = await db[collection].distinct(field, filter_query, **options)
+        return self.json_response({
+            "field": field,
+            "values": values[:limit],
+            "count": len(values),
+            "truncated": len(values) > limit
+        }, documents=min(len(values), limit))
@@ -0,0 +1,249 @@
+import os
+from typing import Dict, Any, List, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ..base.tool import BaseTool, READ_OPTION_PROPERTIES, TARGET_PROPERTIES
+
+VERBOSITIES = ("queryPlanner", "executionStats", "allPlansExecution")
+
+# find의 실행 계획 검사 모드
+PLAN_CHECK_OFF = "off"
+PLAN_CHECK_WARN = "warn"
+PLAN_CHECK_REFUSE = "refuse"
+PLAN_CHECK_MODES = (PLAN_CHECK_OFF, PLAN_CHECK_WARN, PLAN_CHECK_REFUSE)
+
+DEFAULT_PLAN_CHECK = os.getenv("MCP_FIND_PLAN_CHECK", PLAN_CHECK_OFF)
+# 이 문서 수(추정치) 이상인 컬렉션에서만 컬렉션 스캔을 검사
+COLLSCAN_MIN_DOCS = int(os.getenv("MCP_COLLSCAN_MIN_DOCS", "100000"))
+
+
+async def explain_command(db: AsyncIOMotorDatabase, command: Dict[str, Any],
+                          verbosity: str = "queryPlanner") -> Dict[str, Any]:
+    """find/aggregate 명령의 실행 계획 조회"""
+    if verbosity not in VERBOSITIES:
+        raise ValueError(f"Unknown verbosity: {verbosity}. Expected one of {', '.join(VERBOSITIES)}")
+    # 실제 쿼리가 실행될 멤버의 계획을 보도록 핸들의 읽기 설정으로 실행
+    return await db.command({"explain": command, "verbosity": verbosity}, read_preference=db.read_preference)
+
+
+def find_command(collection: str, filter_query: Dict[str, Any], projection: Optional[Dict[str, Any]] = None,
+                 sort: Optional[Any] = None, limit: Optional[int] = None, skip: Optional[int] = None,
+                 hint: Optional[Any] = None, collation: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """explain에 전달할 find 명령 구성 (sort/hint는 객체 또는 [필드, 방향] 목록)"""
+    command: Dict[str, Any] = {"find": collection, "filter": filter_query or {}}
+    if projection:
+        command["projection"] = projection
+    if sort:
+        command["sort"] = dict(sort)
+    if skip:
+        command["skip"] = skip
+    if limit:
+        command["limit"] = limit
+    if hint:
+        command["hint"] = hint if isinstance(hint, str) else dict(hint)
+    if collation:
+        command["collation"] = collation
+    return command
+
+
+def _query_planner(explain: Dict[str, Any]) -> Dict[str, Any]:
+    """explain 결과에서 queryPlanner 섹션 찾기 (집계는 첫 $cursor 스테이지 안에 위치)"""
+    if "queryPlanner" in explain:
+        return explain["queryPlanner"]
+    for stage in explain.get("stages", []):
+        cursor = stage.get("$cursor")
+        if isinstance(cursor, dict) and "queryPlanner" in cursor:
+            return cursor["queryPlanner"]
+    # 샤딩 클러스터는 샤드별 계획 중 첫 번째를 사용
+    shards = explain.get("shards") or {}
+    for shard in shards.values():
+        if isinstance(shard, dict):
+            planner = _query_planner(shard)
+            if planner:
+                return planner
+    return {}
+
+
+def _execution_stats(explain: Dict[str, Any]) -> Dict[str, Any]:
+    if "executionStats" in explain:
+        return explain["executionStats"]
+    for stage in explain.get("stages", []):
+        cursor = stage.get("$cursor")
+        if isinstance(cursor, dict) and "executionStats" in cursor:
+            return cursor["executionStats"]
+    return {}
+
+
+def _walk_plan(plan: Dict[str, Any], stages: List[str], indexes: List[str]):
+    """계획 트리를 순회하며 스테이지 이름과 사용 인덱스 수집"""
+    if not isinstance(plan, dict):
+        return
+    # 7.0 이상의 SBE 형식은 winningPlan.queryPlan 아래에 트리가 위치
+    if "queryPlan" in plan and "stage" not in plan:
+        _walk_plan(plan["queryPlan"], stages, indexes)
+        return
+    stage = plan.get("stage")
+    if stage:
+        stages.append(stage)
+    if plan.get("indexName") and plan["indexName"] not in indexes:
+        indexes.append(plan["indexName"])
+    if "inputStage" in plan:
+        _walk_plan(plan["inputStage"], stages, indexes)
+    for child in plan.get("inputStages", []):
+        _walk_plan(child, stages, indexes)
+
+
+def summarize_plan(explain: Dict[str, Any]) -> Dict[str, Any]:
+    """실행 계획 요약 (스테이지, 사용 인덱스, 컬렉션 스캔 여부, 실행 통계)"""
+    planner = _query_planner(explain)
+    stages: List[str] = []
+    indexes: List[str] = []
+    _walk_plan(planner.get("winningPlan", {}), stages, indexes)
+
+    summary: Dict[str, Any] = {
+        "namespace": planner.get("namespace"),
+        "stages": stages,
+        "indexes": indexes,
+        "collectionScan": "COLLSCAN" in stages,
+        "rejectedPlans": len(planner.get("rejectedPlans", []))
+    }
+
+    stats = _execution_stats(explain)
+    if stats:
+        returned = stats.get("nReturned", 0)
+        docs_examined = stats.get("totalDocsExamined", 0)
+        summary["executionStats"] = {
+            "nReturned": returned,
+            "totalKeysExamined": stats.get("totalKeysExamined", 0),
+            "totalDocsExamined": docs_examined,
+            "executionTimeMillis": stats.get("executionTimeMillis", 0),
+            # 반환 문서 1건당 검사한 문서 수 (1에 가까울수록 선택적인 인덱스)
+            "docsExaminedPerReturned": round(docs_examined / returned, 2) if returned else None
+        }
+    return summary
+
+
+async def check_collection_scan(db: AsyncIOMotorDatabase, collection: str, command: Dict[str, Any],
+                                min_docs: int = COLLSCAN_MIN_DOCS) -> Optional[Dict[str, Any]]:
+    """큰 컬렉션에서 컬렉션 스캔이 선택되면 계획 요약 반환, 아니면 None
+
+    필터가 비어 있으면 limit에서 스캔이 멈추므로 검사하지 않음
+    """
+    if not command.get("filter") and not command.get("sort"):
+        return None
+    estimated = await db[collection].estimated_document_count()
+    if estimated < min_docs:
+        return None
+    summary = summarize_plan(await explain_command(db, command))
+    if not summary["collectionScan"]:
+        return None
+    summary["estimatedDocuments"] = estimated
+    return summary
+
+
+class ExplainTool(BaseTool):
+    """쿼리/집계 실행 계획 조회 도구"""
+
+    read_only = True
+
+    @property
+    def name(self) -> str:
+        return "explain"
+
+    @property
+    def description(self) -> str:
+        return ("Show the query plan MongoDB would use for a find filter or aggregation pipeline, "
+                "including the indexes used and whether it scans the whole collection")
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "collection": {
+                    "type": "string",
+                    "description": "Name of the collection"
+                },
+                "filter": {
+                    "type": "object",
+                    "description": "MongoDB query filter to explain",
+                    "default": {}
+                },
+                "projection": {
+                    "type": "object",
+                    "description": "Fields to include/exclude",
+                    "default": {}
+                },
+                "sort": {
+                    "type": "object",
+                    "description": "Sort specification, e.g. {\"createdAt\": -1}"
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Limit applied to the query"
+                },
+                "skip": {
+                    "type": "number",
+                    "description": "Number of documents skipped by the query"
+                },
+                "hint": {
+                    "type": ["string", "object"],
+                    "description": "Index name or key specification to force"
+                },
+                "collation": {
+                    "type": "object",
+                    "description": "Collation used by the query"
+                },
+                "pipeline": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": "Aggregation pipeline to explain instead of a find filter"
+                },
+                "verbosity": {
+                    "type": "string",
+                    "enum": list(VERBOSITIES),
+                    "description": "queryPlanner only plans the query; executionStats and allPlansExecution "
+                                   "also run it to report documents and keys examined",
+                    "default": "queryPlanner"
+                },
+                "includeRaw": {
+                    "type": "boolean",
+                    "description": "Include the full explain output",
+                    "default": False
+                },
+                **READ_OPTION_PROPERTIES,
+                **TARGET_PROPERTIES
+            },
+            "required": ["collection"]
+        }
+
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            db = self.get_database(params)
+            collection = self.validate_collection(params.get("collection"))
+            pipeline = params.get("pipeline")
+
+            if pipeline is not None:
+                if not isinstance(pipeline, list) or not all(isinstance(stage, dict) for stage in pipeline):
+                    raise ValueError("Pipeline must be an array of stage objects")
+                command = {"aggregate": collection, "pipeline": pipeline, "cursor": {}}
+            else:
+                command = find_command(
+                    collection,
+                    params.get("filter", {}),
+                    params.get("projection"),
+                    params.get("sort"),
+                    int(params["limit"]) if params.get("limit") else None,
+                    int(params["skip"]) if params.get("skip") else None,
+                    params.get("hint"),
+                    params.get("collation")
+                )
+
+            explain = await explain_command(db, command, params.get("verbosity", "queryPlanner"))
+            result = summarize_plan(explain)
+            if params.get("includeRaw"):
+                result["explain"] = explain
+            return self.json_response(result)
+        except Exception as error:
+            return self.handle_error(error)
@@ -1,8 +1,36 @@
-import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Tuple, Union
 
-from ..base.tool import BaseTool, ToolParams
-from ...mongodb.client import db
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from .explain import (
+    DEFAULT_PLAN_CHECK,
+    PLAN_CHECK_MODES,
+    PLAN_CHECK_OFF,
+    PLAN_CHECK_REFUSE,
+    check_collection_scan,
+    find_command,
+)
+from .pagination import (
+    SortSpec,
+    build_keyset_filter,
+    decode_cursor_token,
+    encode_cursor_token,
+    ensure_sort_fields,
+    keyset_sort,
+    parse_sort,
+    query_fingerprint,
+    remove_path,
+    sort_key_values,
+)
+from ..base.encoder import (
+    encode_documents,
+    encode_json,
+    encode_raw_document,
+    join_json_array,
+    raw_codec_options,
+)
+from ..base.tool import BaseTool, ToolParams, READ_OPTION_PROPERTIES, TARGET_PROPERTIES
+from ...mongodb.query_shapes import extract_shape
 
 
 class FindParams(ToolParams):
@@ -11,11 +39,24 @@ class FindParams(ToolParams):
     filter: Optional[Dict[str, Any]] = {}
     limit: Optional[int] = 10
     projection: Optional[Dict[str, Any]] = {}
+    paginate: Optional[bool] = False
+    cursor: Optional[str] = None
+    rawBson: Optional[bool] = False
+    planCheck: Optional[str] = None
+    sort: Optional[Dict[str, int]] = None
+    skip: Optional[int] = 0
+    hint: Optional[Union[str, Dict[str, Any]]] = None
+    maxTimeMS: Optional[int] = None
+    batchSize: Optional[int] = None
+    collation: Optional[Dict[str, Any]] = None
+    comment: Optional[str] = None
 
 
 class FindTool(BaseTool[FindParams]):
     """문서 조회 도구"""
 
+    read_only = True
+
     @property
     def name(self) -> str:
         return "find"
@@ -49,34 +90,252 @@ class FindTool(BaseTool[FindParams]):
                     "type": "object",
                     "description": "Fields to include/exclude",
                     "default": {}
-                }
+                },
+                "sort": {
+                    "type": "object",
+                    "description": "Sort specification in key order, e.g. {\"createdAt\": -1}"
+                },
+                "skip": {
+                    "type": "number",
+                    "description": "Number of documents to skip (not allowed with paginate; prefer the "
+                                   "cursor token for deep pages)",
+                    "default": 0,
+                    "minimum": 0
+                },
+                "hint": {
+                    "type": ["string", "object"],
+                    "description": "Index name or key specification the query must use"
+                },
+                "maxTimeMS": {
+                    "type": "number",
+                    "description": "Server-side time limit for the query in milliseconds"
+                },
+                "batchSize": {
+                    "type": "number",
+                    "description": "Number of documents fetched from the server per batch"
+                },
+                "collation": {
+                    "type": "object",
+                    "description": "Collation for string comparison and sorting, e.g. {\"locale\": \"en\"}"
+                },
+                "comment": {
+                    "type": "string",
+                    "description": "Comment attached to the query, visible in the profiler and currentOp"
+                },
+                "paginate": {
+                    "type": "boolean",
+                    "description": "Return one batch of at most 'limit' documents in sort order (_id by default), "
+                                   "plus a 'nextCursor' token for the following batch",
+                    "default": False
+                },
+                "cursor": {
+                    "type": "string",
+                    "description": "Continuation token returned as 'nextCursor' by a previous paginated call "
+                                   "with the same collection, filter, projection, sort and collation"
+                },
+                "rawBson": {
+                    "type": "boolean",
+                    "description": "Convert documents straight from raw BSON to relaxed Extended JSON "
+                                   "(ObjectId as {\"$oid\": ...}, dates as {\"$date\": ...}); "
+                                   "fastest for large results",
+                    "default": False
+                },
+                "planCheck": {
+                    "type": "string",
+                    "enum": list(PLAN_CHECK_MODES),
+                    "description": "Explain the query first and, on large collections, 'warn' about or "
+                                   "'refuse' filters that would scan the whole collection",
+                    "default": DEFAULT_PLAN_CHECK
+                },
+                **READ_OPTION_PROPERTIES,
+                **TARGET_PROPERTIES
             },
             "required": ["collection"]
         }
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         try:
+            db = self.get_database(params)
             collection = self.validate_collection(params.get("collection"))
             filter_query = params.get("filter", {})
             projection = params.get("projection", {})
             limit = min(params.get("limit", 10), 1000)
+            sort = parse_sort(params.get("sort"))
+            skip = int(params.get("skip") or 0)
+            hint = parse_hint(params.get("hint"))
+            collation = params.get("collation")
 
-            cursor = db[collection].find(filter_query, projection).limit(limit)
-            results = await cursor.to_list(length=limit)
-
-            # ObjectId를 문자열로 변환
-            for doc in results:
-                if "_id" in doc and hasattr(doc["_id"], "__str__"):
-                    doc["_id"] = str(doc["_id"])
-
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps(results, default=str, indent=2)
-                    }
-                ],
-                "isError": False
+            raw = bool(params.get("rawBson", False))
+            paged = bool(params.get("paginate") or params.get("cursor"))
+            plan_check = params.get("planCheck") or DEFAULT_PLAN_CHECK
+            if plan_check not in PLAN_CHECK_MODES:
+                raise ValueError(f"Unknown planCheck: {plan_check}. Expected one of {', '.join(PLAN_CHECK_MODES)}")
+            if skip < 0:
+                raise ValueError("skip must be a non-negative number")
+            if paged and skip:
+                raise ValueError("skip cannot be combined with paginate; use the cursor token to continue")
+
+            # 결과에 영향이 없는 옵션(maxTimeMS, batchSize, comment)은 캐시 키에서 제외
+            cursor_options: Dict[str, Any] = {}
+            if params.get("maxTimeMS"):
+                cursor_options["max_time_ms"] = int(params["maxTimeMS"])
+            if params.get("batchSize"):
+                cursor_options["batch_size"] = int(params["batchSize"])
+            if params.get("comment"):
+                cursor_options["comment"] = params["comment"]
+            if hint:
+                cursor_options["hint"] = hint
+            if collation:
+                cursor_options["collation"] = collation
+
+            # 정렬/힌트 사양은 키 순서가 의미를 가지므로 목록으로 캐시 키에 포함
+            key_params = {
+                "filter": filter_query,
+                "projection": projection,
+                "limit": limit,
+                "paged": paged,
+                "cursor": params.get("cursor"),
+                "raw": raw,
+                "sort": [list(item) for item in sort],
+                "skip": skip,
+                "hint": hint if isinstance(hint, str) or hint is None else [list(item) for item in hint],
+                "collation": collation
             }
+
+            if paged:
+                sort = keyset_sort(sort)
+                command = find_command(collection, filter_query, projection, sort, limit + 1,
+                                       hint=hint, collation=collation)
+                producer = lambda: self._execute_paged(
+                    db, collection, filter_query, projection, limit, params.get("cursor"), raw, sort, cursor_options
+                )
+            else:
+                command = find_command(collection, filter_query, projection, sort, limit, skip,
+                                       hint=hint, collation=collation)
+                producer = lambda: self._execute_find(
+                    db, collection, filter_query, projection, limit, raw, sort, skip, cursor_options
+                )
+
+            self.record_query_shape(db, collection, extract_shape(filter_query, sort))
+
+            if plan_check != PLAN_CHECK_OFF:
+                # 경고가 응답에 포함되므로 검사 모드별로 캐시를 분리
+                key_params["planCheck"] = plan_check
+                return await self.cached_response(db, collection, key_params, lambda: self._execute_checked(
+                    db, collection, command, plan_check, producer
+                ))
+            return await self.cached_response(db, collection, key_params, producer)
         except Exception as error:
             return self.handle_error(error)
+
+    async def _execute_checked(self, db: AsyncIOMotorDatabase, collection: str, command: Dict[str, Any],
+                               plan_check: str,
+                               producer: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """실행 계획을 먼저 확인하여 큰 컬렉션의 컬렉션 스캔을 경고하거나 거부"""
+        scan = await check_collection_scan(db, collection, command)
+        if scan is None:
+            return await producer()
+
+        message = (f"The filter on '{collection}' would scan the whole collection "
+                   f"(about {scan['estimatedDocuments']} documents) because no index matches it.")
+        if plan_check == PLAN_CHECK_REFUSE:
+            raise ValueError(f"{message} Narrow the filter to indexed fields, create an index, "
+                             f"or use the explain tool to inspect the plan")
+
+        response = await producer()
+        response["content"].append({"type": "text", "text": f"Warning: {message}"})
+        response["_meta"]["planWarning"] = scan
+        return response
+
+    async def _execute_find(self, db: AsyncIOMotorDatabase, collection: str, filter_query: Dict[str, Any],
+                            projection: Dict[str, Any], limit: int, raw: bool = False,
+                            sort: Optional[SortSpec] = None, skip: int = 0,
+                            cursor_options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """limit 건까지 조회"""
+        options = dict(cursor_options or {})
+        if sort:
+            options["sort"] = sort
+        if skip:
+            options["skip"] = skip
+
+        if raw:
+            # 드라이버가 dict로 디코딩하지 않도록 RawBSONDocument로 받아 바로 JSON으로 변환
+            target = db[collection].with_options(codec_options=raw_codec_options(db.codec_options))
+            cursor = target.find(filter_query, projection or None, limit=limit, **options)
+            encoded = [encode_raw_document(doc) async for doc in cursor]
+            return self.text_response(join_json_array(encoded), documents=len(encoded))
+
+        cursor = db[collection].find(filter_query, projection or None, limit=limit, **options)
+        results = await cursor.to_list(length=limit)
+
+        return self.json_response(results, documents=len(results))
+
+    async def _execute_paged(self, db: AsyncIOMotorDatabase, collection: str, filter_query: Dict[str, Any],
+                             projection: Dict[str, Any], batch_size: int, token: Optional[str],
+                             raw: bool = False, sort: Optional[SortSpec] = None,
+                             cursor_options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """정렬 키 기반 키셋 배치 조회 (skip 없이 마지막 문서의 정렬 키 다음부터 조회)"""
+        sort = sort or keyset_sort([])
+        options = dict(cursor_options or {})
+        fingerprint = query_fingerprint(collection, filter_query, projection, sort, options.get("collation"))
+        last_values = decode_cursor_token(token, fingerprint) if token else None
+
+        # 키셋 계산에 정렬 필드가 필요하므로 프로젝션에서 빠진 필드는 조회 후 직렬화 단계에서 제거
+        projection, strip_fields = ensure_sort_fields(projection, sort)
+        if strip_fields:
+            # 원시 BSON에서는 필드를 제거할 수 없으므로 일반 경로 사용
+            raw = False
+
+        target = db[collection]
+        if raw:
+            target = target.with_options(codec_options=raw_codec_options(db.codec_options))
+
+        # 다음 배치 존재 여부 확인을 위해 한 건 더 조회
+        options.setdefault("batch_size", batch_size + 1)
+        cursor = target.find(
+            build_keyset_filter(filter_query, sort, last_values),
+            projection or None,
+            sort=sort,
+            limit=batch_size + 1,
+            **options
+        )
+
+        # 문서를 하나씩 직렬화하여 메모리 사용량을 배치 크기로 제한
+        encoded = []
+        has_more = False
+        last_doc = None
+        async for doc in cursor:
+            if len(encoded) == batch_size:
+                has_more = True
+                break
+            last_doc = doc
+            if raw:
+                encoded.append(encode_raw_document(doc))
+                continue
+            if strip_fields:
+                last_doc = {"values": sort_key_values(doc, sort)}
+                for field in strip_fields:
+                    remove_path(doc, field)
+            encoded.append(encode_json(doc))
+        await cursor.close()
+
+        # 원시 문서는 접근 시 전체가 디코딩되므로 마지막 문서의 정렬 키만 읽음
+        if last_doc is not None:
+            last_values = last_doc["values"] if strip_fields else sort_key_values(last_doc, sort)
+
+        next_token = encode_cursor_token(last_values, fingerprint) if has_more else None
+        return self.text_response(
+            encode_documents(encoded, count=len(encoded), hasMore=has_more, nextCursor=next_token),
+            documents=len(encoded)
+        )
+
+
+def parse_hint(hint: Any) -> Optional[Union[str, List[Tuple[str, Any]]]]:
+    """인덱스 이름 또는 키 사양 형식의 힌트 검증"""
+    if not hint:
+        return None
+    if isinstance(hint, str):
+        return hint
+    if isinstance(hint, dict):
+        return list(hint.items())
+    raise ValueError("hint must be an index name or an index key specification object")
@@ -0,0 +1,72 @@
+from typing import Dict, Any
+
+from pymongo import InsertOne
+
+from .bulk import execute_bulk, document_size
+from ..base.tool import BaseTool, PRIORITY_WRITE, TARGET_PROPERTIES
+
+
+class InsertManyTool(BaseTool):
+    """다중 문서 삽입 도구"""
+
+    priority = PRIORITY_WRITE
+
+    @property
+    def name(self) -> str:
+        return "insertMany"
+
+    @property
+    def description(self) -> str:
+        return "Insert multiple documents into a collection in size-limited batches"
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "collection": {
+                    "type": "string",
+                    "description": "Name of the collection to insert into"
+                },
+                "documents": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": "Documents to insert"
+                },
+                "ordered": {
+                    "type": "boolean",
+                    "description": "Stop at the first error (true) or insert every valid document "
+                                   "with batches applied in parallel (false)",
+                    "default": True
+                },
+                **TARGET_PROPERTIES
+            },
+            "required": ["collection", "documents"]
+        }
+
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            db = self.get_database(params)
+            collection = self.validate_collection(params.get("collection"))
+            documents = params.get("documents")
+            ordered = params.get("ordered", True)
+
+            if not isinstance(documents, list) or not documents:
+                raise ValueError("Documents must be a non-empty array")
+            for index, document in enumerate(documents):
+                if not isinstance(document, dict):
+                    raise ValueError(f"Document {index} must be an object")
+
+            # 문서 삽입
+            requests = [InsertOne(document) for document in documents]
+            sizes = [document_size(document) for document in documents]
+            try:
+                summary = await execute_bulk(db[collection], requests, sizes, ordered=ordered)
+            finally:
+                # 실패해도 앞선 배치는 이미 적용되었을 수 있으므로 항상 무효화
+                self.invalidate_collection(db, collection)
+            summary.record_inserted_ids(enumerate(documents))
+
+            return self.json_response(summary.to_dict())
+        except Exception as error:
+            return self.handle_error(error)
@@ -1,13 +1,13 @@
-import json
 from typing import Dict, Any
 
-from ..base.tool import BaseTool
-from ...mongodb.client import db
+from ..base.tool import BaseTool, PRIORITY_WRITE, TARGET_PROPERTIES
 
 
 class InsertOneTool(BaseTool):
     """문서 삽입 도구"""
 
+    priority = PRIORITY_WRITE
+
     @property
     def name(self) -> str:
         return "insertOne"
@@ -28,30 +28,25 @@ class InsertOneTool(BaseTool):
                 "document": {
                     "type": "object",
                     "description": "Document to insert"
-                }
+                },
+                **TARGET_PROPERTIES
             },
             "required": ["collection", "document"]
         }
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         try:
+            db = self.get_database(params)
             collection = self.validate_collection(params.get("collection"))
             document = self.validate_object(params.get("document"), "Document")
 
             # 문서 삽입
             result = await db[collection].insert_one(document)
+            self.invalidate_collection(db, collection)
 
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps({
-                            "insertedId": str(result.inserted_id),
-                            "acknowledged": result.acknowledged
-                        }, indent=2)
-                    }
-                ],
-                "isError": False
-            }
+            return self.json_response({
+                "insertedId": str(result.inserted_id),
+                "acknowledged": result.acknowledged
+            })
         except Exception as error:
             return self.handle_error(error)
@@ -0,0 +1,183 @@
+import base64
+import hashlib
+import json
+from typing import Dict, Any, List, Optional, Tuple
+
+from bson import json_util
+
+# 토큰 포맷 버전 (1: _id만 저장, 2: 정렬 키 값 목록 저장)
+TOKEN_VERSION = 2
+
+SortSpec = List[Tuple[str, int]]
+
+
+def parse_sort(sort: Any) -> SortSpec:
+    """{"a": 1, "b": -1} 또는 [["a", 1], ["b", -1]] 형식의 정렬 사양 검증"""
+    if not sort:
+        return []
+    if isinstance(sort, dict):
+        items = list(sort.items())
+    elif isinstance(sort, list) and all(isinstance(item, (list, tuple)) and len(item) == 2 for item in sort):
+        items = [(item[0], item[1]) for item in sort]
+    else:
+        raise ValueError("Sort must be an object or an array of [field, direction] pairs")
+
+    spec: SortSpec = []
+    for field, direction in items:
+        if not isinstance(field, str) or not field:
+            raise ValueError("Sort fields must be non-empty strings")
+        if isinstance(direction, bool) or direction not in (1, -1):
+            raise ValueError(f"Sort direction for '{field}' must be 1 or -1")
+        spec.append((field, int(direction)))
+    return spec
+
+
+def keyset_sort(sort: SortSpec) -> SortSpec:
+    """키셋 페이지네이션용 정렬 (순서가 유일하도록 _id를 마지막 기준으로 추가)"""
+    if any(field == "_id" for field, _ in sort):
+        return list(sort)
+    return list(sort) + [("_id", sort[-1][1] if sort else 1)]
+
+
+def query_fingerprint(collection: str, filter_query: Dict[str, Any], projection: Dict[str, Any],
+                      sort: Optional[SortSpec] = None, collation: Optional[Dict[str, Any]] = None) -> str:
+    """쿼리 형태를 식별하는 지문 생성
+
+    정렬 순서가 보존되도록 정렬 사양은 목록으로 포함 (기본 _id 정렬은 버전 1 토큰과 같은 지문)
+    """
+    parts: List[Any] = [collection, filter_query, projection]
+    if sort and sort != [("_id", 1)]:
+        parts.append([list(item) for item in sort])
+    if collation:
+        parts.append(collation)
+    raw = json_util.dumps(parts, sort_keys=True)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_cursor_token(last_values: List[Any], fingerprint: str) -> str:
+    """마지막 문서의 정렬 키 값으로 불투명한 연속 토큰 생성"""
+    payload = {
+        "v": TOKEN_VERSION,
+        "q": fingerprint,
+        "after": json_util.dumps(last_values)
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor_token(token: str, fingerprint: str) -> List[Any]:
+    """연속 토큰을 해석하여 마지막 문서의 정렬 키 값 목록 반환"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        version = payload.get("v")
+        if version not in (1, TOKEN_VERSION):
+            raise ValueError("unsupported version")
+        after = json_util.loads(payload["after"])
+        # 버전 1 토큰은 마지막 _id 하나만 저장
+        last_values = [after] if version == 1 else list(after)
+    except Exception:
+        raise ValueError("Invalid cursor token")
+
+    # 다른 쿼리에서 발급된 토큰은 사용할 수 없음
+    if payload.get("q") != fingerprint:
+        raise ValueError("Cursor token does not match this query")
+    return last_values
+
+
+def get_path(document: Any, path: str) -> Any:
+    """점 표기 경로의 값 조회 (없으면 None)"""
+    value = document
+    for part in path.split("."):
+        try:
+            value = value[part]
+        except (KeyError, TypeError, IndexError):
+            return None
+    return value
+
+
+def remove_path(document: Dict[str, Any], path: str):
+    """점 표기 경로의 값을 제거하고 비어 있는 상위 문서도 제거"""
+    parts = path.split(".")
+    parents = []
+    current: Any = document
+    for part in parts[:-1]:
+        if not isinstance(current, dict) or part not in current:
+            return
+        parents.append((current, part))
+        current = current[part]
+    if isinstance(current, dict):
+        current.pop(parts[-1], None)
+    for parent, key in reversed(parents):
+        if parent[key] == {}:
+            del parent[key]
+
+
+def sort_key_values(document: Any, sort: SortSpec) -> List[Any]:
+    """문서에서 정렬 키 값 목록 추출"""
+    return [get_path(document, field) for field, _ in sort]
+
+
+def ensure_sort_fields(projection: Dict[str, Any], sort: SortSpec) -> Tuple[Dict[str, Any], List[str]]:
+    """다음 페이지 필터 계산에 필요한 정렬 필드가 결과에 포함되도록 프로젝션 조정
+
+    추가로 포함한 필드 목록을 함께 반환하며, 직렬화 전에 문서에서 제거해야 함
+    """
+    if not projection:
+        return projection, []
+
+    projection = dict(projection)
+    inclusion = any(value not in (0, False) for key, value in projection.items() if key != "_id")
+    strip: List[str] = []
+
+    for field, _ in sort:
+        if field == "_id" or not inclusion:
+            # _id 또는 제외 방식 프로젝션에서 제외된 정렬 필드는 제외 목록에서 제거
+            if projection.get(field) in (0, False):
+                del projection[field]
+                strip.append(field)
+            continue
+        if any(field == key or field.startswith(key + ".") for key in projection):
+            continue
+        if any(key.startswith(field + ".") for key in projection):
+            raise ValueError(f"Projection on a sub-field of sort field '{field}' is not supported with pagination")
+        projection[field] = 1
+        strip.append(field)
+    return projection, strip
+
+
+def build_keyset_filter(filter_query: Dict[str, Any], sort: SortSpec,
+                        last_values: Optional[List[Any]]) -> Dict[str, Any]:
+    """마지막 문서의 정렬 키 다음부터 조회하는 필터 생성
+
+    정렬 (a, b, _id)에 대해 a > va OR (a = va AND b > vb) OR (a = va AND b = vb AND _id > vid)
+    형태이며, 내림차순 필드는 $lt를 사용. 정렬 필드의 타입이 문서마다 같다고 가정
+    """
+    if last_values is None:
+        return filter_query
+    if len(last_values) != len(sort):
+        raise ValueError("Cursor token does not match this query")
+
+    clauses = []
+    for index, (field, direction) in enumerate(sort):
+        clause = {prev_field: last_values[i] for i, (prev_field, _) in enumerate(sort[:index])}
+        value = last_values[index]
+        if value is None:
+            # null/누락 값은 가장 작은 값으로 정렬되므로 오름차순이면 값이 있는 문서, 내림차순이면 다음 없음
+            if direction < 0:
+                continue
+            clause[field] = {"$ne": None}
+        else:
+            clause[field] = {"$gt" if direction > 0 else "$lt": value}
+        clauses.append(clause)
+
+    if not clauses:
+        range_filter: Dict[str, Any] = {"_id": {"$exists": False}}
+    elif len(clauses) == 1:
+        range_filter = clauses[0]
+    else:
+        range_filter = {"$or": clauses}
+
+    if not filter_query:
+        return range_filter
+    return {"$and": [filter_query, range_filter]}
@@ -0,0 +1,74 @@
+from typing import Dict, Any
+
+from ..base.tool import BaseTool, PRIORITY_WRITE, TARGET_PROPERTIES
+
+
+class UpdateManyTool(BaseTool):
+    """다중 문서 수정 도구"""
+
+    priority = PRIORITY_WRITE
+
+    @property
+    def name(self) -> str:
+        return "updateMany"
+
+    @property
+    def description(self) -> str:
+        return "Update all documents matching a filter in a collection"
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "collection": {
+                    "type": "string",
+                    "description": "Name of the collection to update in"
+                },
+                "filter": {
+                    "type": "object",
+                    "description": "Filter to select the documents to update"
+                },
+                "update": {
+                    "type": "object",
+                    "description": "Update operations to apply to the documents (MongoDB update operators)"
+                },
+                "upsert": {
+                    "type": "boolean",
+                    "description": "Create a new document if no document matches the filter",
+                    "default": False
+                },
+                **TARGET_PROPERTIES
+            },
+            "required": ["collection", "filter", "update"]
+        }
+
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            db = self.get_database(params)
+            collection = self.validate_collection(params.get("collection"))
+            filter_query = params.get("filter")
+            if not isinstance(filter_query, dict):
+                raise ValueError("Filter must be an object")
+            update = self.validate_object(params.get("update"), "Update")
+            upsert = params.get("upsert", False)
+
+            # 문서 수정
+            try:
+                result = await db[collection].update_many(
+                    filter_query,
+                    update,
+                    upsert=upsert
+                )
+            finally:
+                # 실패해도 일부 문서는 이미 수정되었을 수 있으므로 항상 무효화
+                self.invalidate_collection(db, collection, drop=True)
+
+            return self.json_response({
+                "matchedCount": result.matched_count,
+                "modifiedCount": result.modified_count,
+                "upsertedId": str(result.upserted_id) if result.upserted_id else None,
+                "acknowledged": result.acknowledged
+            })
+        except Exception as error:
+            return self.handle_error(error)
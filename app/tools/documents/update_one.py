@@ -1,13 +1,13 @@
-import json
 from typing import Dict, Any
 
-from ..base.tool import BaseTool
-from ...mongodb.client import db
+from ..base.tool import BaseTool, PRIORITY_WRITE, TARGET_PROPERTIES
 
 
 class UpdateOneTool(BaseTool):
     """문서 수정 도구"""
 
+    priority = PRIORITY_WRITE
+
     @property
     def name(self) -> str:
         return "updateOne"
@@ -37,13 +37,15 @@ class UpdateOneTool(BaseTool):
                     "type": "boolean",
                     "description": "Create a new document if no document matches the filter",
                     "default": False
-                }
+                },
+                **TARGET_PROPERTIES
             },
             "required": ["collection", "filter", "update"]
         }
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         try:
+            db = self.get_database(params)
             collection = self.validate_collection(params.get("collection"))
             filter_query = self.validate_object(params.get("filter"), "Filter")
             update = self.validate_object(params.get("update"), "Update")
@@ -55,20 +57,14 @@ class UpdateOneTool(BaseTool):
                 update,
                 upsert=upsert
             )
+            # $unset 등으로 필드가 사라질 수 있으므로 전체 재샘플링
+            self.invalidate_collection(db, collection, drop=True)
 
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps({
-                            "matchedCount": result.matched_count,
-                            "modifiedCount": result.modified_count,
-                            "upsertedId": str(result.upserted_id) if result.upserted_id else None,
-                            "acknowledged": result.acknowledged
-                        }, indent=2)
-                    }
-                ],
-                "isError": False
-            }
+            return self.json_response({
+                "matchedCount": result.matched_count,
+                "modifiedCount": result.modified_count,
+                "upsertedId": str(result.upserted_id) if result.upserted_id else None,
+                "acknowledged": result.acknowledged
+            })
         except Exception as error:
             return self.handle_error(error)
@@ -0,0 +1,152 @@
+from typing import Dict, Any
+
+from ..base.tool import BaseTool, TARGET_PROPERTIES
+from ...mongodb.change_streams import FULL_DOCUMENT_MODES, build_watch_pipeline, change_streams
+
+ACTIONS = ("start", "poll", "stop")
+DEFAULT_MAX_EVENTS = 100
+MAX_EVENTS = 1000
+DEFAULT_MAX_AWAIT_MS = 5000
+# 폴링 호출이 스케줄러 슬롯을 오래 점유하지 않도록 대기 시간 제한
+MAX_AWAIT_MS = 10000
+
+# 구독 이벤트를 배치로 전달하는 SSE 경로
+STREAM_PATH = "/sse/watch/{subscriptionId}"
+
+
+class WatchTool(BaseTool):
+    """변경 스트림 구독 도구"""
+
+    @property
+    def name(self) -> str:
+        return "watch"
+
+    @property
+    def description(self) -> str:
+        return ("Tail changes to a collection with a change stream. start opens a subscription whose events "
+                "are pushed in batches over the SSE stream at /sse/watch/{subscriptionId}; poll fetches the "
+                "next batch instead, and stop closes it. Every batch carries a resume token that can be "
+                "passed back as resumeAfter to continue without missing events")
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "action": {
+                    "type": "string",
+                    "enum": list(ACTIONS),
+                    "description": "start a subscription, poll it for events, or stop it",
+                    "default": "start"
+                },
+                "collection": {
+                    "type": "string",
+                    "description": "Name of the collection to watch (required for start)"
+                },
+                "subscriptionId": {
+                    "type": "string",
+                    "description": "Subscription returned by start (required for poll and stop)"
+                },
+                "pipeline": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": "Change stream stages evaluated on the server, e.g. "
+                                   "[{\"$match\": {\"fullDocument.status\": \"failed\"}}]"
+                },
+                "operationTypes": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Only deliver these operation types, e.g. [\"insert\", \"update\"]"
+                },
+                "fullDocument": {
+                    "type": "string",
+                    "enum": list(FULL_DOCUMENT_MODES),
+                    "description": "updateLookup includes the current document in update events",
+                    "default": "default"
+                },
+                "resumeAfter": {
+                    "type": "object",
+                    "description": "Resume token from a previous batch to continue after"
+                },
+                "startAfter": {
+                    "type": "object",
+                    "description": "Like resumeAfter, but also allowed after an invalidate event"
+                },
+                "maxEvents": {
+                    "type": "number",
+                    "description": f"Maximum events returned by poll (max {MAX_EVENTS})",
+                    "default": DEFAULT_MAX_EVENTS
+                },
+                "maxAwaitMS": {
+                    "type": "number",
+                    "description": f"How long poll waits for the first event (max {MAX_AWAIT_MS})",
+                    "default": DEFAULT_MAX_AWAIT_MS
+                },
+                **TARGET_PROPERTIES
+            }
+        }
+
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            action = params.get("action") or "start"
+            if action not in ACTIONS:
+                raise ValueError(f"Unknown action: {action}. Expected one of {', '.join(ACTIONS)}")
+
+            if action == "start":
+                return await self._start(params)
+
+            subscription_id = params.get("subscriptionId")
+            if not subscription_id:
+                raise ValueError(f"subscriptionId is required for {action}")
+
+            if action == "stop":
+                subscription = await change_streams.stop(subscription_id)
+                return self.json_response(subscription.to_dict())
+
+            subscription = change_streams.get(subscription_id)
+            max_events = min(max(int(params.get("maxEvents") or DEFAULT_MAX_EVENTS), 1), MAX_EVENTS)
+            max_await_ms = params.get("maxAwaitMS")
+            max_await_ms = min(max(int(DEFAULT_MAX_AWAIT_MS if max_await_ms is None else max_await_ms), 0),
+                               MAX_AWAIT_MS)
+
+            events, resume_token = await change_streams.next_batch(subscription, max_events, max_await_ms / 1000)
+            result: Dict[str, Any] = {
+                "subscriptionId": subscription.subscription_id,
+                "events": events,
+                "resumeToken": resume_token,
+                "buffered": subscription.queue.qsize()
+            }
+            if subscription.closed and subscription.queue.empty():
+                result["closed"] = True
+                if subscription.error:
+                    result["error"] = subscription.error
+            return self.json_response(result, documents=len(events))
+        except Exception as error:
+            return self.handle_error(error)
+
+    async def _start(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """구독 시작"""
+        db = self.get_database(params)
+        collection = self.validate_collection(params.get("collection"))
+        pipeline = params.get("pipeline")
+        if pipeline is not None and not isinstance(pipeline, list):
+            raise ValueError("Pipeline must be an array of stage objects")
+        pipeline = build_watch_pipeline(pipeline, params.get("operationTypes"))
+
+        resume_after = params.get("resumeAfter")
+        start_after = params.get("startAfter")
+        if resume_after and start_after:
+            raise ValueError("resumeAfter and startAfter cannot be combined")
+        for name, token in (("resumeAfter", resume_after), ("startAfter", start_after)):
+            if token is not None:
+                self.validate_object(token, name)
+
+        subscription = await change_streams.start(
+            db, collection, pipeline,
+            full_document=params.get("fullDocument"),
+            resume_after=resume_after,
+            start_after=start_after
+        )
+        result = subscription.to_dict()
+        result["stream"] = STREAM_PATH.format(subscriptionId=subscription.subscription_id)
+        return self.json_response(result)
@@ -0,0 +1,221 @@
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import IndexModel
+
+from ...mongodb.client import database_key
+
+# 키 방향 대신 사용할 수 있는 인덱스 유형
+INDEX_TYPES = ("text", "2dsphere", "2d", "hashed")
+# 보관할 완료된 빌드 기록 수
+MAX_FINISHED_BUILDS = 100
+
+STATUS_BUILDING = "building"
+STATUS_READY = "ready"
+STATUS_FAILED = "failed"
+
+
+def is_wildcard(field: str) -> bool:
+    return field == "$**" or field.endswith(".$**")
+
+
+def parse_index_keys(keys: Any) -> List[Tuple[str, Any]]:
+    """{"a": 1, "b": -1} 또는 [["a", 1], ["b", -1]] 형식의 인덱스 키 사양 검증"""
+    if isinstance(keys, dict):
+        items = list(keys.items())
+    elif isinstance(keys, list):
+        items = []
+        for item in keys:
+            if not isinstance(item, (list, tuple)) or len(item) != 2:
+                raise ValueError("Index keys given as an array must contain [field, direction] pairs")
+            items.append((item[0], item[1]))
+    else:
+        raise ValueError("Index keys must be an object or an array of [field, direction] pairs")
+
+    if not items:
+        raise ValueError("Index keys must contain at least one field")
+
+    parsed = []
+    for field, direction in items:
+        if not isinstance(field, str) or not field:
+            raise ValueError("Index key fields must be non-empty strings")
+        if isinstance(direction, (int, float)) and not isinstance(direction, bool) and direction in (1, -1):
+            direction = int(direction)
+        elif direction not in INDEX_TYPES:
+            raise ValueError(f"Invalid direction for '{field}': expected 1, -1 or one of {', '.join(INDEX_TYPES)}")
+        if is_wildcard(field) and direction not in (1, -1):
+            raise ValueError(f"Wildcard key '{field}' must use direction 1 or -1")
+        parsed.append((field, direction))
+    return parsed
+
+
+def parse_index_options(params: Dict[str, Any], keys: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """createIndex 옵션 검증"""
+    options: Dict[str, Any] = {}
+
+    for option in ("unique", "sparse", "hidden"):
+        if params.get(option) is not None:
+            options[option] = bool(params[option])
+
+    if params.get("name"):
+        options["name"] = str(params["name"])
+
+    for option in ("partialFilterExpression", "collation", "wildcardProjection"):
+        value = params.get(option)
+        if value is None:
+            continue
+        if not isinstance(value, dict) or not value:
+            raise ValueError(f"{option} must be a non-empty object")
+        options[option] = value
+
+    if params.get("expireAfterSeconds") is not None:
+        ttl = params["expireAfterSeconds"]
+        if not isinstance(ttl, (int, float)) or isinstance(ttl, bool) or ttl < 0:
+            raise ValueError("expireAfterSeconds must be a non-negative number")
+        if len(keys) != 1 or keys[0][1] not in (1, -1):
+            raise ValueError("expireAfterSeconds (TTL) requires a single-field ascending or descending index")
+        options["expireAfterSeconds"] = int(ttl)
+
+    wildcard = any(is_wildcard(field) for field, _ in keys)
+    if "wildcardProjection" in options and not (len(keys) == 1 and keys[0][0] == "$**"):
+        raise ValueError("wildcardProjection is only valid for an index on '$**'")
+    if wildcard and options.get("unique"):
+        raise ValueError("Wildcard indexes cannot be unique")
+    if options.get("sparse") and "partialFilterExpression" in options:
+        raise ValueError("sparse and partialFilterExpression cannot be combined")
+    return options
+
+
+class IndexBuild:
+    """백그라운드 인덱스 빌드 기록"""
+
+    __slots__ = ("build_id", "database", "collection", "name", "keys", "options",
+                 "started_at", "finished_at", "status", "error", "task")
+
+    def __init__(self, database: str, collection: str, model: IndexModel):
+        self.build_id = uuid.uuid4().hex[:12]
+        self.database = database
+        self.collection = collection
+        self.name = model.document["name"]
+        self.keys = dict(model.document["key"])
+        self.options = {k: v for k, v in model.document.items() if k not in ("key", "name")}
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.status = STATUS_BUILDING
+        self.error: Optional[str] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """사전 형태로 변환"""
+        result = {
+            "buildId": self.build_id,
+            "database": self.database,
+            "collection": self.collection,
+            "name": self.name,
+            "keys": self.keys,
+            "options": self.options,
+            "status": self.status,
+            "elapsedSeconds": round((self.finished_at or time.time()) - self.started_at, 3)
+        }
+        if self.error:
+            result["error"] = self.error
+        return result
+
+
+def _build_progress(op: Dict[str, Any]) -> Dict[str, Any]:
+    """currentOp 항목에서 진행 상황 추출"""
+    progress: Dict[str, Any] = {"opid": op.get("opid"), "secsRunning": op.get("secs_running")}
+    if op.get("msg"):
+        progress["msg"] = op["msg"]
+    if isinstance(op.get("progress"), dict):
+        done = op["progress"].get("done", 0)
+        total = op["progress"].get("total", 0)
+        progress["done"] = done
+        progress["total"] = total
+        if total:
+            progress["percent"] = round(done * 100 / total, 1)
+    return progress
+
+
+def _op_index_names(op: Dict[str, Any]) -> List[str]:
+    return [index.get("name") for index in op.get("command", {}).get("indexes", []) if isinstance(index, dict)]
+
+
+class IndexBuildTracker:
+    """도구 호출을 막지 않는 인덱스 빌드 실행 및 currentOp 기반 진행 상황 추적"""
+
+    def __init__(self, max_finished: int = MAX_FINISHED_BUILDS):
+        self.max_finished = max_finished
+        self._builds: "OrderedDict[str, IndexBuild]" = OrderedDict()
+
+    def start(self, db: AsyncIOMotorDatabase, collection: str, model: IndexModel,
+              on_done: Optional[Callable[[IndexBuild], None]] = None) -> IndexBuild:
+        """인덱스 빌드를 백그라운드 작업으로 시작"""
+        build = IndexBuild(database_key(db), collection, model)
+
+        async def run():
+            try:
+                await db[collection].create_indexes([model])
+                build.status = STATUS_READY
+            except Exception as error:
+                build.status = STATUS_FAILED
+                build.error = str(error)
+            finally:
+                build.finished_at = time.time()
+                build.task = None
+                if on_done:
+                    on_done(build)
+                self._trim()
+
+        self._builds[build.build_id] = build
+        build.task = asyncio.create_task(run())
+        return build
+
+    def _trim(self):
+        """오래된 완료 기록 제거"""
+        finished = [key for key, build in self._builds.items() if build.status != STATUS_BUILDING]
+        for key in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._builds[key]
+
+    def get(self, build_id: str) -> Optional[IndexBuild]:
+        return self._builds.get(build_id)
+
+    def list(self, database: str, collection: Optional[str] = None) -> List[IndexBuild]:
+        return [
+            build for build in self._builds.values()
+            if build.database == database and (collection is None or build.collection == collection)
+        ]
+
+    async def server_builds(self, db: AsyncIOMotorDatabase, collection: Optional[str] = None) -> List[Dict[str, Any]]:
+        """currentOp에서 진행 중인 인덱스 빌드 조회 (이 서버가 시작하지 않은 빌드 포함)"""
+        command: Dict[str, Any] = {"currentOp": 1, "command.createIndexes": {"$exists": True}}
+        if collection:
+            command["command.createIndexes"] = collection
+        result = await db.client.admin.command(command)
+
+        builds = []
+        for op in result.get("inprog", []):
+            if op.get("command", {}).get("$db", db.name) != db.name:
+                continue
+            builds.append({
+                "collection": op.get("command", {}).get("createIndexes"),
+                "indexes": _op_index_names(op),
+                **_build_progress(op)
+            })
+        return builds
+
+    @staticmethod
+    def attach_progress(build: Dict[str, Any], server_builds: List[Dict[str, Any]]):
+        """추적 중인 빌드에 currentOp 진행 상황 연결"""
+        for op in server_builds:
+            if op["collection"] == build["collection"] and build["name"] in op["indexes"]:
+                build["progress"] = {k: v for k, v in op.items() if k not in ("collection", "indexes")}
+                return
+
+
+# 전역 인덱스 빌드 추적기
+index_builds = IndexBuildTracker()
@@ -1,19 +1,25 @@
 from typing import Dict, Any
 
-from ..base.tool import BaseTool
-from ...mongodb.client import db
+from pymongo import IndexModel
+
+from .builds import INDEX_TYPES, index_builds, parse_index_keys, parse_index_options
+from ..base.tool import BaseTool, PRIORITY_ADMIN, TARGET_PROPERTIES
 
 
 class CreateIndexTool(BaseTool):
     """인덱스 생성 도구"""
 
+    priority = PRIORITY_ADMIN
+
     @property
     def name(self) -> str:
         return "createIndex"
 
     @property
     def description(self) -> str:
-        return "Create a new index on a collection"
+        return ("Create an index on a collection: single-field or compound keys, text/2dsphere/hashed/wildcard "
+                "types, and unique, sparse, hidden, partial, TTL and collation options. Set wait=false to "
+                "build in the background and follow progress with indexBuilds")
 
     @property
     def input_schema(self) -> Dict[str, Any]:
@@ -24,14 +30,20 @@ class CreateIndexTool(BaseTool):
                     "type": "string",
                     "description": "Name of the collection to create an index on"
                 },
+                "keys": {
+                    "type": "object",
+                    "description": "Index key specification in key order, e.g. {\"status\": 1, \"createdAt\": -1}. "
+                                   f"Values are 1, -1 or one of {', '.join(INDEX_TYPES)}; use {{\"$**\": 1}} "
+                                   "or {\"field.$**\": 1} for a wildcard index"
+                },
                 "field": {
                     "type": "string",
-                    "description": "Field name to index"
+                    "description": "Field name for a single-field index (alternative to 'keys')"
                 },
                 "order": {
                     "type": "number",
                     "enum": [1, -1],
-                    "description": "Index order (1 for ascending, -1 for descending)",
+                    "description": "Index order for 'field' (1 for ascending, -1 for descending)",
                     "default": 1
                 },
                 "unique": {
@@ -42,38 +54,65 @@ class CreateIndexTool(BaseTool):
                 "name": {
                     "type": "string",
                     "description": "Optional name for the index"
-                }
+                },
+                "sparse": {
+                    "type": "boolean",
+                    "description": "Only index documents that contain the indexed fields"
+                },
+                "hidden": {
+                    "type": "boolean",
+                    "description": "Create the index hidden from the query planner"
+                },
+                "partialFilterExpression": {
+                    "type": "object",
+                    "description": "Only index documents matching this filter"
+                },
+                "expireAfterSeconds": {
+                    "type": "number",
+                    "description": "TTL in seconds for a single date field index"
+                },
+                "collation": {
+                    "type": "object",
+                    "description": "Collation for string comparisons, e.g. {\"locale\": \"en\", \"strength\": 2}"
+                },
+                "wildcardProjection": {
+                    "type": "object",
+                    "description": "Fields to include/exclude for a '$**' wildcard index"
+                },
+                "wait": {
+                    "type": "boolean",
+                    "description": "Wait for the build to finish; false returns a buildId immediately",
+                    "default": True
+                },
+                **TARGET_PROPERTIES
             },
-            "required": ["collection", "field"]
+            "required": ["collection"]
         }
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         try:
+            db = self.get_database(params)
             collection = self.validate_collection(params.get("collection"))
-            field = params.get("field")
-            order = params.get("order", 1)
-            unique = params.get("unique", False)
-            name = params.get("name")
 
-            if not isinstance(field, str):
-                raise ValueError("Field must be a string")
+            if params.get("keys") is not None:
+                keys = parse_index_keys(params["keys"])
+            elif isinstance(params.get("field"), str):
+                keys = parse_index_keys([[params["field"], params.get("order", 1)]])
+            else:
+                raise ValueError("Either 'keys' or 'field' is required")
+
+            model = IndexModel(keys, **parse_index_options(params, keys))
 
-            # 인덱스 옵션 생성
-            options: Dict[str, Any] = {"unique": unique}
-            if name:
-                options["name"] = name
+            if not params.get("wait", True):
+                # 빌드 완료 시 스키마/쿼리 캐시 무효화
+                build = index_builds.start(db, collection, model,
+                                           on_done=lambda _: self.invalidate_collection(db, collection))
+                return self.json_response(build.to_dict())
 
             # 인덱스 생성
-            result = await db[collection].create_index([(field, order)], **options)
+            result = await db[collection].create_indexes([model])
+            self.invalidate_collection(db, collection)
 
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": f"Created index '{result}' on collection '{collection}'"
-                    }
-                ],
-                "isError": False
-            }
+            return self.text_response(f"Created index '{result[0]}' on collection '{collection}'")
         except Exception as error:
             return self.handle_error(error)
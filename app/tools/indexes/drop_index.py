@@ -1,12 +1,13 @@
 from typing import Dict, Any
 
-from ..base.tool import BaseTool
-from ...mongodb.client import db
+from ..base.tool import BaseTool, PRIORITY_ADMIN, TARGET_PROPERTIES
 
 
 class DropIndexTool(BaseTool):
     """인덱스 삭제 도구"""
 
+    priority = PRIORITY_ADMIN
+
     @property
     def name(self) -> str:
         return "dropIndex"
@@ -27,13 +28,15 @@ class DropIndexTool(BaseTool):
                 "indexName": {
                     "type": "string",
                     "description": "Name of the index to drop"
-                }
+                },
+                **TARGET_PROPERTIES
             },
             "required": ["collection", "indexName"]
         }
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         try:
+            db = self.get_database(params)
             collection = self.validate_collection(params.get("collection"))
             index_name = params.get("indexName")
 
@@ -42,15 +45,8 @@ class DropIndexTool(BaseTool):
 
             # 인덱스 삭제
             await db[collection].drop_index(index_name)
+            self.invalidate_collection(db, collection)
 
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": f"Dropped index '{index_name}' from collection '{collection}'"
-                    }
-                ],
-                "isError": False
-            }
+            return self.text_response(f"Dropped index '{index_name}' from collection '{collection}'")
         except Exception as error:
             return self.handle_error(error)
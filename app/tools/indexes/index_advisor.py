@@ -0,0 +1,222 @@
+from typing import Dict, Any, List, Optional, Tuple
+
+from ..base.tool import BaseTool, TARGET_PROPERTIES
+from ...mongodb.client import database_key
+from ...mongodb.query_shapes import QueryShape, ShapeStats, query_shapes
+
+DEFAULT_RECOMMENDATIONS = 5
+MAX_RECOMMENDATIONS = 50
+
+# 이 옵션이 있는 인덱스는 다른 인덱스로 대체할 수 없음
+SPECIAL_INDEX_OPTIONS = ("unique", "sparse", "partialFilterExpression", "expireAfterSeconds", "collation")
+
+IndexKey = List[Tuple[str, Any]]
+
+
+def recommended_key(shape: QueryShape) -> Tuple[Tuple[str, int], ...]:
+    """ESR(등호, 정렬, 범위) 순서의 복합 인덱스 키"""
+    return (tuple((field, 1) for field in shape.equality)
+            + shape.sort
+            + tuple((field, 1) for field in shape.range))
+
+
+def required_fields(shape: QueryShape) -> int:
+    """형태를 온전히 처리하는 데 필요한 인덱스 접두 필드 수 (범위 필드는 첫 번째만 효과적)"""
+    return len(shape.equality) + len(shape.sort) + (1 if shape.range else 0)
+
+
+def usable_prefix(index_key: IndexKey, shape: QueryShape) -> int:
+    """인덱스 키 중 ESR 규칙에 따라 쿼리 형태가 활용할 수 있는 앞쪽 필드 수"""
+    fields = list(index_key)
+    position = 0
+
+    # 등호 필드는 순서와 관계없이 접두에 모두 있어야 이후 정렬/범위에 인덱스를 쓸 수 있음
+    equality = set(shape.equality)
+    while position < len(fields) and fields[position][0] in equality:
+        position += 1
+    if position < len(equality):
+        return position
+
+    # 정렬 필드는 순서가 같고 방향이 모두 같거나 모두 반대여야 함
+    sign = None
+    for sort_field, sort_direction in shape.sort:
+        if position >= len(fields):
+            return position
+        field, direction = fields[position]
+        if field != sort_field or not isinstance(direction, (int, float)):
+            return position
+        matches = 1 if direction * sort_direction > 0 else -1
+        if sign is not None and matches != sign:
+            return position
+        sign = matches
+        position += 1
+
+    if position < len(fields) and fields[position][0] in shape.range:
+        position += 1
+    return position
+
+
+def best_existing_index(indexes: Dict[str, Dict[str, Any]], shape: QueryShape) -> Tuple[Optional[str], float]:
+    """형태를 가장 많이 처리하는 기존 인덱스와 처리 비율"""
+    needed = required_fields(shape)
+    best_name, best_coverage = None, 0.0
+    for name, info in indexes.items():
+        if info.get("partialFilterExpression") or info.get("sparse") or info.get("hidden"):
+            # 모든 문서를 포함하지 않거나 쿼리에서 쓰이지 않는 인덱스
+            continue
+        coverage = min(1.0, usable_prefix(info.get("key", []), shape) / needed) if needed else 1.0
+        if coverage > best_coverage:
+            best_name, best_coverage = name, coverage
+    return best_name, best_coverage
+
+
+def recommend_indexes(shapes: List[ShapeStats], indexes: Dict[str, Dict[str, Any]],
+                      estimated_documents: int) -> List[Dict[str, Any]]:
+    """기존 인덱스가 처리하지 못하는 형태에 대해 복합 인덱스 추천 (예상 스캔 감소량 순)
+
+    예상 스캔 감소량 = 호출 수 × 컬렉션 문서 수 × 기존 인덱스가 처리하지 못하는 비율
+    """
+    candidates: Dict[Tuple[Tuple[str, int], ...], Dict[str, Any]] = {}
+    for stats in shapes:
+        shape = stats.shape
+        current, coverage = best_existing_index(indexes, shape)
+        if coverage >= 1.0:
+            continue
+        key = recommended_key(shape)
+        candidate = candidates.setdefault(key, {"shapes": [], "calls": 0, "reduction": 0.0})
+        candidate["shapes"].append({
+            **shape.to_dict(),
+            "calls": stats.calls,
+            "currentIndex": current,
+            "currentCoverage": round(coverage, 2)
+        })
+        candidate["calls"] += stats.calls
+        candidate["reduction"] += stats.calls * estimated_documents * (1.0 - coverage)
+
+    # 다른 추천 키의 접두인 키는 더 긴 인덱스가 함께 처리하므로 합침
+    for key in sorted(candidates, key=len):
+        longer = [other for other in candidates if len(other) > len(key) and other[:len(key)] == key]
+        if longer:
+            target = candidates[max(longer, key=lambda other: candidates[other]["calls"])]
+            merged = candidates.pop(key)
+            target["shapes"].extend(merged["shapes"])
+            target["calls"] += merged["calls"]
+            target["reduction"] += merged["reduction"]
+
+    recommendations = [
+        {
+            "key": {field: direction for field, direction in key},
+            "calls": candidate["calls"],
+            "estimatedScanReduction": int(candidate["reduction"]),
+            "shapes": candidate["shapes"]
+        }
+        for key, candidate in candidates.items()
+    ]
+    recommendations.sort(key=lambda item: item["estimatedScanReduction"], reverse=True)
+    return recommendations
+
+
+def find_redundant_indexes(indexes: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """다른 인덱스 키의 접두와 같아 대체 가능한 인덱스"""
+    redundant = []
+    for name, info in indexes.items():
+        key = list(info.get("key", []))
+        if name == "_id_" or any(option in info for option in SPECIAL_INDEX_OPTIONS):
+            continue
+        for other_name, other in indexes.items():
+            other_key = list(other.get("key", []))
+            if other_name == name or len(other_key) <= len(key):
+                continue
+            if other.get("partialFilterExpression") or other.get("sparse") or other.get("hidden"):
+                continue
+            if other_key[:len(key)] == key:
+                redundant.append({
+                    "name": name,
+                    "key": {field: direction for field, direction in key},
+                    "coveredBy": other_name
+                })
+                break
+    return redundant
+
+
+class IndexAdvisorTool(BaseTool):
+    """쿼리 형태 기록 기반 인덱스 추천 도구"""
+
+    @property
+    def name(self) -> str:
+        return "indexAdvisor"
+
+    @property
+    def description(self) -> str:
+        return ("Recommend compound indexes for the filter and sort shapes recently sent to find/aggregate "
+                "on a collection, and flag unused or redundant indexes")
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "collection": {
+                    "type": "string",
+                    "description": "Name of the collection to analyze"
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Maximum number of index recommendations",
+                    "default": DEFAULT_RECOMMENDATIONS,
+                    "minimum": 1,
+                    "maximum": MAX_RECOMMENDATIONS
+                },
+                "indexStats": {
+                    "type": "boolean",
+                    "description": "Read $indexStats to report indexes that have not been used since the "
+                                   "server started",
+                    "default": True
+                },
+                **TARGET_PROPERTIES
+            },
+            "required": ["collection"]
+        }
+
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            db = self.get_database(params)
+            collection = self.validate_collection(params.get("collection"))
+            limit = max(1, min(int(params.get("limit", DEFAULT_RECOMMENDATIONS)), MAX_RECOMMENDATIONS))
+
+            indexes = await db[collection].index_information()
+            estimated = await db[collection].estimated_document_count()
+            shapes = query_shapes.shapes(database_key(db), collection)
+
+            result: Dict[str, Any] = {
+                "collection": collection,
+                "estimatedDocuments": estimated,
+                "queryShapes": len(shapes),
+                "recommendations": recommend_indexes(shapes, indexes, estimated)[:limit],
+                "redundantIndexes": find_redundant_indexes(indexes)
+            }
+
+            if params.get("indexStats", True):
+                try:
+                    result["unusedIndexes"] = await self._unused_indexes(db[collection])
+                except Exception as error:
+                    # $indexStats 권한이 없거나 지원하지 않는 배포
+                    result["indexStatsError"] = str(error)
+
+            return self.json_response(result)
+        except Exception as error:
+            return self.handle_error(error)
+
+    async def _unused_indexes(self, collection) -> List[Dict[str, Any]]:
+        """서버 시작 이후 한 번도 사용되지 않은 인덱스"""
+        unused = []
+        async for stats in collection.aggregate([{"$indexStats": {}}]):
+            accesses = stats.get("accesses", {})
+            if stats.get("name") != "_id_" and accesses.get("ops", 0) == 0:
+                unused.append({
+                    "name": stats.get("name"),
+                    "key": stats.get("key"),
+                    "host": stats.get("host"),
+                    "since": accesses.get("since")
+                })
+        return unused
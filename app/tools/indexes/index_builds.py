@@ -0,0 +1,68 @@
+from typing import Dict, Any
+
+from .builds import STATUS_BUILDING, index_builds
+from ..base.tool import BaseTool, TARGET_PROPERTIES
+from ...mongodb.client import database_key
+
+
+class IndexBuildsTool(BaseTool):
+    """인덱스 빌드 진행 상황 조회 도구"""
+
+    @property
+    def name(self) -> str:
+        return "indexBuilds"
+
+    @property
+    def description(self) -> str:
+        return ("Show the status and progress of index builds started with createIndex wait=false, "
+                "and of any other index builds currently running on the server")
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "collection": {
+                    "type": "string",
+                    "description": "Only show builds on this collection"
+                },
+                "buildId": {
+                    "type": "string",
+                    "description": "Only show the build with this id"
+                },
+                **TARGET_PROPERTIES
+            }
+        }
+
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            db = self.get_database(params)
+            collection = params.get("collection")
+            if collection is not None:
+                collection = self.validate_collection(collection)
+
+            if params.get("buildId"):
+                build = index_builds.get(params["buildId"])
+                if build is None:
+                    raise ValueError(f"Unknown index build: {params['buildId']}")
+                builds = [build]
+            else:
+                builds = index_builds.list(database_key(db), collection)
+
+            tracked = [build.to_dict() for build in builds]
+            result: Dict[str, Any] = {"builds": tracked}
+
+            try:
+                server_builds = await index_builds.server_builds(db, collection)
+            except Exception as error:
+                # currentOp 권한(inprog)이 없는 경우에도 추적 중인 빌드 상태는 반환
+                result["currentOpError"] = str(error)
+            else:
+                for build in tracked:
+                    if build["status"] == STATUS_BUILDING:
+                        index_builds.attach_progress(build, server_builds)
+                result["serverBuilds"] = server_builds
+
+            return self.json_response(result)
+        except Exception as error:
+            return self.handle_error(error)
@@ -1,13 +1,17 @@
-import json
 from typing import Dict, Any
 
-from ..base.tool import BaseTool
-from ...mongodb.client import db
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import OperationFailure
+
+from ..base.tool import BaseTool, READ_OPTION_PROPERTIES, TARGET_PROPERTIES
+from ...mongodb.read_routing import read_command_batch
 
 
 class ListIndexesTool(BaseTool):
     """인덱스 목록 조회 도구"""
 
+    read_only = True
+
     @property
     def name(self) -> str:
         return "indexes"
@@ -24,7 +28,9 @@ class ListIndexesTool(BaseTool):
                 "collection": {
                     "type": "string",
                     "description": "Name of the collection to get indexes for"
-                }
+                },
+                **READ_OPTION_PROPERTIES,
+                **TARGET_PROPERTIES
             },
             "required": ["collection"]
         }
@@ -32,16 +38,24 @@ class ListIndexesTool(BaseTool):
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         try:
             collection = self.validate_collection(params.get("collection"))
-            indexes = await db[collection].index_information()
-
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps(indexes, default=str, indent=2)
-                    }
-                ],
-                "isError": False
-            }
+            db = self.get_database(params)
+            return await self.cached_response(db, collection, {}, lambda: self._list_indexes(db, collection))
         except Exception as error:
             return self.handle_error(error)
+
+    async def _list_indexes(self, db: AsyncIOMotorDatabase, collection: str) -> Dict[str, Any]:
+        """인덱스 정보 조회 (index_information과 같은 형식, 읽기 설정에 따라 세컨더리에서 조회)"""
+        try:
+            batch = await read_command_batch(db, {"listIndexes": collection})
+        except OperationFailure as error:
+            # 존재하지 않는 컬렉션은 드라이버와 같이 빈 목록으로 처리
+            if error.code != 26:
+                raise
+            batch = []
+
+        indexes = {}
+        for index in batch:
+            index["key"] = list(index["key"].items())
+            indexes[index.pop("name")] = index
+
+        return self.json_response(indexes)
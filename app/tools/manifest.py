@@ -0,0 +1,61 @@
+from typing import NamedTuple, Tuple
+
+
+class ToolSpec(NamedTuple):
+    """도구 매니페스트 항목 (도구 모듈을 임포트하지 않고 목록을 제공)"""
+
+    name: str
+    # app.tools 기준 모듈 경로
+    module: str
+    class_name: str
+    # CLI info 명령에 표시할 한 줄 설명
+    summary: str
+
+
+# 등록 순서대로 나열한 도구 목록
+TOOL_MANIFEST: Tuple[ToolSpec, ...] = (
+    ToolSpec("listCollections", "collection.list_collections", "ListCollectionsTool",
+             "List all collections in a database"),
+    ToolSpec("collectionSchema", "collection.collection_schema", "CollectionSchemaTool",
+             "Infer the schema of a collection"),
+    ToolSpec("databaseSchema", "collection.database_schema", "DatabaseSchemaTool",
+             "Infer the schemas of all collections concurrently"),
+    ToolSpec("find", "documents.find", "FindTool",
+             "Query documents in a collection"),
+    ToolSpec("aggregate", "documents.aggregate", "AggregateTool",
+             "Run an aggregation pipeline on a collection"),
+    ToolSpec("count", "documents.count", "CountTool",
+             "Count documents matching a filter on the server"),
+    ToolSpec("distinct", "documents.distinct", "DistinctTool",
+             "List the distinct values of a field"),
+    ToolSpec("countByField", "documents.count_by_field", "CountByFieldTool",
+             "Count documents per value of a field"),
+    ToolSpec("explain", "documents.explain", "ExplainTool",
+             "Show the query plan for a filter or pipeline"),
+    ToolSpec("watch", "documents.watch", "WatchTool",
+             "Tail collection changes with a change stream"),
+    ToolSpec("insertOne", "documents.insert_one", "InsertOneTool",
+             "Insert a single document into a collection"),
+    ToolSpec("updateOne", "documents.update_one", "UpdateOneTool",
+             "Update a single document in a collection"),
+    ToolSpec("deleteOne", "documents.delete_one", "DeleteOneTool",
+             "Delete a single document from a collection"),
+    ToolSpec("insertMany", "documents.insert_many", "InsertManyTool",
+             "Insert multiple documents in batches"),
+    ToolSpec("updateMany", "documents.update_many", "UpdateManyTool",
+             "Update all documents matching a filter"),
+    ToolSpec("deleteMany", "documents.delete_many", "DeleteManyTool",
+             "Delete all documents matching a filter"),
+    ToolSpec("bulkWrite", "documents.bulk_write", "BulkWriteTool",
+             "Execute mixed write operations in batches"),
+    ToolSpec("createIndex", "indexes.create_index", "CreateIndexTool",
+             "Create single-field, compound, partial, TTL, hidden or wildcard indexes"),
+    ToolSpec("dropIndex", "indexes.drop_index", "DropIndexTool",
+             "Drop an existing index from a collection"),
+    ToolSpec("indexBuilds", "indexes.index_builds", "IndexBuildsTool",
+             "Show the progress of running index builds"),
+    ToolSpec("indexes", "indexes.list_indexes", "ListIndexesTool",
+             "List all indexes for a collection"),
+    ToolSpec("indexAdvisor", "indexes.index_advisor", "IndexAdvisorTool",
+             "Recommend indexes from recent query shapes"),
+)
@@ -0,0 +1,237 @@
+import bisect
+import functools
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .base.tool import BaseTool
+from ..mongodb.monitoring import ToolCallTrace, command_stats, trace_tool_call
+
+# 히스토그램 버킷 상한
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+DOCUMENTS_BUCKETS = (0, 1, 10, 50, 100, 500, 1000)
+
+# 컬렉션 라벨 수가 상한을 넘으면 나머지를 묶는 라벨
+OTHER_COLLECTION = "_other"
+
+Labels = Tuple[str, str]
+
+
+class Histogram:
+    """누적 버킷 히스토그램"""
+
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def render(self, name: str, labels: str) -> List[str]:
+        """Prometheus 텍스트 형식 줄 목록"""
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{_format(bound)}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum{{{labels}}} {_format(self.total)}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+        return lines
+
+
+class ToolCallStats:
+    """도구/컬렉션별 호출 통계"""
+
+    __slots__ = ("calls", "errors", "documents", "commands", "latency", "server", "overhead",
+                 "response_bytes", "result_documents")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.documents = 0
+        self.commands = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        # 서버 명령 왕복 시간 / 그 외(커넥션 대기 제외, 직렬화 등 Python 처리) 시간
+        self.server = Histogram(LATENCY_BUCKETS)
+        self.overhead = Histogram(LATENCY_BUCKETS)
+        self.response_bytes = Histogram(BYTES_BUCKETS)
+        self.result_documents = Histogram(DOCUMENTS_BUCKETS)
+
+
+def _format(value: float) -> str:
+    """숫자를 정밀도 손실 없이 출력"""
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """라벨 값 이스케이프"""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _response_size(response: Dict[str, Any]) -> int:
+    """직렬화된 응답 텍스트 크기 (바이트)"""
+    return sum(len(item.get("text", "").encode("utf-8")) for item in response.get("content", ()))
+
+
+class ToolMetrics:
+    """도구 실행 지연 시간, 결과 크기, 오류율 수집 및 Prometheus 형식 출력"""
+
+    def __init__(self, max_collections: int = 200):
+        self.max_collections = max_collections
+        self._stats: Dict[Labels, ToolCallStats] = {}
+        self._collections: Dict[str, set] = {}
+
+    @classmethod
+    def from_env(cls) -> "ToolMetrics":
+        """환경 변수로부터 생성"""
+        return cls(max_collections=int(os.getenv("MCP_METRICS_MAX_COLLECTIONS", "200")))
+
+    def _collection_label(self, tool: str, collection: Any) -> str:
+        """컬렉션 라벨 결정 (도구별 라벨 수 제한)"""
+        if not isinstance(collection, str):
+            return ""
+        seen = self._collections.setdefault(tool, set())
+        if collection in seen:
+            return collection
+        if len(seen) >= self.max_collections:
+            return OTHER_COLLECTION
+        seen.add(collection)
+        return collection
+
+    def record(self, tool: str, collection: Any, duration: float, response: Optional[Dict[str, Any]],
+               trace: Optional[ToolCallTrace] = None):
+        """도구 호출 한 건 기록 (response가 None이면 예외로 종료된 호출)"""
+        labels = (tool, self._collection_label(tool, collection))
+        stats = self._stats.get(labels)
+        if stats is None:
+            stats = self._stats[labels] = ToolCallStats()
+
+        stats.calls += 1
+        stats.latency.observe(duration)
+        if trace is not None:
+            server = trace.server_ms / 1000
+            stats.commands += trace.commands
+            stats.server.observe(server)
+            stats.overhead.observe(max(0.0, duration - server - trace.pool_wait_ms / 1000))
+        if response is None or response.get("isError"):
+            stats.errors += 1
+        if response is None:
+            return
+
+        stats.response_bytes.observe(_response_size(response))
+        documents = (response.get("_meta") or {}).get("documentCount")
+        if documents is not None:
+            stats.documents += documents
+            stats.result_documents.observe(documents)
+
+    def instrument(self, tool: BaseTool,
+                   execute: Optional[Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]] = None
+                   ) -> Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]:
+        """도구 실행 함수를 계측 함수로 감싸서 반환 (시그니처 유지)"""
+        execute = execute or tool.execute
+
+        @functools.wraps(tool.execute)
+        async def instrumented(params: Dict[str, Any]) -> Dict[str, Any]:
+            collection = params.get("collection") if isinstance(params, dict) else None
+            response = None
+            with trace_tool_call(tool.name, collection if isinstance(collection, str) else None) as trace:
+                started = time.perf_counter()
+                try:
+                    response = await execute(params)
+                    return response
+                finally:
+                    duration = time.perf_counter() - started
+                    self.record(tool.name, collection, duration, response, trace)
+                    if 0 < command_stats.slow_ms <= duration * 1000:
+                        command_stats.record_slow_call(trace, duration * 1000)
+
+        return instrumented
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식으로 출력"""
+        lines = [
+            "# HELP mcp_tool_calls_total Tool calls by tool and collection.",
+            "# TYPE mcp_tool_calls_total counter",
+        ]
+        items = sorted(self._stats.items())
+        label_text = {key: f'tool="{_escape(key[0])}",collection="{_escape(key[1])}"' for key, _ in items}
+
+        for key, stats in items:
+            lines.append(f"mcp_tool_calls_total{{{label_text[key]}}} {stats.calls}")
+
+        lines.append("# HELP mcp_tool_errors_total Tool calls that returned an error or raised.")
+        lines.append("# TYPE mcp_tool_errors_total counter")
+        for key, stats in items:
+            lines.append(f"mcp_tool_errors_total{{{label_text[key]}}} {stats.errors}")
+
+        lines.append("# HELP mcp_tool_commands_total MongoDB commands issued by tool calls.")
+        lines.append("# TYPE mcp_tool_commands_total counter")
+        for key, stats in items:
+            lines.append(f"mcp_tool_commands_total{{{label_text[key]}}} {stats.commands}")
+
+        lines.append("# HELP mcp_tool_result_documents_total Documents returned by tool calls.")
+        lines.append("# TYPE mcp_tool_result_documents_total counter")
+        for key, stats in items:
+            lines.append(f"mcp_tool_result_documents_total{{{label_text[key]}}} {stats.documents}")
+
+        for name, attribute, help_text in (
+                ("mcp_tool_duration_seconds", "latency", "Tool execution latency in seconds."),
+                ("mcp_tool_server_seconds", "server", "MongoDB command round-trip time per tool call."),
+                ("mcp_tool_overhead_seconds", "overhead",
+                 "Time per tool call spent outside MongoDB commands and pool waits (serialization etc.)."),
+                ("mcp_tool_response_bytes", "response_bytes", "Serialized tool response size in bytes."),
+                ("mcp_tool_result_documents", "result_documents", "Documents returned per tool call."),
+        ):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for key, stats in items:
+                histogram = getattr(stats, attribute)
+                if histogram.count:
+                    lines.extend(histogram.render(name, label_text[key]))
+
+        return "\n".join(lines) + "\n"
+
+
+def render_gauges(prefix: str, values: Dict[str, Any]) -> str:
+    """중첩된 통계 사전의 숫자 값을 Prometheus 게이지로 출력"""
+    lines: List[str] = []
+
+    def walk(name: str, value: Any):
+        if isinstance(value, bool):
+            value = int(value)
+        if isinstance(value, (int, float)):
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {_format(value)}")
+        elif isinstance(value, dict):
+            for key, child in value.items():
+                walk(f"{name}_{_metric_name(str(key))}", child)
+
+    walk(prefix, values)
+    return "\n".join(lines) + ("\n" if lines else "")
+
+
+def _metric_name(key: str) -> str:
+    """camelCase 키를 snake_case 메트릭 이름으로 변환"""
+    name = []
+    for char in key:
+        if char.isupper():
+            name.append("_" + char.lower())
+        elif char.isalnum():
+            name.append(char)
+        else:
+            name.append("_")
+    return "".join(name).strip("_")
+
+
+# 전역 도구 메트릭
+tool_metrics = ToolMetrics.from_env()
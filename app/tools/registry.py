@@ -1,44 +1,41 @@
-from typing import Dict, List, Optional, Any
+import importlib
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple
 
-from .base.tool import BaseTool
-from .collection.list_collections import ListCollectionsTool
-from .documents.delete_one import DeleteOneTool
-from .documents.find import FindTool
-from .documents.insert_one import InsertOneTool
-from .documents.update_one import UpdateOneTool
-from .indexes.create_index import CreateIndexTool
-from .indexes.drop_index import DropIndexTool
-from .indexes.list_indexes import ListIndexesTool
+from .manifest import TOOL_MANIFEST, ToolSpec
+
+if TYPE_CHECKING:
+    from .base.tool import BaseTool
+
+
+def load_tool(spec: ToolSpec) -> "BaseTool":
+    """매니페스트 항목의 도구 모듈을 임포트하여 인스턴스 생성"""
+    module = importlib.import_module(f"{__package__}.{spec.module}")
+    tool = getattr(module, spec.class_name)()
+    if tool.name != spec.name:
+        raise RuntimeError(f"Tool manifest entry {spec.name} loaded a tool named {tool.name}")
+    return tool
 
 
 class ToolRegistry:
-    """도구 레지스트리"""
-
-    def __init__(self):
-        self.tools: Dict[str, BaseTool] = {}
-
-        # 도구 등록
-        self.register_tool(ListCollectionsTool())
-        self.register_tool(FindTool())
-        self.register_tool(InsertOneTool())
-        self.register_tool(UpdateOneTool())
-        self.register_tool(DeleteOneTool())
-        self.register_tool(CreateIndexTool())
-        self.register_tool(DropIndexTool())
-        self.register_tool(ListIndexesTool())
-
-    def register_tool(self, tool: BaseTool):
+    """도구 레지스트리 (매니페스트에 나열된 도구를 등록)"""
+
+    def __init__(self, manifest: Tuple[ToolSpec, ...] = TOOL_MANIFEST):
+        self.tools: Dict[str, "BaseTool"] = {}
+        for spec in manifest:
+            self.register_tool(load_tool(spec))
+
+    def register_tool(self, tool: "BaseTool"):
         """도구 등록"""
         self.tools[tool.name] = tool
 
-    def get_tool(self, name: str) -> Optional[BaseTool]:
+    def get_tool(self, name: str) -> Optional["BaseTool"]:
         """이름으로 도구 조회"""
         tool = self.tools.get(name)
         if not tool:
             raise ValueError(f"Unknown tool: {name}")
         return tool
 
-    def get_all_tools(self) -> List[BaseTool]:
+    def get_all_tools(self) -> List["BaseTool"]:
         """모든 도구 목록 반환"""
         return list(self.tools.values())
 
@@ -0,0 +1,230 @@
+import asyncio
+import contextvars
+import functools
+import os
+import time
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from .base.tool import BaseTool
+
+# 현재 요청의 MCP 세션 ID (/messages 엔드포인트 등에서 설정)
+current_session: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("current_session", default=None)
+
+
+def _parse_priorities(value: str) -> Dict[str, int]:
+    """'createIndex=2,find=0' 형식의 도구별 우선순위 설정 해석"""
+    priorities: Dict[str, int] = {}
+    for item in value.split(","):
+        if "=" not in item:
+            continue
+        name, priority = item.split("=", 1)
+        priorities[name.strip()] = int(priority)
+    return priorities
+
+
+def resolve_session_id() -> str:
+    """현재 호출의 세션 식별자 결정"""
+    session_id = current_session.get()
+    if session_id:
+        return session_id
+    try:
+        from fastmcp.server.dependencies import get_http_request
+
+        request = get_http_request()
+        session_id = request.headers.get("mcp-session-id") or request.query_params.get("sessionId")
+        if session_id:
+            return session_id
+        if request.client:
+            return request.client.host
+    except Exception:
+        pass
+    return "default"
+
+
+class _Waiter:
+    """대기 중인 도구 호출"""
+
+    __slots__ = ("future", "session_id", "priority", "enqueued_at")
+
+    def __init__(self, future: asyncio.Future, session_id: str, priority: int):
+        self.future = future
+        self.session_id = session_id
+        self.priority = priority
+        self.enqueued_at = time.perf_counter()
+
+
+class ToolScheduler:
+    """도구 실행 동시성 제한 및 세션별 공정 대기열 스케줄러
+
+    전역 동시 실행 수를 제한하고, 슬롯이 비면 우선순위가 가장 높은(값이 낮은) 등급에서
+    세션을 라운드 로빈으로 돌며 한 건씩 실행을 허가
+    """
+
+    def __init__(self, max_concurrency: int = 32, queue_timeout: float = 60.0,
+                 priority_overrides: Optional[Dict[str, int]] = None, window: int = 1024):
+        self.max_concurrency = max(1, max_concurrency)
+        self.queue_timeout = queue_timeout
+        self.priority_overrides = priority_overrides or {}
+        self.active = 0
+        # 우선순위 -> (세션 -> 대기열), 세션 순서가 라운드 로빈 순서
+        self._queues: Dict[int, "OrderedDict[str, Deque[_Waiter]]"] = {}
+        self._waits_ms: Deque[float] = deque(maxlen=window)
+        self.queued = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.timeouts = 0
+        self.max_wait_ms = 0.0
+
+    @classmethod
+    def from_env(cls) -> "ToolScheduler":
+        """환경 변수로부터 스케줄러 생성"""
+        return cls(
+            max_concurrency=int(os.getenv("MCP_MAX_CONCURRENT_TOOLS", "32")),
+            queue_timeout=float(os.getenv("MCP_SCHEDULER_QUEUE_TIMEOUT", "60")),
+            priority_overrides=_parse_priorities(os.getenv("MCP_TOOL_PRIORITIES", "")),
+        )
+
+    def priority_for(self, tool: BaseTool, params: Optional[Dict[str, Any]] = None) -> int:
+        """도구 우선순위 (설정값이 호출별 도구 우선순위보다 우선)"""
+        if tool.name in self.priority_overrides:
+            return self.priority_overrides[tool.name]
+        return tool.call_priority(params or {})
+
+    async def run(self, tool: BaseTool, call: Callable[[], Awaitable[Dict[str, Any]]],
+                  params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """실행 슬롯을 얻은 뒤 도구 호출"""
+        try:
+            await self._acquire(resolve_session_id(), self.priority_for(tool, params))
+        except asyncio.TimeoutError:
+            return tool.handle_error(RuntimeError(
+                f"Server busy: '{tool.name}' waited more than {self.queue_timeout:g}s for an execution slot"
+            ))
+        try:
+            return await call()
+        finally:
+            self.completed += 1
+            self._release()
+
+    def wrap(self, tool: BaseTool,
+             execute: Optional[Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]] = None
+             ) -> Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]:
+        """도구 실행 함수를 스케줄러를 거치도록 감싼 함수 반환 (시그니처 유지)"""
+        execute = execute or tool.execute
+
+        @functools.wraps(tool.execute)
+        async def scheduled(params: Dict[str, Any]) -> Dict[str, Any]:
+            return await self.run(tool, lambda: execute(params), params)
+
+        return scheduled
+
+    async def _acquire(self, session_id: str, priority: int):
+        """실행 슬롯 획득 (대기 없이 가능하면 즉시 반환)"""
+        if self.active < self.max_concurrency and self.queued == 0:
+            self.active += 1
+            self._record_wait(0.0)
+            return
+
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), session_id, priority)
+        sessions = self._queues.setdefault(priority, OrderedDict())
+        sessions.setdefault(session_id, deque()).append(waiter)
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+
+        try:
+            if self.queue_timeout > 0:
+                await asyncio.wait_for(asyncio.shield(waiter.future), timeout=self.queue_timeout)
+            else:
+                await waiter.future
+        except (asyncio.CancelledError, asyncio.TimeoutError) as error:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # 슬롯을 받은 직후 취소된 경우 반납
+                self._release()
+            else:
+                waiter.future.cancel()
+                self._remove(waiter)
+            if isinstance(error, asyncio.TimeoutError):
+                self.timeouts += 1
+            raise
+
+    def _release(self):
+        """슬롯 반납 후 다음 대기자 실행 허가"""
+        self.active -= 1
+        while self.active < self.max_concurrency and self.queued > 0:
+            waiter = self._next_waiter()
+            if waiter is None:
+                break
+            self.active += 1
+            self._record_wait((time.perf_counter() - waiter.enqueued_at) * 1000)
+            waiter.future.set_result(None)
+
+    def _next_waiter(self) -> Optional[_Waiter]:
+        """가장 높은 우선순위 등급에서 라운드 로빈으로 다음 대기자 선택"""
+        for priority in sorted(self._queues):
+            sessions = self._queues[priority]
+            while sessions:
+                session_id, waiters = next(iter(sessions.items()))
+                waiter = waiters.popleft()
+                if waiters:
+                    sessions.move_to_end(session_id)
+                else:
+                    del sessions[session_id]
+                if not sessions:
+                    del self._queues[priority]
+                self.queued -= 1
+                if not waiter.future.done():
+                    return waiter
+        return None
+
+    def _remove(self, waiter: _Waiter):
+        """취소되거나 시간 초과된 대기자를 대기열에서 제거"""
+        sessions = self._queues.get(waiter.priority)
+        if not sessions:
+            return
+        waiters = sessions.get(waiter.session_id)
+        if waiters is None or waiter not in waiters:
+            return
+        waiters.remove(waiter)
+        self.queued -= 1
+        if not waiters:
+            del sessions[waiter.session_id]
+        if not sessions:
+            del self._queues[waiter.priority]
+
+    def _record_wait(self, wait_ms: float):
+        self._waits_ms.append(wait_ms)
+        if wait_ms > self.max_wait_ms:
+            self.max_wait_ms = wait_ms
+
+    def queue_depths(self) -> Dict[int, int]:
+        """우선순위별 대기 건수"""
+        return {
+            priority: sum(len(waiters) for waiters in sessions.values())
+            for priority, sessions in self._queues.items()
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """스케줄러 통계 반환"""
+        waits = sorted(self._waits_ms)
+        stats = {
+            "maxConcurrency": self.max_concurrency,
+            "active": self.active,
+            "queued": self.queued,
+            "queuedByPriority": {str(k): v for k, v in sorted(self.queue_depths().items())},
+            "queuedSessions": len({s for sessions in self._queues.values() for s in sessions}),
+            "maxQueued": self.max_queued,
+            "completed": self.completed,
+            "timeouts": self.timeouts,
+            "maxWaitMs": round(self.max_wait_ms, 3),
+        }
+        if waits:
+            stats["waitMs"] = {
+                "avg": round(sum(waits) / len(waits), 3),
+                "p50": round(waits[len(waits) // 2], 3),
+                "p95": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))], 3),
+            }
+        return stats
+
+
+# 전역 도구 스케줄러
+tool_scheduler = ToolScheduler.from_env()
@@ -0,0 +1,100 @@
+"""도구 응답 직렬화 벤치마크
+
+1000개 문서 결과에 대해 기존 방식(ObjectId 문자열 변환 후 json.dumps(default=str, indent=2))과
+공용 응답 인코더(encode_json)의 들여쓰기/압축/relaxed 모드 성능 및 출력 크기를 비교합니다.
+원시 BSON 경로는 서버 응답 바이트의 디코딩 비용까지 포함하여 dict 디코딩 + 인코딩과 비교합니다.
+
+실행: python -m benchmarks.response_encoding [--docs 1000] [--rounds 20]
+"""
+import argparse
+import datetime
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+import bson
+from bson import Decimal128, ObjectId
+
+from app.tools.base import encoder
+from app.tools.base.encoder import encode_json, encode_raw_document, join_json_array, raw_codec_options
+
+
+def make_documents(count: int) -> List[Dict[str, Any]]:
+    """ObjectId, datetime, Decimal128을 포함한 주문 형태의 문서 생성"""
+    base = datetime.datetime(2024, 1, 1)
+    return [
+        {
+            "_id": ObjectId(),
+            "userId": ObjectId(),
+            "orderDate": base + datetime.timedelta(minutes=i),
+            "status": "completed" if i % 3 else "processing",
+            "totalAmount": Decimal128(f"{i * 1.25:.2f}"),
+            "items": [
+                {"productSku": f"SKU{i:05d}", "quantity": i % 4 + 1, "priceAtTime": Decimal128("49.99")},
+                {"productSku": f"SKU{i + 1:05d}", "quantity": 1, "priceAtTime": Decimal128("699.99")},
+            ],
+            "shippingAddress": {"street": f"{i} Main St", "city": "New York", "country": "USA"},
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_encode(docs: List[Dict[str, Any]]) -> str:
+    """기존 FindTool 경로 재현"""
+    docs = [dict(doc) for doc in docs]
+    for doc in docs:
+        if "_id" in doc and hasattr(doc["_id"], "__str__"):
+            doc["_id"] = str(doc["_id"])
+    return json.dumps(docs, default=str, indent=2)
+
+
+def measure(name: str, fn: Callable[[List[Dict[str, Any]]], str], docs: List[Dict[str, Any]], rounds: int):
+    """평균 소요 시간과 출력 크기 출력"""
+    output = fn(docs)  # 예열
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(docs)
+    elapsed = (time.perf_counter() - start) / rounds
+    print(f"  {name:<22} {elapsed * 1000:>9.2f} ms  {len(output):>10,} bytes")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tool response encoding benchmark")
+    parser.add_argument("--docs", type=int, default=1000, help="documents per result")
+    parser.add_argument("--rounds", type=int, default=20, help="timed runs per case")
+    args = parser.parse_args()
+
+    docs = make_documents(args.docs)
+    print(f"{args.docs} documents (orjson {'enabled' if encoder.orjson is not None else 'not installed'})")
+    baseline = measure("legacy json.dumps", legacy_encode, docs, args.rounds)
+    cases = {
+        "encoder indent": lambda d: encode_json(d, compact=False),
+        "encoder compact": lambda d: encode_json(d, compact=True),
+        "encoder relaxed compact": lambda d: encode_json(d, compact=True, mode=encoder.MODE_RELAXED),
+    }
+    for name, fn in cases.items():
+        elapsed = measure(name, fn, docs, args.rounds)
+        print(f"  {'':<22} {baseline / elapsed:>9.2f}x vs legacy")
+
+    # 서버 응답 바이트부터 JSON까지 (디코딩 포함)
+    payload = b"".join(bson.encode(doc) for doc in docs)
+    raw_options = raw_codec_options(bson.DEFAULT_CODEC_OPTIONS)
+    print(f"raw BSON -> JSON (python-bsonjs {'enabled' if encoder.bsonjs is not None else 'not installed'})")
+    decoded = measure(
+        "decode + encoder",
+        lambda _: encode_json(bson.decode_all(payload), compact=True, mode=encoder.MODE_RELAXED),
+        docs, args.rounds
+    )
+    raw = measure(
+        "RawBSONDocument",
+        lambda _: join_json_array(
+            [encode_raw_document(doc) for doc in bson.decode_all(payload, raw_options)], compact=True
+        ),
+        docs, args.rounds
+    )
+    print(f"  {'':<22} {decoded / raw:>9.2f}x vs decode + encoder")
+
+
+if __name__ == "__main__":
+    main()
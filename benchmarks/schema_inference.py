@@ -0,0 +1,114 @@
+"""스키마 추론 처리량 벤치마크
+
+넓은 문서(500개 이상 필드)와 깊게 중첩된 문서에 대해
+기존 방식(문서당 infer_schema_from_document 두 번 + 선형 탐색)과
+단일 패스 SchemaAccumulator의 처리량을 비교합니다.
+
+실행: python -m benchmarks.schema_inference [--docs 200] [--width 600] [--depth 40]
+"""
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from app.mongodb.schema import MongoFieldSchema, SchemaAccumulator, infer_schema_from_document
+
+
+def make_wide_document(width: int, seed: int) -> Dict[str, Any]:
+    """width개의 최상위 필드를 가진 문서 생성"""
+    doc: Dict[str, Any] = {"_id": seed}
+    for i in range(width):
+        kind = (i + seed) % 5
+        if kind == 0:
+            doc[f"f{i}"] = i
+        elif kind == 1:
+            doc[f"f{i}"] = f"value-{i}"
+        elif kind == 2:
+            doc[f"f{i}"] = i * 0.5
+        elif kind == 3:
+            doc[f"f{i}"] = {"a": i, "b": [i, i + 1]}
+        else:
+            doc[f"f{i}"] = [{"k": i, "v": str(i)}]
+    return doc
+
+
+def make_deep_document(depth: int, seed: int) -> Dict[str, Any]:
+    """depth 단계로 중첩된 문서 생성"""
+    doc: Dict[str, Any] = {"leaf": seed, "tags": ["x", "y"]}
+    for level in range(depth):
+        doc = {f"n{level}": doc, "items": [{"level": level, "seed": seed}], "id": level}
+    doc["_id"] = seed
+    return doc
+
+
+def legacy_build(docs: List[Dict[str, Any]]) -> List[MongoFieldSchema]:
+    """기존 build_collection_schema의 추론 루프 재현"""
+    field_schemas: Dict[str, set] = {}
+    required_fields: set = set()
+
+    for doc in docs:
+        for field in infer_schema_from_document(doc):
+            field_schemas.setdefault(field.field, set()).add(field.type)
+            required_fields.add(field.field)
+
+    for doc in docs:
+        doc_fields = set(doc.keys())
+        for field in list(required_fields):
+            if field.split(".")[0] not in doc_fields:
+                required_fields.remove(field)
+
+    fields = [
+        MongoFieldSchema(field, "|".join(types), field in required_fields)
+        for field, types in field_schemas.items()
+    ]
+
+    for doc in docs:
+        for field_schema in infer_schema_from_document(doc):
+            if field_schema.sub_fields:
+                existing = next((f for f in fields if f.field == field_schema.field), None)
+                if existing and not existing.sub_fields:
+                    existing.sub_fields = field_schema.sub_fields
+    return fields
+
+
+def accumulator_build(docs: List[Dict[str, Any]]) -> List[MongoFieldSchema]:
+    """단일 패스 누적기 사용"""
+    accumulator = SchemaAccumulator()
+    for doc in docs:
+        accumulator.add_document(doc)
+    return accumulator.build_fields()
+
+
+def measure(name: str, fn: Callable[[List[Dict[str, Any]]], Any], docs: List[Dict[str, Any]], rounds: int) -> float:
+    """평균 처리량(docs/s) 측정 및 출력"""
+    fn(docs)  # 예열
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(docs)
+    elapsed = time.perf_counter() - start
+    throughput = len(docs) * rounds / elapsed
+    print(f"  {name:<12} {throughput:>12,.0f} docs/s  ({elapsed / rounds * 1000:.2f} ms/run)")
+    return throughput
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Schema inference throughput benchmark")
+    parser.add_argument("--docs", type=int, default=200, help="documents per run")
+    parser.add_argument("--width", type=int, default=600, help="top-level fields in wide documents")
+    parser.add_argument("--depth", type=int, default=40, help="nesting depth of deep documents")
+    parser.add_argument("--rounds", type=int, default=5, help="timed runs per case")
+    args = parser.parse_args()
+
+    cases = {
+        f"wide ({args.width} fields)": [make_wide_document(args.width, i) for i in range(args.docs)],
+        f"deep ({args.depth} levels)": [make_deep_document(args.depth, i) for i in range(args.docs)],
+    }
+
+    for title, docs in cases.items():
+        print(title)
+        legacy = measure("legacy", legacy_build, docs, args.rounds)
+        single = measure("accumulator", accumulator_build, docs, args.rounds)
+        print(f"  speedup      {single / legacy:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
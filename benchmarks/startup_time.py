@@ -0,0 +1,105 @@
+"""서버 콜드 스타트 시간 벤치마크
+
+uvicorn으로 서버 프로세스를 새로 띄워 다음 시간을 측정합니다.
+  - import: app.main 모듈 임포트 시간 (별도 프로세스)
+  - live: 프로세스 시작부터 /health/live가 200을 반환할 때까지 (포트 바인딩)
+  - ready: 프로세스 시작부터 /health/ready가 200을 반환할 때까지 (MongoDB 연결 확인 완료)
+기본 시작 방식과 빠른 시작(MCP_LAZY_STARTUP=true) 방식을 비교하며, MongoDB에 연결할 수 없으면
+기본 방식은 live에 도달하지 못하고 빠른 시작 방식은 ready 없이 live만 측정됩니다.
+
+실행: python -m benchmarks.startup_time [--mongodb-url mongodb://localhost:27017/admin] [--rounds 3]
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, List, Optional
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def status_code(url: str) -> Optional[int]:
+    """HTTP 상태 코드 반환 (연결 불가 시 None)"""
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            return response.status
+    except urllib.error.HTTPError as error:
+        return error.code
+    except OSError:
+        return None
+
+
+def measure_import(env: Dict[str, str]) -> float:
+    """별도 프로세스에서 app.main 임포트 시간 측정"""
+    code = "import time; start = time.perf_counter(); import app.main; print(time.perf_counter() - start)"
+    output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+def measure_startup(env: Dict[str, str], timeout: float) -> Dict[str, Optional[float]]:
+    """서버 프로세스를 띄워 live/ready 도달 시간 측정"""
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    result: Dict[str, Optional[float]] = {"live": None, "ready": None}
+    try:
+        while time.perf_counter() - start < timeout and process.poll() is None:
+            if result["live"] is None and status_code(f"{base}/health/live") == 200:
+                result["live"] = time.perf_counter() - start
+            if result["live"] is not None and status_code(f"{base}/health/ready") == 200:
+                result["ready"] = time.perf_counter() - start
+                break
+            time.sleep(0.02)
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+    return result
+
+
+def summarize(values: List[Optional[float]]) -> str:
+    reached = [value for value in values if value is not None]
+    if not reached:
+        return "     not reached"
+    text = f"{statistics.median(reached) * 1000:>9.0f} ms"
+    if len(reached) < len(values):
+        text += f" ({len(reached)}/{len(values)})"
+    return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Server cold start benchmark")
+    parser.add_argument("--mongodb-url", default=os.getenv("MONGODB_URL", "mongodb://localhost:27017/admin"))
+    parser.add_argument("--rounds", type=int, default=3, help="server starts per mode")
+    parser.add_argument("--timeout", type=float, default=45.0, help="seconds to wait for readiness per start")
+    args = parser.parse_args()
+
+    base_env = {**os.environ, "MONGODB_URL": args.mongodb_url}
+    imports = [measure_import(base_env) for _ in range(args.rounds)]
+    print(f"import app.main {statistics.median(imports) * 1000:>9.0f} ms (median of {args.rounds})")
+
+    for name, lazy in (("default", "false"), ("lazy", "true")):
+        env = {**base_env, "MCP_LAZY_STARTUP": lazy}
+        runs = [measure_startup(env, args.timeout) for _ in range(args.rounds)]
+        print(f"  {name:<8} live {summarize([run['live'] for run in runs])}"
+              f"   ready {summarize([run['ready'] for run in runs])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ from setuptools import setup, find_packages
 setup(
     name="mongo-mcp-server",
     version="0.1.0",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     install_requires=[
         "fastapi>=0.115.0",
         "fastmcp>=2.3.0",
@@ -12,6 +12,9 @@ setup(
         "python-dotenv>=1.0.0",
         "click>=8.1.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.9.0", "python-bsonjs>=0.3.0"],
+    },
     entry_points={
         "console_scripts": [
             "mongo-mcp-server=app.cli:main",  # CLI 명령어 이름 변경